@@ -2,22 +2,43 @@
 # Path: /inviter-app/backend/auth.py
 # Description: Authentication utilities and JWT token management
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+import asyncio
+import hashlib
 import os
-from dotenv import load_dotenv
+import time
 
-load_dotenv()
+from cache import TTLCache
+from config import env_int, settings
 
 # Security configuration
-SECRET_KEY = os.getenv("SECRET_KEY", "admin")
+SECRET_KEY = settings.secret_key
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30 * 24  # 30 days
+# Event streams authenticate in the URL, which ends up in access logs and browser
+# history, so they get their own short-lived token that opens nothing else
+STREAM_TOKEN_EXPIRE_SECONDS = env_int("STREAM_TOKEN_EXPIRE_SECONDS", 60)
+STREAM_TOKEN_SCOPE = "events"
+TOKEN_CACHE_MAX_ENTRIES = env_int("TOKEN_CACHE_MAX_ENTRIES", 10000)
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing; hashes made with any other work factor are upgraded on login
+BCRYPT_ROUNDS = env_int("BCRYPT_ROUNDS", 12)
+PASSWORD_HASH_WORKERS = env_int("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1))
+PASSWORD_HASH_QUEUE_LIMIT = env_int("PASSWORD_HASH_QUEUE_LIMIT", 32)
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=BCRYPT_ROUNDS,
+    bcrypt__min_rounds=BCRYPT_ROUNDS,
+    bcrypt__max_rounds=BCRYPT_ROUNDS
+)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
@@ -27,6 +48,50 @@ def get_password_hash(password: str) -> str:
     """Generate password hash"""
     return pwd_context.hash(password)
 
+class HasherOverloaded(Exception):
+    """Raised when too many password hashes are already queued"""
+
+class PasswordHasher:
+    """
+    Runs bcrypt in a bounded thread pool so it never blocks the event loop
+    bcrypt releases the GIL, so threads hash in parallel. Once max_pending
+    operations are queued or running, new ones are rejected immediately
+    instead of piling up behind the pool. workers=0 hashes inline (for comparison).
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_pending: int = PASSWORD_HASH_QUEUE_LIMIT):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self.rejected = 0
+        self._executor = ThreadPoolExecutor(workers, thread_name_prefix="bcrypt") if workers else None
+
+    async def _run(self, fn, *args):
+        if self._executor is None:
+            return fn(*args)
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise HasherOverloaded()
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """Verify a password; also returns a new hash if the stored one uses an outdated work factor"""
+        return await self._run(pwd_context.verify_and_update, password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+password_hasher = PasswordHasher()
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Create JWT access token"""
     to_encode = data.copy()
@@ -39,13 +104,83 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-def verify_token(token: str) -> Optional[str]:
-    """Verify JWT token and return user_id"""
+def create_stream_token(subject: str) -> str:
+    """Create a token that only opens /events/stream, valid for STREAM_TOKEN_EXPIRE_SECONDS"""
+    return create_access_token(
+        {"sub": subject, "scope": STREAM_TOKEN_SCOPE},
+        expires_delta=timedelta(seconds=STREAM_TOKEN_EXPIRE_SECONDS)
+    )
+
+def decode_token(token: str) -> Optional[dict]:
+    """Fully verify a JWT token and return its claims"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            return None
-        return user_id
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+
+def verify_token(token: str) -> Optional[str]:
+    """Verify JWT token and return user_id"""
+    payload = decode_token(token)
+    if payload is None:
+        return None
+    return payload.get("sub")
+
+# Verified claims keyed by token digest; each entry lives until its token expires
+token_cache = TTLCache(
+    "verified_tokens", TOKEN_CACHE_MAX_ENTRIES, TOKEN_CACHE_MAX_ENTRIES * 512,
+    ttl=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+def verify_token_cached(token: str) -> Optional[dict]:
+    """Verify a JWT token, reusing claims from an earlier verification when possible"""
+    key = hashlib.sha256(token.encode()).digest()
+    claims = token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    claims = decode_token(token)
+    if claims is None:
+        return None  # Failures are not cached, so a bad token cannot evict good ones
+
+    remaining = claims.get("exp", 0) - time.time()
+    if remaining > 0:
+        token_cache.set(key, claims, ttl=remaining)
+    return claims
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+def _subject(token: Optional[str], scope: Optional[str] = None) -> str:
+    """
+    Verify a token and return its subject, raising 401 otherwise
+    Access tokens carry no scope; a scoped token is only accepted where that scope is asked for
+    """
+    if token is None:
+        raise HTTPException(
+            status_code=401, detail="Not authenticated", headers={"WWW-Authenticate": "Bearer"}
+        )
+
+    claims = verify_token_cached(token)
+    if claims is None or claims.get("sub") is None or claims.get("scope") != scope:
+        raise HTTPException(
+            status_code=401, detail="Invalid token", headers={"WWW-Authenticate": "Bearer"}
+        )
+    return claims["sub"]
+
+async def get_current_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme)
+) -> str:
+    """FastAPI dependency returning the subject of the request's Bearer token"""
+    return _subject(credentials.credentials if credentials else None)
+
+async def get_stream_user_id(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    stream_token: Optional[str] = None
+) -> str:
+    """
+    Like get_current_user_id, but also accepts a stream token as a query parameter
+    Browsers' EventSource cannot set headers, so event streams need the fallback.
+    Only tokens from create_stream_token are taken from the URL, never access tokens.
+    """
+    if credentials:
+        return _subject(credentials.credentials)
+    return _subject(stream_token, scope=STREAM_TOKEN_SCOPE)
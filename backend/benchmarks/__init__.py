@@ -0,0 +1,3 @@
+# File: backend/benchmarks/__init__.py
+# Path: /inviter-app/backend/benchmarks/__init__.py
+# Description: Offline benchmarks for backend hot paths (run from backend/ with python -m)
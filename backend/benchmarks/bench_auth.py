@@ -0,0 +1,46 @@
+# File: backend/benchmarks/bench_auth.py
+# Path: /inviter-app/backend/benchmarks/bench_auth.py
+# Description: Per-request cost of the auth dependency with and without the verified-token cache
+#
+# Usage: python -m benchmarks.bench_auth [--requests 20000] [--users 100]
+
+import argparse
+import asyncio
+import time
+
+from fastapi.security import HTTPAuthorizationCredentials
+
+from auth import create_access_token, decode_token, get_current_user_id, token_cache
+
+def main():
+    parser = argparse.ArgumentParser(description="Auth dependency microbenchmark")
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--users", type=int, default=100, help="Distinct tokens in rotation")
+    args = parser.parse_args()
+
+    tokens = [create_access_token({"sub": f"user{i}@example.com"}) for i in range(args.users)]
+    credentials = [HTTPAuthorizationCredentials(scheme="Bearer", credentials=t) for t in tokens]
+
+    start = time.perf_counter()
+    for i in range(args.requests):
+        assert decode_token(tokens[i % args.users]) is not None
+    uncached = (time.perf_counter() - start) / args.requests
+
+    async def run_dependency():
+        for i in range(args.requests):
+            await get_current_user_id(credentials[i % args.users])
+
+    token_cache.clear()
+    start = time.perf_counter()
+    asyncio.run(run_dependency())
+    cached = (time.perf_counter() - start) / args.requests
+
+    stats = token_cache.stats()
+    print(f"{args.requests} requests over {args.users} tokens\n")
+    print(f"{'path':<28}{'us/request':>12}")
+    print(f"{'jwt.decode every request':<28}{uncached * 1e6:>12.1f}")
+    print(f"{'cached dependency':<28}{cached * 1e6:>12.1f}")
+    print(f"\nspeedup {uncached / cached:.1f}x, cache hit rate {stats['hit_rate']:.2%}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# File: backend/benchmarks/bench_bulk_insert.py
+# Path: /inviter-app/backend/benchmarks/bench_bulk_insert.py
+# Description: Compares per-row ORM inserts with the set-based invitation persistence path
+#
+# Usage: python -m benchmarks.bench_bulk_insert [--recipients 1000] [--database-url postgresql://...]
+# Without --database-url a throwaway SQLite file is used.
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from crud import create_invitation_with_recipients, coerce_event_type
+from database import async_database_url
+from models import Base, Invitation, Response, User
+from schemas import InvitationCreate, RecipientInput
+from utils import generate_link_tokens
+
+def build_invitation(count: int) -> InvitationCreate:
+    # model_construct skips phone validation, which is not what is being measured here
+    return InvitationCreate.model_construct(
+        title="Benchmark", description=None, event_type="custom", event_date=None,
+        location=None, yes_text="Yes", no_text="No", template_style=None,
+        custom_fields=None, expires_at=None,
+        recipients=[
+            RecipientInput.model_construct(name=f"Guest {i}", phone=f"+1555{i:07d}")
+            for i in range(count)
+        ]
+    )
+
+async def orm_per_row(db, creator_id: int, invitation: InvitationCreate):
+    """The naive path: one ORM object and unit-of-work entry per recipient"""
+    inv = Invitation(
+        title=invitation.title, event_type=coerce_event_type(invitation.event_type),
+        yes_text=invitation.yes_text, no_text=invitation.no_text, creator_id=creator_id
+    )
+    db.add(inv)
+    await db.flush()
+    for recipient in invitation.recipients:
+        db.add(Response(
+            invitation_id=inv.id,
+            recipient_name=recipient.name,
+            recipient_phone=recipient.phone,
+            response_link=generate_link_tokens(1)[0]
+        ))
+    await db.commit()
+
+async def bulk(db, creator_id: int, invitation: InvitationCreate):
+    await create_invitation_with_recipients(db, creator_id, invitation)
+
+async def measure(session_factory, fn, invitation, repeat: int) -> list:
+    timings = []
+    for _ in range(repeat):
+        async with session_factory() as db:
+            start = time.perf_counter()
+            await fn(db, 1, invitation)
+            timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+async def run(args):
+    tmpdir = None
+    url = args.database_url
+    if url is None:
+        tmpdir = tempfile.TemporaryDirectory()
+        url = f"sqlite:///{os.path.join(tmpdir.name, 'bench.db')}"
+
+    engine = create_async_engine(async_database_url(url))
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    session_factory = async_sessionmaker(engine, autoflush=False)
+    async with session_factory() as db:
+        db.add(User(id=1, email="bench@example.com", name="Bench"))
+        await db.commit()
+
+    invitation = build_invitation(args.recipients)
+    print(f"{engine.dialect.name}: {args.recipients} recipients, {args.repeat} runs\n")
+    print(f"{'path':<16}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+    for name, fn in (("orm per row", orm_per_row), ("bulk insert", bulk)):
+        timings = await measure(session_factory, fn, invitation, args.repeat)
+        print(f"{name:<16}{statistics.median(timings):>12.1f}{min(timings):>10.1f}{max(timings):>10.1f}")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    await engine.dispose()
+    if tmpdir:
+        tmpdir.cleanup()
+
+def main():
+    parser = argparse.ArgumentParser(description="Invitation + recipient insert benchmark")
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
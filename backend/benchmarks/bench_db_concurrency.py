@@ -0,0 +1,118 @@
+# File: backend/benchmarks/bench_db_concurrency.py
+# Path: /inviter-app/backend/benchmarks/bench_db_concurrency.py
+# Description: Throughput, latency and pool wait time of DB-backed routes under many parallel clients
+#
+# Usage: python -m benchmarks.bench_db_concurrency [--clients 200] [--requests 20] [--pool-sizes 5,20]
+# Starts a real uvicorn server per pool size. /health is probed alongside the load
+# to show whether the event loop stays responsive while queries are in flight.
+
+import argparse
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from benchmarks.common import percentile
+
+PORT = 8766
+
+async def wait_ready(client: httpx.AsyncClient) -> None:
+    for _ in range(100):
+        try:
+            await client.get("/health")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+async def seed(client: httpx.AsyncClient, invitations: int) -> dict:
+    token = (await client.post("/auth/signup", json={
+        "email": "load@example.com", "name": "Load", "password": "benchmark"
+    })).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    for i in range(invitations):
+        await client.post("/invitations", headers=headers, json={
+            "title": f"Load {i}", "recipients": [{"name": "Guest", "phone": f"+1415555{i % 10000:04d}"}]
+        })
+    return headers
+
+async def load_client(client: httpx.AsyncClient, headers: dict, requests: int, latencies: list) -> None:
+    paths = ("/invitations?limit=20", "/analytics/dashboard")
+    for i in range(requests):
+        start = time.perf_counter()
+        response = await client.get(paths[i % len(paths)], headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/health")
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.01)
+
+async def run_load(args, pool_size: int, url: str) -> None:
+    env = {
+        **os.environ, "DATABASE_URL": url, "SMS_TRANSPORT": "fake", "BCRYPT_ROUNDS": "4",
+        "DB_POOL_SIZE": str(pool_size), "DB_MAX_OVERFLOW": "0", "REMINDER_INTERVAL_SECONDS": "0",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT), "--log-level", "warning"],
+        env=env
+    )
+    limits = httpx.Limits(max_connections=args.clients + 10, max_keepalive_connections=args.clients + 10)
+    try:
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{PORT}", limits=limits, timeout=120) as client:
+            await wait_ready(client)
+            headers = await seed(client, args.invitations)
+            before = (await client.get("/health")).json()["database"]
+
+            latencies, health = [], []
+            stop = asyncio.Event()
+            probe_task = asyncio.create_task(probe(client, stop, health))
+            start = time.perf_counter()
+            await asyncio.gather(*(
+                load_client(client, headers, args.requests, latencies) for _ in range(args.clients)
+            ))
+            elapsed = time.perf_counter() - start
+            stop.set()
+            await probe_task
+
+            after = (await client.get("/health")).json()["database"]
+            checkouts = after["checkouts"] - before["checkouts"]
+            wait = after["wait_seconds_total"] - before["wait_seconds_total"]
+            print(
+                f"{pool_size:>6}{len(latencies) / elapsed:>10.0f}"
+                f"{statistics.median(latencies):>9.1f}{percentile(latencies, 95):>9.1f}{percentile(latencies, 99):>9.1f}"
+                f"{(wait / checkouts * 1000) if checkouts else 0:>11.2f}{after['wait_seconds_max'] * 1000:>10.1f}"
+                f"{percentile(health, 95):>12.1f}"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+async def run(args) -> None:
+    print(f"{args.clients} clients x {args.requests} requests (invitation list + dashboard)\n")
+    print(f"{'pool':>6}{'req/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}"
+          f"{'wait avg':>11}{'wait max':>10}{'health p95':>12}")
+    for pool_size in args.pool_sizes:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            url = args.database_url or f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+            await run_load(args, pool_size, url)
+
+def main():
+    parser = argparse.ArgumentParser(description="Async database layer concurrency benchmark")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=20)
+    parser.add_argument("--invitations", type=int, default=100)
+    parser.add_argument("--pool-sizes", type=lambda v: [int(p) for p in v.split(",")], default=[5, 20])
+    parser.add_argument("--database-url", default=None)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
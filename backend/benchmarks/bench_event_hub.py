@@ -0,0 +1,62 @@
+# File: backend/benchmarks/bench_event_hub.py
+# Path: /inviter-app/backend/benchmarks/bench_event_hub.py
+# Description: Memory per idle SSE subscriber, fan-out latency and slow-consumer shedding
+#
+# Usage: python -m benchmarks.bench_event_hub [--subscribers 10000]
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+from events import EventHub, invitation_topic, user_topic
+
+async def drain(hub: EventHub, subscriber) -> int:
+    frames = 0
+    async for _ in hub.stream(subscriber):
+        frames += 1
+    return frames
+
+async def run(subscribers: int, events: int, queue_size: int):
+    hub = EventHub(queue_size=queue_size, heartbeat=3600)
+
+    # Idle streams: each one is a subscription plus a task suspended on its queue
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    subs = [hub.subscribe([user_topic(1), invitation_topic(i % 100)]) for i in range(subscribers)]
+    tasks = [asyncio.create_task(drain(hub, sub)) for sub in subs]
+    await asyncio.sleep(0)
+    per_subscriber = (tracemalloc.get_traced_memory()[0] - before) / subscribers
+    tracemalloc.stop()
+    print(f"{subscribers} idle subscribers: {per_subscriber / 1024:.2f} KB each")
+
+    # Fan-out: every subscriber listens on user:1
+    start = time.perf_counter()
+    for i in range(events):
+        hub.publish([user_topic(1)], "response", {"response_id": i, "answer": "yes"})
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    print(f"{events} events x {subscribers} subscribers: "
+          f"{elapsed / events * 1000:.2f} ms per publish, "
+          f"{events * subscribers / elapsed:,.0f} frames/s")
+
+    # Slow consumer: never read, so its queue fills and it gets dropped
+    slow = hub.subscribe([invitation_topic(-1)])
+    for i in range(queue_size + 1):
+        hub.publish([invitation_topic(-1)], "response", {"response_id": i})
+    print(f"slow consumer dropped after {queue_size + 1} events: {slow.dropped}")
+
+    await hub.stop()
+    await asyncio.gather(*tasks)
+    print(f"hub: {hub.stats()}")
+
+def main():
+    parser = argparse.ArgumentParser(description="SSE event hub benchmark")
+    parser.add_argument("--subscribers", type=int, default=10000)
+    parser.add_argument("--events", type=int, default=50)
+    parser.add_argument("--queue-size", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args.subscribers, args.events, args.queue_size))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# File: backend/benchmarks/bench_export.py
+# Path: /inviter-app/backend/benchmarks/bench_export.py
+# Description: Time-to-first-byte and server memory for streaming invitation exports
+#
+# Usage: python -m benchmarks.bench_export [--rows 100000]
+# Starts a real uvicorn server, since in-process test transports buffer whole responses.
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+from sqlalchemy import create_engine, insert
+
+from models import Response
+
+PORT = 8765
+
+def server_rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming export benchmark")
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = f"sqlite:///{os.path.join(tmpdir, 'bench.db')}"
+        env = {**os.environ, "DATABASE_URL": url, "SMS_TRANSPORT": "fake", "BCRYPT_ROUNDS": "4"}
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT), "--log-level", "warning"],
+            env=env
+        )
+        try:
+            base = f"http://127.0.0.1:{PORT}"
+            for _ in range(100):
+                try:
+                    httpx.get(f"{base}/health")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+
+            token = httpx.post(f"{base}/auth/signup", json={
+                "email": "export@example.com", "name": "Export", "password": "benchmark"
+            }).json()["access_token"]
+            headers = {"Authorization": f"Bearer {token}"}
+            invitation = httpx.post(f"{base}/invitations", headers=headers, json={
+                "title": "Export", "recipients": [{"name": "Guest", "phone": "+14155552671"}]
+            }).json()
+
+            engine = create_engine(url)
+            with engine.begin() as conn:
+                conn.execute(insert(Response), [
+                    {"invitation_id": invitation["id"], "recipient_name": f"Guest {i}",
+                     "recipient_phone": f"+1212{i:07d}", "response_link": f"bench{i:017d}"}
+                    for i in range(args.rows)
+                ])
+            engine.dispose()
+
+            print(f"{args.rows} responses\n")
+            print(f"{'format':<8}{'TTFB ms':>10}{'total s':>10}{'MB':>8}{'server RSS MB':>16}")
+            for fmt in ("csv", "ndjson"):
+                start = time.perf_counter()
+                ttfb, size, peak = None, 0, 0.0
+                with httpx.stream(
+                    "GET", f"{base}/invitations/{invitation['id']}/export?format={fmt}",
+                    headers=headers, timeout=60
+                ) as response:
+                    for chunk in response.iter_raw():
+                        if ttfb is None:
+                            ttfb = (time.perf_counter() - start) * 1000
+                        size += len(chunk)
+                        peak = max(peak, server_rss_mb(server.pid))
+                total = time.perf_counter() - start
+                print(f"{fmt:<8}{ttfb:>10.1f}{total:>10.2f}{size / 1e6:>8.1f}{peak:>16.1f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# File: backend/benchmarks/bench_link_tokens.py
+# Path: /inviter-app/backend/benchmarks/bench_link_tokens.py
+# Description: Size and lookup cost of stored response links, full URLs vs bare base62 tokens
+#
+# Usage: python -m benchmarks.bench_link_tokens [--rows 200000]
+
+import argparse
+import hashlib
+import os
+import random
+import secrets
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from utils import build_response_link, generate_link_tokens
+
+def legacy_links(count: int) -> list:
+    """The previous scheme: SHA-256 of a random token, truncated, stored as a full URL"""
+    return [
+        build_response_link(hashlib.sha256(f"1-+14155550000-{secrets.token_hex(16)}".encode()).hexdigest()[:20])
+        for _ in range(count)
+    ]
+
+def measure(path: str, column: str, links: list, lookups: int) -> tuple:
+    conn = sqlite3.connect(path)
+    conn.execute(f"CREATE TABLE responses (id INTEGER PRIMARY KEY, response_link {column} NOT NULL)")
+    conn.execute("CREATE UNIQUE INDEX ix_link ON responses (response_link)")
+    conn.executemany("INSERT INTO responses (response_link) VALUES (?)", ((link,) for link in links))
+    conn.commit()
+    index_bytes = conn.execute("SELECT SUM(pgsize) FROM dbstat WHERE name = 'ix_link'").fetchone()[0]
+
+    sample = random.sample(links, lookups)
+    timings = []
+    for link in sample:
+        start = time.perf_counter()
+        conn.execute("SELECT id FROM responses WHERE response_link = ?", (link,)).fetchone()
+        timings.append((time.perf_counter() - start) * 1e6)
+    conn.close()
+    return index_bytes, statistics.median(timings)
+
+def main():
+    parser = argparse.ArgumentParser(description="Response link token benchmark")
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    legacy = legacy_links(args.rows)
+    legacy_secs = time.perf_counter() - start
+    start = time.perf_counter()
+    tokens = generate_link_tokens(args.rows)
+    token_secs = time.perf_counter() - start
+
+    print(f"{args.rows} links\n")
+    print(f"{'format':<14}{'chars':>7}{'generate ms':>13}{'index MB':>10}{'lookup us':>11}")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, column, links, secs in (
+            ("full URL", "VARCHAR(255)", legacy, legacy_secs),
+            ("base62 token", "CHAR(22)", tokens, token_secs),
+        ):
+            index_bytes, lookup = measure(os.path.join(tmpdir, f"{name}.db"), column, links, args.lookups)
+            print(f"{name:<14}{len(links[0]):>7}{secs * 1000:>13.1f}{index_bytes / 1e6:>10.1f}{lookup:>11.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# File: backend/benchmarks/bench_login_burst.py
+# Path: /inviter-app/backend/benchmarks/bench_login_burst.py
+# Description: Load test showing how a login burst affects /respond latency with inline vs pooled bcrypt
+#
+# Usage: python -m benchmarks.bench_login_burst [--logins 24] [--rounds 10]
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.common import percentile
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Login burst vs /respond latency")
+    parser.add_argument("--logins", type=int, default=24, help="Concurrent logins in the burst")
+    parser.add_argument("--rounds", type=int, default=10, help="bcrypt work factor")
+    return parser.parse_args()
+
+ARGS = parse_args()
+TMPDIR = tempfile.TemporaryDirectory()
+
+# Settings are read at import time, so configure the app before importing it
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMPDIR.name, 'bench.db')}"
+os.environ["BCRYPT_ROUNDS"] = str(ARGS.rounds)
+os.environ["SMS_TRANSPORT"] = "fake"
+
+import httpx  # noqa: E402
+from sqlalchemy import select  # noqa: E402
+
+import main  # noqa: E402
+from auth import PasswordHasher  # noqa: E402
+from database import SessionLocal  # noqa: E402
+from models import Response  # noqa: E402
+
+EMAIL, PASSWORD = "burst@example.com", "correct horse"
+
+async def setup(client) -> str:
+    """Create a user and a one-recipient invitation, returning the recipient's link"""
+    await main.startup()
+    signup = await client.post("/auth/signup", json={"email": EMAIL, "name": "Burst", "password": PASSWORD})
+    token = signup.json()["access_token"]
+    await client.post(
+        "/invitations",
+        json={"title": "Burst test", "recipients": [{"name": "Guest", "phone": "+14155552671"}]},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+    async with SessionLocal() as db:
+        return await db.scalar(select(Response.response_link).limit(1))
+
+async def probe(client, link: str, stop: asyncio.Event) -> list:
+    """
+    Hit /respond every few milliseconds until stopped, recording latency
+    Latency is measured from when each request was due, so time spent
+    waiting for a blocked event loop to wake the prober is counted too
+    """
+    latencies = []
+    due = time.perf_counter()
+    while not stop.is_set():
+        response = await client.get(f"/respond/{link}")
+        latencies.append((time.perf_counter() - due) * 1000)
+        assert response.status_code == 200
+        due = time.perf_counter() + 0.005
+        await asyncio.sleep(0.005)
+    return latencies
+
+async def scenario(client, link: str, hasher: PasswordHasher):
+    main.password_hasher = hasher
+    stop = asyncio.Event()
+    probe_task = asyncio.create_task(probe(client, link, stop))
+    await asyncio.sleep(0.05)
+
+    start = time.perf_counter()
+    logins = await asyncio.gather(*(
+        client.post("/auth/login", json={"email": EMAIL, "password": PASSWORD})
+        for _ in range(ARGS.logins)
+    ))
+    burst = time.perf_counter() - start
+
+    stop.set()
+    latencies = await probe_task
+    hasher.shutdown()
+    codes = {}
+    for response in logins:
+        codes[response.status_code] = codes.get(response.status_code, 0) + 1
+    return latencies, burst, codes
+
+async def run():
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        link = await setup(client)
+
+        print(f"{ARGS.logins} concurrent logins at bcrypt rounds={ARGS.rounds}\n")
+        print(f"{'hashing':<18}{'/respond p50':>14}{'p95':>10}{'max':>10}{'burst s':>10}  login statuses")
+        for name, hasher in (
+            ("inline", PasswordHasher(workers=0)),
+            ("thread pool", PasswordHasher()),
+        ):
+            latencies, burst, codes = await scenario(client, link, hasher)
+            print(
+                f"{name:<18}{statistics.median(latencies):>12.1f}ms{percentile(latencies, 95):>8.1f}ms"
+                f"{max(latencies):>8.1f}ms{burst:>10.2f}  {codes}"
+            )
+    await main.engine.dispose()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(run())
+    finally:
+        TMPDIR.cleanup()
+        sys.stdout.flush()
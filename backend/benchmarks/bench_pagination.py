@@ -0,0 +1,87 @@
+# File: backend/benchmarks/bench_pagination.py
+# Path: /inviter-app/backend/benchmarks/bench_pagination.py
+# Description: Page latency of keyset vs OFFSET pagination for a user with many invitations
+#
+# Usage: python -m benchmarks.bench_pagination [--invitations 50000] [--page-size 50]
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from crud import list_invitations
+from models import Base, EventType, Invitation
+
+async def seed(session_factory, count: int):
+    start = datetime.utcnow() - timedelta(minutes=count)
+    rows = [
+        {
+            "title": f"Invitation {i}", "event_type": EventType.CUSTOM, "creator_id": 1,
+            "created_at": start + timedelta(minutes=i), "updated_at": start,
+            "expires_at": start + timedelta(minutes=i, days=1),
+            "event_date": start + timedelta(minutes=i, days=2),
+        }
+        for i in range(count)
+    ]
+    async with session_factory() as db:
+        await db.execute(insert(Invitation), rows)
+        await db.commit()
+
+async def time_ms(fn, repeat: int = 20) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(tmpdir, 'bench.db')}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(engine)
+        await seed(session_factory, args.invitations)
+
+        async with session_factory() as db:
+            # Walk the list with keyset cursors, remembering the cursor at a few depths
+            last_page = args.invitations - args.page_size
+            depths = [d - d % args.page_size for d in (args.invitations // 10, args.invitations // 2, last_page)]
+            cursors, cursor = {0: None}, None
+            for offset in range(args.page_size, depths[-1] + 1, args.page_size):
+                _, cursor = await list_invitations(db, 1, cursor=cursor, limit=args.page_size)
+                if offset in depths:
+                    cursors[offset] = cursor
+
+            print(f"{args.invitations} invitations, page size {args.page_size}\n")
+            print(f"{'row offset':>12}{'keyset ms':>12}{'OFFSET ms':>12}")
+            for depth in sorted(cursors):
+                keyset = await time_ms(lambda: list_invitations(db, 1, cursor=cursors[depth], limit=args.page_size))
+                async def offset_page():
+                    return (await db.scalars(
+                        select(Invitation).where(Invitation.creator_id == 1)
+                        .order_by(Invitation.created_at.desc(), Invitation.id.desc())
+                        .offset(depth).limit(args.page_size)
+                    )).all()
+                offset = await time_ms(offset_page)
+                print(f"{depth:>12}{keyset:>12.2f}{offset:>12.2f}")
+
+            active = await time_ms(lambda: list_invitations(db, 1, status="active", limit=args.page_size))
+            print(f"\nfirst page, status=active: {active:.2f}ms")
+
+        await engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Invitation list pagination benchmark")
+    parser.add_argument("--invitations", type=int, default=50000)
+    parser.add_argument("--page-size", type=int, default=50)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
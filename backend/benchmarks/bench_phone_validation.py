@@ -0,0 +1,65 @@
+# File: backend/benchmarks/bench_phone_validation.py
+# Path: /inviter-app/backend/benchmarks/bench_phone_validation.py
+# Description: Throughput of the batch phone normalizer vs the old per-recipient validator
+#
+# Usage: python -m benchmarks.bench_phone_validation [--recipients 1000] [--unique 300] [--invitations 20]
+
+import argparse
+import random
+import time
+
+import phonenumbers
+
+import phones
+from schemas import RecipientInput
+
+def legacy_validate(v: str) -> str:
+    """The previous RecipientInput.validate_phone: parse and validate every recipient"""
+    try:
+        parsed = phonenumbers.parse(v, None)
+        if not phonenumbers.is_valid_number(parsed):
+            raise ValueError("Invalid phone number")
+        return v
+    except phonenumbers.phonenumberutil.NumberParseException:
+        raise ValueError("Invalid phone number format")
+
+def contact_lists(invitations: int, recipients: int, unique: int):
+    """Invitations drawn from one address book, so numbers repeat across and within lists"""
+    book = [f"+1415555{i:04d}" for i in range(unique)]
+    rng = random.Random(42)
+    return [[rng.choice(book) for _ in range(recipients)] for _ in range(invitations)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Recipient phone validation benchmark")
+    parser.add_argument("--recipients", type=int, default=1000, help="Recipients per invitation")
+    parser.add_argument("--unique", type=int, default=300, help="Distinct numbers in the address book")
+    parser.add_argument("--invitations", type=int, default=20)
+    args = parser.parse_args()
+
+    lists = contact_lists(args.invitations, args.recipients, args.unique)
+    total = args.invitations * args.recipients
+
+    start = time.perf_counter()
+    for numbers in lists:
+        for number in numbers:
+            legacy_validate(number)
+    legacy = time.perf_counter() - start
+
+    phones._normalize.cache_clear()
+    batches = [[RecipientInput(name="Guest", phone=n) for n in numbers] for numbers in lists]
+    start = time.perf_counter()
+    kept = 0
+    for batch in batches:
+        unique, errors = phones.normalize_recipients(batch)
+        assert not errors
+        kept += len(unique)
+    batch_time = time.perf_counter() - start
+
+    print(f"{args.invitations} invitations x {args.recipients} recipients from {args.unique} distinct numbers\n")
+    print(f"{'validator':<20}{'seconds':>10}{'numbers/sec':>14}")
+    print(f"{'per-item (old)':<20}{legacy:>10.3f}{total / legacy:>14.0f}")
+    print(f"{'batch + LRU cache':<20}{batch_time:>10.3f}{total / batch_time:>14.0f}")
+    print(f"\n{kept} recipients kept after de-duplication, cache {phones.cache_info()}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# File: backend/benchmarks/bench_rsvp_burst.py
+# Path: /inviter-app/backend/benchmarks/bench_rsvp_burst.py
+# Description: RSVP burst on one large invitation with double taps: direct writes vs coalesced, idempotent batches
+#
+# Usage: python -m benchmarks.bench_rsvp_burst [--recipients 2000] [--concurrency 200] [--double-tap 0.3]
+# Every recipient answers with a message and a share of them submit twice at once. Requests go
+# through POST /respond/{link} in-process; each mode runs in a fresh subprocess since the
+# settings are read at import time. All modes use SQLite production mode (WAL).
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.common import run_modes
+
+MODES = {
+    "direct": {"RSVP_BATCHING": "false", "RSVP_DEDUP_SECONDS": "0"},
+    "batched": {"RSVP_BATCHING": "true", "RSVP_DEDUP_SECONDS": "0"},
+    "batched+idempotent": {"RSVP_BATCHING": "true", "RSVP_DEDUP_SECONDS": "60"},
+}
+
+async def burst(recipients: int, concurrency: int, double_tap: float) -> None:
+    import httpx
+    from sqlalchemy import func, insert, select
+
+    from database import SessionLocal, engine
+    from main import app
+    from models import Invitation, Message, Response
+    from utils import generate_link_tokens
+
+    await app.router.startup()
+    async with SessionLocal() as db:
+        invitation_id = (await db.execute(
+            insert(Invitation)
+            .values(title="Burst", creator_id=1, total_sent=recipients, total_pending=recipients)
+            .returning(Invitation.id)
+        )).scalar_one()
+        links = generate_link_tokens(recipients)
+        await db.execute(insert(Response), [
+            {"invitation_id": invitation_id, "recipient_name": f"Guest {i}",
+             "recipient_phone": f"+1212{i:07d}", "response_link": link}
+            for i, link in enumerate(links)
+        ])
+        await db.commit()
+
+    # Double taps sit next to each other in the queue, so two workers send them at nearly the same time
+    rng = random.Random(7)
+    submissions = []
+    for i, link in enumerate(links):
+        body = {"answer": "yes" if i % 3 else "no", "message": f"Looking forward to it ({i})"}
+        submissions.extend([(link, body)] * (2 if rng.random() < double_tap else 1))
+    pending = iter(submissions)
+    statuses = {}
+
+    async def client(http):
+        for link, body in pending:
+            status = (await http.post(f"/respond/{link}", json=body)).status_code
+            statuses[status] = statuses.get(status, 0) + 1
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as http:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    await app.router.shutdown()
+
+    from writer import response_writer
+    async with SessionLocal() as db:
+        stored = await db.scalar(select(func.count()).select_from(Message))
+        counters = (await db.execute(
+            select(Invitation.total_yes + Invitation.total_no, Invitation.total_messages)
+            .where(Invitation.id == invitation_id)
+        )).one()
+    await engine.dispose()
+
+    commits = response_writer.stats.batches or len(submissions)
+    consistent = counters[1] == stored and counters[0] == recipients
+    print(
+        f"{len(submissions) / elapsed:>10.0f}{elapsed:>8.2f}{len(submissions):>9}{commits:>9}"
+        f"{stored:>10}{'yes' if consistent else 'NO':>12}  {statuses}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="RSVP burst benchmark")
+    parser.add_argument("--recipients", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--double-tap", type=float, default=0.3, help="Share of recipients who submit twice")
+    parser.add_argument("--mode", choices=sorted(MODES), default=None)
+    args = parser.parse_args()
+
+    if args.mode:
+        asyncio.run(burst(args.recipients, args.concurrency, args.double_tap))
+        return
+
+    print(f"{args.recipients} recipients, {args.double_tap:.0%} double taps, {args.concurrency} concurrent clients\n")
+    print(f"{'mode':<20}{'rsvp/s':>10}{'secs':>8}{'requests':>9}{'commits':>9}{'messages':>10}{'consistent':>12}  statuses")
+    run_modes(
+        "benchmarks.bench_rsvp_burst", MODES,
+        ["--recipients", str(args.recipients), "--concurrency", str(args.concurrency),
+         "--double-tap", str(args.double_tap)],
+        env={"SQLITE_PRODUCTION": "true", "SMS_TRANSPORT": "fake", "REMINDER_INTERVAL_SECONDS": "0"},
+        width=20
+    )
+
+if __name__ == "__main__":
+    main()
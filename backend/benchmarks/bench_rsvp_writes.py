@@ -0,0 +1,100 @@
+# File: backend/benchmarks/bench_rsvp_writes.py
+# Path: /inviter-app/backend/benchmarks/bench_rsvp_writes.py
+# Description: RSVP write throughput on SQLite, default mode vs WAL + group-commit writer
+#
+# Usage: python -m benchmarks.bench_rsvp_writes [--responses 5000] [--concurrency 200]
+# Each mode runs in a fresh subprocess, since the SQLite mode is fixed when database.py is imported.
+
+import argparse
+import asyncio
+import time
+
+from benchmarks.common import run_modes
+
+MODES = {
+    "default": {"SQLITE_PRODUCTION": "false", "RSVP_BATCHING": "false"},
+    "production": {"SQLITE_PRODUCTION": "true", "RSVP_BATCHING": "true"},
+}
+
+async def burst(responses: int, concurrency: int) -> None:
+    from sqlalchemy import insert, select
+
+    from crud import get_response_link_entry, submit_response
+    from database import SessionLocal, engine
+    from models import Base, Invitation, Response
+    from schemas import ResponseUpdate
+    from utils import generate_link_tokens
+    from writer import WRITE_QUEUE_ENABLED, response_writer
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with SessionLocal() as db:
+        invitation_id = (await db.execute(
+            insert(Invitation).values(title="Burst", creator_id=1).returning(Invitation.id)
+        )).scalar_one()
+        links = generate_link_tokens(responses)
+        await db.execute(insert(Response), [
+            {"invitation_id": invitation_id, "recipient_name": f"Guest {i}",
+             "recipient_phone": f"+1212{i:07d}", "response_link": link}
+            for i, link in enumerate(links)
+        ])
+        await db.commit()
+        entries = [await get_response_link_entry(db, link) for link in links]
+
+    if WRITE_QUEUE_ENABLED:
+        response_writer.start()
+    pending = iter(enumerate(entries))
+    errors = {}
+
+    async def client():
+        for i, entry in pending:
+            data = ResponseUpdate(answer="yes" if i % 3 else "no", message="See you" if i % 10 == 0 else None)
+            try:
+                if response_writer.running:
+                    await response_writer.submit(links[i], entry, data)
+                else:
+                    async with SessionLocal() as db:
+                        await submit_response(db, links[i], entry, data)
+            except Exception as e:
+                name = type(e).__name__
+                errors[name] = errors.get(name, 0) + 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await response_writer.stop()
+
+    async with SessionLocal() as db:
+        stored = len((await db.scalars(select(Response.id).where(Response.answer.is_not(None)))).all())
+        totals = (await db.execute(
+            select(Invitation.total_yes, Invitation.total_no)
+            .where(Invitation.id == invitation_id)
+        )).one()
+    await engine.dispose()
+
+    batches = response_writer.stats.batches or responses
+    print(
+        f"{responses / elapsed:>10.0f}{elapsed:>9.2f}{stored:>9}{responses / batches:>12.1f}"
+        f"{sum(totals):>10}  {errors or '-'}"
+    )
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite RSVP write benchmark")
+    parser.add_argument("--responses", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--mode", choices=sorted(MODES), default=None)
+    args = parser.parse_args()
+
+    if args.mode:
+        asyncio.run(burst(args.responses, args.concurrency))
+        return
+
+    print(f"{args.responses} responses from {args.concurrency} concurrent writers\n")
+    print(f"{'mode':<12}{'rsvp/s':>10}{'secs':>9}{'stored':>9}{'per commit':>12}{'counted':>10}  errors")
+    run_modes(
+        "benchmarks.bench_rsvp_writes", MODES,
+        ["--responses", str(args.responses), "--concurrency", str(args.concurrency)], env={}
+    )
+
+if __name__ == "__main__":
+    main()
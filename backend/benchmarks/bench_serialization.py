@@ -0,0 +1,75 @@
+# File: backend/benchmarks/bench_serialization.py
+# Path: /inviter-app/backend/benchmarks/bench_serialization.py
+# Description: Cost of turning an invitation page into response bytes, validated path vs trusted orjson path
+#
+# Usage: python -m benchmarks.bench_serialization [--sizes 10,1000,10000]
+# "validated" is what FastAPI does for a response_model route: validate and dump every
+# item through Pydantic, then render with the stdlib JSONResponse.
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+
+from main import app
+
+def make_page(size: int) -> list:
+    now = datetime.utcnow()
+    return [
+        {
+            "id": i, "title": f"Invitation {i}", "description": "Weekly sync with the whole team",
+            "event_type": "meeting", "event_date": now + timedelta(days=i % 30),
+            "location": "Room 4" if i % 2 else None, "yes_text": "Yes", "no_text": "No",
+            "creator_id": 1, "expires_at": None, "created_at": now - timedelta(minutes=i),
+            "total_sent": 40, "total_yes": 25, "total_no": 5, "total_pending": 10, "total_messages": 3,
+        }
+        for i in range(size)
+    ]
+
+async def validated(field, page: list) -> bytes:
+    content = await serialize_response(field=field, response_content=page, is_coroutine=True)
+    return JSONResponse(content).body
+
+async def orjson_validated(field, page: list) -> bytes:
+    content = await serialize_response(field=field, response_content=page, is_coroutine=True)
+    return ORJSONResponse(content).body
+
+async def fast(field, page: list) -> bytes:
+    return ORJSONResponse(page).body
+
+PATHS = {"validated": validated, "orjson render": orjson_validated, "trusted": fast}
+
+async def timed(path, field, page: list, budget: float = 1.0) -> float:
+    """Best-of-N milliseconds per page, repeating for about budget seconds"""
+    best, spent = float("inf"), 0.0
+    while spent < budget:
+        start = time.perf_counter()
+        await path(field, page)
+        elapsed = time.perf_counter() - start
+        best, spent = min(best, elapsed), spent + elapsed
+    return best * 1000
+
+async def run(sizes) -> None:
+    route = next(r for r in app.routes if getattr(r, "path", None) == "/invitations" and "GET" in r.methods)
+    field = route.response_field
+
+    print(f"{'items':>7}" + "".join(f"{name + ' ms':>18}" for name in PATHS) + f"{'speedup':>10}")
+    for size in sizes:
+        page = make_page(size)
+        baseline = json.loads(await validated(field, page))
+        assert json.loads(await fast(field, page)) == baseline, "fast path output differs"
+
+        results = [await timed(path, field, page) for path in PATHS.values()]
+        print(f"{size:>7}" + "".join(f"{ms:>18.3f}" for ms in results) + f"{results[0] / results[-1]:>9.1f}x")
+
+def main():
+    parser = argparse.ArgumentParser(description="Response serialization benchmark")
+    parser.add_argument("--sizes", type=lambda v: [int(s) for s in v.split(",")], default=[10, 1000, 10000])
+    asyncio.run(run(parser.parse_args().sizes))
+
+if __name__ == "__main__":
+    main()
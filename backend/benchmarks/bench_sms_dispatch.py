@@ -0,0 +1,54 @@
+# File: backend/benchmarks/bench_sms_dispatch.py
+# Path: /inviter-app/backend/benchmarks/bench_sms_dispatch.py
+# Description: Measures bulk SMS dispatch throughput against the local fake provider
+#
+# Usage: python -m benchmarks.bench_sms_dispatch [--recipients 1000] [--latency 0.05]
+
+import argparse
+import asyncio
+import time
+
+from sms import FakeTransport, SMSDispatcher, SMSMessage
+
+def build_messages(count: int):
+    return [SMSMessage(to=f"+1555{i:07d}", body="Benchmark invitation", sender="+15550000000") for i in range(count)]
+
+async def run_sequential(count: int, latency: float) -> float:
+    """One-at-a-time sending, equivalent to calling utils.send_sms in a loop"""
+    transport = FakeTransport(latency=latency)
+    start = time.perf_counter()
+    for message in build_messages(count):
+        await transport.send(message)
+    return time.perf_counter() - start
+
+async def run_dispatcher(count: int, latency: float, concurrency: int, rate_limit) -> float:
+    transport = FakeTransport(latency=latency)
+    dispatcher = SMSDispatcher(transport, concurrency=concurrency, rate_limit=rate_limit)
+    start = time.perf_counter()
+    results = await dispatcher.send_batch(build_messages(count))
+    elapsed = time.perf_counter() - start
+    assert all(r.success for r in results)
+    await dispatcher.aclose()
+    return elapsed
+
+async def main():
+    parser = argparse.ArgumentParser(description="Bulk SMS dispatch throughput")
+    parser.add_argument("--recipients", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated provider latency in seconds")
+    parser.add_argument("--rate-limit", type=float, default=None, help="Per-sender messages/second (default: unlimited)")
+    args = parser.parse_args()
+
+    print(f"{args.recipients} recipients, {args.latency * 1000:.0f}ms simulated provider latency\n")
+    print(f"{'mode':<24}{'seconds':>10}{'msgs/sec':>12}")
+
+    # Sequential sending is slow by design; sample a slice and extrapolate
+    sample = min(args.recipients, 100)
+    elapsed = await run_sequential(sample, args.latency) * args.recipients / sample
+    print(f"{'sequential (est.)':<24}{elapsed:>10.2f}{args.recipients / elapsed:>12.0f}")
+
+    for concurrency in (10, 50, 100, 200):
+        elapsed = await run_dispatcher(args.recipients, args.latency, concurrency, args.rate_limit)
+        print(f"{f'concurrency={concurrency}':<24}{elapsed:>10.2f}{args.recipients / elapsed:>12.0f}")
+
+if __name__ == "__main__":
+    asyncio.run(main())
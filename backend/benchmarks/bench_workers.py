@@ -0,0 +1,140 @@
+# File: backend/benchmarks/bench_workers.py
+# Path: /inviter-app/backend/benchmarks/bench_workers.py
+# Description: Throughput with 1..N uvicorn worker processes sharing one database, plus a cross-worker consistency check
+#
+# Usage: python -m benchmarks.bench_workers [--workers 1,2,4] [--seconds 10] [--clients 64]
+# Each worker count gets a fresh SQLite database in production mode. Concurrent signups must
+# get distinct IDs, and every issued token must work on whichever worker serves it. Load is
+# generated from several client processes so the client is not the bottleneck; scaling is
+# bounded by the machine's cores (os.cpu_count() is printed for reference).
+
+import argparse
+import asyncio
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import httpx
+
+PORT = 8767
+BASE_URL = f"http://127.0.0.1:{PORT}"
+
+async def wait_ready(client: httpx.AsyncClient) -> None:
+    for _ in range(200):
+        try:
+            await client.get("/health")
+            return
+        except httpx.TransportError:
+            await asyncio.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+async def check_consistency(client: httpx.AsyncClient, signups: int) -> dict:
+    """Sign up concurrently, then use every token on fresh connections; returns the first user's headers"""
+    responses = await asyncio.gather(*(
+        client.post("/auth/signup", json={"email": f"user{i}@example.com", "name": f"User {i}", "password": "benchmark"})
+        for i in range(signups)
+    ))
+    users = [response.json() for response in responses]
+    ids = {user["id"] for user in users}
+    if len(ids) != signups:
+        raise RuntimeError(f"{signups} signups produced only {len(ids)} distinct user IDs")
+
+    for user in users:
+        # A new connection per request, so requests spread across the workers
+        async with httpx.AsyncClient(base_url=BASE_URL) as fresh:
+            me = await fresh.get("/auth/me", headers={"Authorization": f"Bearer {user['access_token']}"})
+        if me.status_code != 200 or me.json()["id"] != user["id"]:
+            raise RuntimeError(f"token for user {user['id']} rejected or resolved to another user")
+    return {"Authorization": f"Bearer {users[0]['access_token']}"}
+
+async def load(headers: dict, links: list, clients: int, seconds: float) -> int:
+    """Mixed response-page and invitation-list traffic for a fixed time; returns completed requests"""
+    done = 0
+    deadline = time.perf_counter() + seconds
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=BASE_URL, limits=limits, timeout=60) as client:
+        async def worker(offset: int):
+            nonlocal done
+            i = offset
+            while time.perf_counter() < deadline:
+                if i % 4:
+                    response = await client.get(f"/respond/{links[i % len(links)]}")
+                else:
+                    response = await client.get("/invitations?limit=20", headers=headers)
+                response.raise_for_status()
+                done += 1
+                i += clients
+        await asyncio.gather(*(worker(i) for i in range(clients)))
+    return done
+
+def load_process(headers: dict, links: list, clients: int, seconds: float) -> int:
+    return asyncio.run(load(headers, links, clients, seconds))
+
+def run_workers(workers: int, args, tmpdir: str) -> float:
+    path = os.path.join(tmpdir, f"workers{workers}.db")
+    env = {
+        **os.environ, "DATABASE_URL": f"sqlite:///{path}", "SQLITE_PRODUCTION": "true",
+        "SMS_TRANSPORT": "fake", "BCRYPT_ROUNDS": "4", "REMINDER_INTERVAL_SECONDS": "0",
+        "STATE_BACKEND": "database",
+    }
+    subprocess.run([sys.executable, "init_db.py"], env=env, check=True, stdout=subprocess.DEVNULL)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(PORT),
+         "--workers", str(workers), "--log-level", "warning"],
+        env=env
+    )
+    try:
+        async def prepare():
+            async with httpx.AsyncClient(base_url=BASE_URL, timeout=60) as client:
+                await wait_ready(client)
+                headers = await check_consistency(client, args.signups)
+                for i in range(10):
+                    await client.post("/invitations", headers=headers, json={
+                        "title": f"Load {i}",
+                        "recipients": [{"name": f"Guest {j}", "phone": f"+1415555{j:04d}"} for j in range(50)]
+                    })
+                return headers
+        headers = asyncio.run(prepare())
+        with sqlite3.connect(path) as conn:
+            links = [row[0] for row in conn.execute("SELECT response_link FROM responses")]
+
+        per_process = max(1, args.clients // args.client_processes)
+        with ProcessPoolExecutor(args.client_processes) as pool:
+            start = time.perf_counter()
+            futures = [
+                pool.submit(load_process, headers, links, per_process, args.seconds)
+                for _ in range(args.client_processes)
+            ]
+            total = sum(future.result() for future in futures)
+            elapsed = time.perf_counter() - start
+        return total / elapsed
+    finally:
+        server.terminate()
+        server.wait()
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-worker scaling benchmark")
+    parser.add_argument("--workers", type=lambda v: [int(w) for w in v.split(",")], default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--client-processes", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--signups", type=int, default=40)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPU(s), {args.clients} clients in {args.client_processes} process(es), "
+          f"{args.seconds:.0f}s per run\n")
+    print(f"{'workers':>8}{'req/s':>10}{'scaling':>9}  consistency")
+    baseline = None
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for workers in args.workers:
+            rps = run_workers(workers, args, tmpdir)
+            baseline = baseline or rps
+            print(f"{workers:>8}{rps:>10.0f}{rps / baseline:>8.2f}x  {args.signups} signups, distinct IDs, tokens valid on all workers")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# File: backend/benchmarks/common.py
+# Path: /inviter-app/backend/benchmarks/common.py
+# Description: Helpers shared by the benchmark scripts
+
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+def run_modes(module: str, modes: Dict[str, dict], args: List[str], env: Dict[str, str], width: int = 12) -> None:
+    """
+    Run `python -m <module> --mode <mode> <args>` once per mode
+    Settings are read when the app modules are imported, so each mode gets a fresh
+    interpreter with its settings on top of env, and a new SQLite database. The
+    mode name is printed first; the child prints the rest of its result line.
+    """
+    for mode, settings in modes.items():
+        with tempfile.TemporaryDirectory() as tmpdir:
+            child_env = {
+                **os.environ, **env, **settings,
+                "DATABASE_URL": f"sqlite:///{os.path.join(tmpdir, 'bench.db')}",
+            }
+            print(f"{mode:<{width}}", end="", flush=True)
+            subprocess.run([sys.executable, "-m", module, "--mode", mode, *args], env=child_env, check=True)
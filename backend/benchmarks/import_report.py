@@ -0,0 +1,56 @@
+# File: backend/benchmarks/import_report.py
+# Path: /inviter-app/backend/benchmarks/import_report.py
+# Description: Import-time report for the backend, from python -X importtime
+#
+# Usage: python -m benchmarks.import_report [--top 15]
+# Lists the slowest first-party modules (cumulative) and third-party packages (own time)
+# when importing main. The cold-start budget itself is enforced by tests/test_startup.py.
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+def import_report(env: dict, top: int) -> None:
+    """Print the slowest first-party modules and third-party packages from -X importtime"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        env=env, capture_output=True, text=True, check=True
+    )
+    local = {name[:-3] for name in os.listdir(".") if name.endswith(".py")}
+    modules, packages = {}, {}
+    total = 0
+    for line in result.stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|\s*(\S+)", line)
+        if not match:
+            continue
+        own, cumulative, name = int(match[1]) / 1000, int(match[2]) / 1000, match[3]
+        total += own
+        package = name.split(".")[0]
+        if package in local:
+            modules[name] = cumulative
+        else:
+            packages[package] = packages.get(package, 0) + own
+
+    print(f"import main: {total:.0f} ms")
+    for title, times in (("first-party module (cumulative)", modules), ("package (own time)", packages)):
+        print(f"\n{title:<36}{'ms':>8}")
+        for name, ms in sorted(times.items(), key=lambda item: -item[1])[:top]:
+            print(f"  {name:<34}{ms:>8.1f}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time report")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        env = {
+            **os.environ, "DATABASE_URL": f"sqlite:///{os.path.join(tmpdir, 'report.db')}",
+            "SMS_TRANSPORT": "fake", "REMINDER_INTERVAL_SECONDS": "0",
+        }
+        import_report(env, args.top)
+
+if __name__ == "__main__":
+    main()
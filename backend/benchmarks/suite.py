@@ -0,0 +1,189 @@
+# File: backend/benchmarks/suite.py
+# Path: /inviter-app/backend/benchmarks/suite.py
+# Description: Latency and throughput suite for the API hot paths, gated against a stored baseline
+#
+# Usage: python -m benchmarks.suite [--invitations 200] [--recipients 50] [--requests 500] [--concurrency 20]
+#        python -m benchmarks.suite --save-baseline   (record the current numbers as the baseline)
+# Drives the FastAPI app in-process through httpx's ASGI transport against a freshly seeded
+# SQLite database in production mode (WAL and the group-commit writer). Exits non-zero when
+# a scenario errors or is slower than the baseline by more than --tolerance (p95 latency up,
+# or throughput down). Baselines are machine-specific; re-record one when the hardware
+# changes. Runs are only compared against a baseline recorded with the same dataset size.
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.common import percentile
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+async def seed(client, invitations: int, recipients: int) -> tuple:
+    """Sign up one user and create the dataset through the CRUD layer; returns (headers, links)"""
+    from sqlalchemy import select
+
+    from crud import create_invitation_with_recipients
+    from database import SessionLocal
+    from models import Response
+    from schemas import InvitationCreate
+
+    token = (await client.post("/auth/signup", json={
+        "email": "bench@example.com", "name": "Bench", "password": "benchmark"
+    })).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = (await client.get("/auth/me", headers=headers)).json()["id"]
+
+    async with SessionLocal() as db:
+        for i in range(invitations):
+            await create_invitation_with_recipients(db, creator_id=user_id, invitation=InvitationCreate(
+                title=f"Suite {i}", event_type="meeting",
+                recipients=[{"name": f"Guest {j}", "phone": f"+1415555{j:04d}"} for j in range(recipients)]
+            ))
+        links = (await db.scalars(select(Response.response_link).order_by(Response.id))).all()
+    return headers, links
+
+def scenarios(headers: dict, links: list) -> dict:
+    """Name -> (request factory taking the iteration number, default request count scale)"""
+    big_invitation = {
+        "title": "Suite bulk", "event_type": "meeting",
+        "recipients": [{"name": f"Guest {j}", "phone": f"+1650555{j:04d}"} for j in range(1000)]
+    }
+    return {
+        "respond_get": (lambda i: ("GET", f"/respond/{links[i % len(links)]}", {}), 1.0),
+        "respond_post": (lambda i: ("POST", f"/respond/{links[-1 - i % len(links)]}",
+                                    {"json": {"answer": "yes" if i % 3 else "no"}}), 1.0),
+        "list_invitations": (lambda i: ("GET", "/invitations?limit=50", {"headers": headers}), 1.0),
+        "dashboard": (lambda i: ("GET", "/analytics/dashboard", {"headers": headers}), 1.0),
+        "create_1000_recipients": (lambda i: ("POST", "/invitations",
+                                              {"headers": headers, "json": big_invitation}), 0.02),
+    }
+
+async def measure(client, make_request, requests: int, concurrency: int) -> dict:
+    pending = iter(range(requests))
+    latencies, errors = [], 0
+
+    async def worker():
+        nonlocal errors
+        for i in pending:
+            method, path, kwargs = make_request(i)
+            start = time.perf_counter()
+            response = await client.request(method, path, **kwargs)
+            latencies.append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": requests,
+        "errors": errors,
+        "rps": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+    }
+
+def best_of(rounds: list) -> dict:
+    """Best value of each metric across rounds, which filters out noise from the rest of the machine"""
+    return {
+        "requests": rounds[0]["requests"],
+        "errors": sum(r["errors"] for r in rounds),
+        "rps": max(r["rps"] for r in rounds),
+        **{key: min(r[key] for r in rounds) for key in ("p50_ms", "p95_ms", "p99_ms")},
+    }
+
+async def run(args) -> dict:
+    import httpx
+
+    from main import app
+
+    await app.router.startup()
+    try:
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            headers, links = await seed(client, args.invitations, args.recipients)
+            results = {}
+            for name, (make_request, scale) in scenarios(headers, links).items():
+                if args.only and name not in args.only:
+                    continue
+                requests = max(5, int(args.requests * scale))
+                await measure(client, make_request, max(1, requests // 10), args.concurrency)  # Warm up
+                rounds = [await measure(client, make_request, requests, args.concurrency) for _ in range(args.rounds)]
+                results[name] = best_of(rounds)
+                r = results[name]
+                print(f"{name:<24}{r['rps']:>9.1f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}"
+                      f"{r['p99_ms']:>10.2f}{r['errors']:>8}", flush=True)
+    finally:
+        await app.router.shutdown()
+    return results
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """Human-readable regressions against the baseline results"""
+    failures = []
+    for name, result in results.items():
+        if result["errors"]:
+            failures.append(f"{name}: {result['errors']} failed request(s)")
+        expected = baseline.get(name)
+        if not expected:
+            continue
+        if result["p95_ms"] > expected["p95_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p95 {result['p95_ms']}ms vs baseline {expected['p95_ms']}ms")
+        if result["rps"] < expected["rps"] * (1 - tolerance):
+            failures.append(f"{name}: {result['rps']} req/s vs baseline {expected['rps']} req/s")
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser(description="API hot path benchmark suite")
+    parser.add_argument("--invitations", type=int, default=200)
+    parser.add_argument("--recipients", type=int, default=50, help="Recipients per seeded invitation")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per scenario (creation runs 2%%)")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=3, help="Runs per scenario; the best is kept")
+    parser.add_argument("--only", type=lambda v: v.split(","), default=None, help="Comma-separated scenarios")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed regression, 0.25 = 25%%")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+
+    dataset = {
+        "invitations": args.invitations, "recipients": args.recipients,
+        "requests": args.requests, "concurrency": args.concurrency, "rounds": args.rounds,
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        # The app reads its settings at import time, so these must be set before main is imported
+        os.environ.update({
+            "DATABASE_URL": f"sqlite:///{os.path.join(tmpdir, 'suite.db')}",
+            "SQLITE_PRODUCTION": "true", "SMS_TRANSPORT": "fake", "BCRYPT_ROUNDS": "4",
+            "REMINDER_INTERVAL_SECONDS": "0",
+        })
+        print(f"{args.invitations} invitations x {args.recipients} recipients, "
+              f"{args.requests} requests per scenario, concurrency {args.concurrency}\n")
+        print(f"{'scenario':<24}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+        results = asyncio.run(run(args))
+
+    if args.save_baseline:
+        args.baseline.write_text(json.dumps({"dataset": dataset, "results": results}, indent=2) + "\n")
+        print(f"\nBaseline written to {args.baseline}")
+        return
+
+    failures = compare(results, {}, args.tolerance)
+    if args.baseline.exists():
+        stored = json.loads(args.baseline.read_text())
+        if stored["dataset"] == dataset:
+            failures = compare(results, stored["results"], args.tolerance)
+        else:
+            print(f"\nBaseline was recorded with {stored['dataset']}; skipping the regression check")
+    if failures:
+        print("\nREGRESSIONS:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("\nOK")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# File: backend/cache.py
+# Path: /inviter-app/backend/cache.py
+# Description: In-process LRU+TTL caches for hot read paths
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from sqlalchemy import event
+
+from config import env_float, env_int
+from models import Invitation
+
+# Cache configuration for the public response page
+RESPOND_CACHE_TTL = env_float("RESPOND_CACHE_TTL", 60)  # Seconds
+RESPOND_CACHE_MAX_ENTRIES = env_int("RESPOND_CACHE_MAX_ENTRIES", 50000)
+RESPOND_CACHE_MAX_BYTES = env_int("RESPOND_CACHE_MAX_BYTES", 32 * 1024 * 1024)
+RSVP_DEDUP_SECONDS = env_float("RSVP_DEDUP_SECONDS", 60)  # Window in which a repeated message is stored once
+
+def estimate_size(value: Any) -> int:
+    """Approximate the memory cost of a cached value by its JSON length"""
+    return len(json.dumps(value, default=str))
+
+# Every cache created in the process, for stats reporting
+registered_caches = []
+
+class TTLCache:
+    """
+    Least-recently-used cache whose entries also expire after a TTL
+    Bounded both by entry count and by the estimated size of the values
+    """
+
+    def __init__(self, name: str, max_entries: int, max_bytes: int, ttl: float):
+        registered_caches.append(self)
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.current_bytes = 0
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()  # key -> (expires, size, value)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            expires, size, value = item
+            if expires <= time.monotonic():
+                del self._data[key]
+                self.current_bytes -= size
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: Optional[int] = None, ttl: Optional[float] = None) -> None:
+        size = estimate_size(value) if size is None else size
+        ttl = self.ttl if ttl is None else ttl
+        if size > self.max_bytes:
+            return  # Never worth evicting everything for one oversized value
+
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.current_bytes -= old[1]
+
+            self._data[key] = (time.monotonic() + ttl, size, value)
+            self.current_bytes += size
+
+            while len(self._data) > self.max_entries or self.current_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._data.popitem(last=False)
+                self.current_bytes -= evicted_size
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is not None:
+                self.current_bytes -= item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.current_bytes = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._data),
+            "bytes": self.current_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+# Response link -> recipient entry (response ID, invitation ID, name, answer)
+response_link_cache = TTLCache(
+    "respond_links", RESPOND_CACHE_MAX_ENTRIES, RESPOND_CACHE_MAX_BYTES // 2, RESPOND_CACHE_TTL
+)
+
+# Invitation ID -> rendered invitation payload, shared by every recipient link
+invitation_page_cache = TTLCache(
+    "respond_invitations", RESPOND_CACHE_MAX_ENTRIES, RESPOND_CACHE_MAX_BYTES // 2, RESPOND_CACHE_TTL
+)
+
+# Response link -> fingerprint of the last stored message, so a double tap stores it once
+recent_submissions = TTLCache(
+    "rsvp_submissions", RESPOND_CACHE_MAX_ENTRIES, RESPOND_CACHE_MAX_BYTES // 8, RSVP_DEDUP_SECONDS
+)
+
+def invalidate_response_link(link: str) -> None:
+    """Drop a recipient's cached entry, e.g. after they answer"""
+    response_link_cache.invalidate(link)
+
+def invalidate_invitation(invitation_id: int) -> None:
+    """Drop an invitation's rendered payload, e.g. after it is edited"""
+    invitation_page_cache.invalidate(invitation_id)
+
+def cache_stats() -> dict:
+    return {cache.name: cache.stats() for cache in registered_caches}
+
+@event.listens_for(Invitation, "after_update")
+@event.listens_for(Invitation, "after_delete")
+def _invitation_changed(mapper, connection, target):
+    # Any ORM edit of an invitation makes its rendered page stale
+    invalidate_invitation(target.id)
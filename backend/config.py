@@ -0,0 +1,55 @@
+# File: backend/config.py
+# Path: /inviter-app/backend/config.py
+# Description: Application settings, read once from the environment and .env
+
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from dotenv import load_dotenv
+
+# The only place .env is read; every module takes its settings from here, so values
+# in .env apply no matter which module happens to be imported first
+load_dotenv()
+
+def env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    return os.getenv(name, default)
+
+def env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+def env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value else default
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    return value.lower() in ("1", "true", "yes") if value else default
+
+@dataclass(frozen=True)
+class Settings:
+    """Settings shared across modules; per-module tuning knobs sit next to the code they tune"""
+    database_url: str
+    secret_key: str
+    base_url: str
+    twilio_account_sid: Optional[str]
+    twilio_auth_token: Optional[str]
+    twilio_phone_number: Optional[str]
+
+    @property
+    def twilio_configured(self) -> bool:
+        return bool(self.twilio_account_sid and self.twilio_auth_token)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            database_url=env_str("DATABASE_URL", "sqlite+aiosqlite:///./inviter.db"),
+            secret_key=env_str("SECRET_KEY", "admin"),
+            base_url=env_str("BASE_URL", "https://invite.yourapp.com"),
+            twilio_account_sid=env_str("TWILIO_ACCOUNT_SID"),
+            twilio_auth_token=env_str("TWILIO_AUTH_TOKEN"),
+            twilio_phone_number=env_str("TWILIO_PHONE_NUMBER"),
+        )
+
+settings = Settings.from_env()
@@ -0,0 +1,125 @@
+# File: backend/counters.py
+# Path: /inviter-app/backend/counters.py
+# Description: Incremental maintenance and reconciliation of invitation RSVP counters
+#
+# Usage: python counters.py   (repairs any counter drift in the configured database)
+
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select, update, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Invitation, Message, Response
+from rollups import touch_user_versions
+
+COUNTER_COLUMNS = ("total_sent", "total_yes", "total_no", "total_pending", "total_messages")
+
+def answer_deltas(previous: Optional[str], answer: Optional[str]) -> Dict[str, int]:
+    """
+    Counter changes for a response moving from one answer to another
+    None means pending, so None -> yes is a new answer and yes -> no is a change of mind
+    """
+    if previous == answer:
+        return {}
+
+    deltas = {"total_yes": 0, "total_no": 0, "total_pending": 0}
+    for value, sign in ((previous, -1), (answer, 1)):
+        column = "total_pending" if value is None else f"total_{value}"
+        deltas[column] += sign
+    return {column: delta for column, delta in deltas.items() if delta}
+
+async def apply_counter_deltas(db: AsyncSession, invitation_id: int, deltas: Dict[str, int]) -> None:
+    """
+    Apply counter changes as a single relative UPDATE
+    Runs inside the caller's transaction so counters commit together with the data they count
+    """
+    if not deltas:
+        return
+    await db.execute(
+        update(Invitation)
+        .where(Invitation.id == invitation_id)
+        .values({
+            column: getattr(Invitation, column) + delta
+            for column, delta in deltas.items()
+        })
+    )
+
+async def actual_counts(db: AsyncSession, invitation_ids: Iterable[int]) -> Dict[int, Dict[str, int]]:
+    """Recompute counters for the given invitations from the responses and messages tables"""
+    ids = list(invitation_ids)
+    counts = {
+        invitation_id: dict.fromkeys(COUNTER_COLUMNS, 0)
+        for invitation_id in ids
+    }
+
+    for row in await db.execute(
+        select(
+            Response.invitation_id,
+            func.count().label("sent"),
+            func.sum(case((Response.answer == "yes", 1), else_=0)).label("yes"),
+            func.sum(case((Response.answer == "no", 1), else_=0)).label("no"),
+        )
+        .where(Response.invitation_id.in_(ids))
+        .group_by(Response.invitation_id)
+    ):
+        counts[row.invitation_id].update(
+            total_sent=row.sent,
+            total_yes=row.yes,
+            total_no=row.no,
+            total_pending=row.sent - row.yes - row.no,
+        )
+
+    for invitation_id, messages in await db.execute(
+        select(Message.invitation_id, func.count())
+        .where(Message.invitation_id.in_(ids))
+        .group_by(Message.invitation_id)
+    ):
+        counts[invitation_id]["total_messages"] = messages
+
+    return counts
+
+async def reconcile_counters(db: AsyncSession, batch_size: int = 500) -> int:
+    """
+    Repair counter drift across all invitations, one batch of invitations at a time
+    The owners' version stamps are bumped with the repair, so cached invitation
+    lists (their ETag comes from the stamp) are not served with the old counters.
+    Returns the number of invitations whose counters were corrected
+    """
+    repaired = 0
+    last_id = 0
+    while True:
+        stored = (await db.execute(
+            select(Invitation.id, Invitation.creator_id, *(getattr(Invitation, c) for c in COUNTER_COLUMNS))
+            .where(Invitation.id > last_id)
+            .order_by(Invitation.id)
+            .limit(batch_size)
+        )).all()
+        if not stored:
+            break
+
+        actual = await actual_counts(db, (row.id for row in stored))
+        owners = set()
+        for row in stored:
+            expected = actual[row.id]
+            if any(getattr(row, column) != expected[column] for column in COUNTER_COLUMNS):
+                await db.execute(update(Invitation).where(Invitation.id == row.id).values(**expected))
+                owners.add(row.creator_id)
+                repaired += 1
+
+        await touch_user_versions(db, owners, datetime.utcnow())
+        await db.commit()
+        last_id = stored[-1].id
+
+    return repaired
+
+if __name__ == "__main__":
+    import asyncio
+    from database import SessionLocal, engine
+
+    async def main():
+        async with SessionLocal() as db:
+            print(f"Repaired counters on {await reconcile_counters(db)} invitation(s)")
+        await engine.dispose()
+
+    asyncio.run(main())
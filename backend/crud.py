@@ -0,0 +1,576 @@
+# File: backend/crud.py
+# Path: /inviter-app/backend/crud.py
+# Description: Database access helpers for invitations and responses
+
+import asyncio
+import base64
+import hashlib
+import json
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, insert, select, update, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+
+from cache import response_link_cache, invitation_page_cache, invalidate_response_link, recent_submissions
+from counters import answer_deltas, apply_counter_deltas
+from rollups import (
+    record_invitation_created, record_recipients_added, record_answer,
+    record_message, record_messages_read
+)
+from models import EventType, Invitation, Message, Response, User
+from schemas import InvitationCreate, ResponseUpdate
+from utils import generate_link_tokens, is_link_token
+
+def coerce_event_type(value: Optional[str]) -> EventType:
+    """Map free-form event types (e.g. template IDs) onto the EventType enum"""
+    try:
+        return EventType(value)
+    except ValueError:
+        return EventType.CUSTOM
+
+def invitation_to_dict(invitation: Invitation) -> dict:
+    """Serialize an Invitation row, including its counters, in the InvitationResponse shape"""
+    return {
+        "id": invitation.id,
+        "title": invitation.title,
+        "description": invitation.description,
+        "event_type": invitation.event_type.value if invitation.event_type else EventType.CUSTOM.value,
+        "event_date": invitation.event_date,
+        "location": invitation.location,
+        "yes_text": invitation.yes_text,
+        "no_text": invitation.no_text,
+        "creator_id": invitation.creator_id,
+        "expires_at": invitation.expires_at,
+        "created_at": invitation.created_at,
+        "total_sent": invitation.total_sent,
+        "total_yes": invitation.total_yes,
+        "total_no": invitation.total_no,
+        "total_pending": invitation.total_pending,
+        "total_messages": invitation.total_messages,
+    }
+
+def response_to_dict(response: Response) -> dict:
+    """Serialize a Response row in the ResponseDetail shape"""
+    return {
+        "id": response.id,
+        "recipient_name": response.recipient_name,
+        "recipient_phone": response.recipient_phone,
+        "answer": response.answer,
+        "viewed_at": response.viewed_at,
+        "responded_at": response.responded_at,
+    }
+
+def message_to_dict(message: Message) -> dict:
+    """Serialize a Message row in the MessageResponse shape, plus the response it belongs to"""
+    return {
+        "id": message.id,
+        "response_id": message.response_id,
+        "sender_name": message.sender_name,
+        "content": message.content,
+        "is_read": message.is_read,
+        "created_at": message.created_at,
+    }
+
+async def create_invitation_with_recipients(
+    db: AsyncSession, creator_id: int, invitation: InvitationCreate
+) -> Tuple[dict, List[dict]]:
+    """
+    Insert an invitation and one Response row per recipient in a single transaction
+    Recipients are written with one executemany INSERT rather than an ORM add per row
+    Returns the invitation dict and the inserted response rows
+    """
+    now = datetime.utcnow()
+    values = {
+        "title": invitation.title,
+        "description": invitation.description,
+        "event_type": coerce_event_type(invitation.event_type),
+        "event_date": invitation.event_date,
+        "location": invitation.location,
+        "yes_text": invitation.yes_text,
+        "no_text": invitation.no_text,
+        "template_style": invitation.template_style,
+        "custom_fields": invitation.custom_fields,
+        "creator_id": creator_id,
+        "expires_at": invitation.expires_at,
+        "created_at": now,
+        "updated_at": now,
+        "total_sent": len(invitation.recipients),
+        "total_yes": 0,
+        "total_no": 0,
+        "total_pending": len(invitation.recipients),
+        "total_messages": 0,
+    }
+
+    try:
+        invitation_id = (await db.execute(
+            insert(Invitation).values(**values).returning(Invitation.id)
+        )).scalar_one()
+
+        rows = await insert_recipients(
+            db, invitation_id, ((r.name, r.phone) for r in invitation.recipients)
+        )
+        await record_invitation_created(db, creator_id, len(rows), now)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+
+    values["id"] = invitation_id
+    return invitation_to_dict(Invitation(**values)), rows
+
+async def insert_recipients(db: AsyncSession, invitation_id: int, recipients: Iterable[Tuple[str, str]]) -> List[dict]:
+    """Insert one Response row per (name, phone) with a single executemany INSERT"""
+    recipients = list(recipients)
+    rows = [
+        {
+            "invitation_id": invitation_id,
+            "recipient_name": name,
+            "recipient_phone": phone,
+            "response_link": token,
+        }
+        for (name, phone), token in zip(recipients, generate_link_tokens(len(recipients)))
+    ]
+    if rows:
+        await db.execute(insert(Response), rows)
+    return rows
+
+async def add_recipients(
+    db: AsyncSession, invitation_id: int, creator_id: int, recipients: Iterable[Tuple[str, str]]
+) -> List[dict]:
+    """Append recipients to an existing invitation, keeping counters and rollups in step"""
+    try:
+        rows = await insert_recipients(db, invitation_id, recipients)
+        if rows:
+            await apply_counter_deltas(db, invitation_id, {"total_sent": len(rows), "total_pending": len(rows)})
+            await record_recipients_added(db, creator_id, len(rows), datetime.utcnow())
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return rows
+
+async def get_invitation(db: AsyncSession, invitation_id: int, creator_id: int) -> Optional[Invitation]:
+    """Fetch an invitation only if it belongs to the given user"""
+    return await db.scalar(
+        select(Invitation).where(Invitation.id == invitation_id, Invitation.creator_id == creator_id)
+    )
+
+async def get_invitation_details(db: AsyncSession, invitation_id: int, creator_id: int) -> Optional[dict]:
+    """
+    An invitation with all its responses, messages and statistics in four statements
+    Responses and messages are eager-loaded with one SELECT ... IN each; raiseload
+    turns any other relationship access into an error instead of a query per row.
+    Statistics come from one GROUP BY over the responses rather than the counters,
+    so they include view counts.
+    """
+    invitation = await db.scalar(
+        select(Invitation)
+        .where(Invitation.id == invitation_id, Invitation.creator_id == creator_id)
+        .options(selectinload(Invitation.responses), selectinload(Invitation.messages), raiseload("*"))
+    )
+    if invitation is None:
+        return None
+
+    groups = (await db.execute(
+        select(Response.answer, func.count(), func.count(Response.viewed_at))
+        .where(Response.invitation_id == invitation_id)
+        .group_by(Response.answer)
+    )).all()
+    answered = {answer: total for answer, total, _ in groups}
+    sent = sum(answered.values())
+    responded = answered.get("yes", 0) + answered.get("no", 0)
+
+    return {
+        "invitation": invitation_to_dict(invitation),
+        "responses": [response_to_dict(r) for r in sorted(invitation.responses, key=lambda r: r.id)],
+        "messages": [
+            message_to_dict(m) for m in sorted(invitation.messages, key=lambda m: (m.created_at, m.id), reverse=True)
+        ],
+        "statistics": {
+            "total_sent": sent,
+            "total_responded": responded,
+            "total_yes": answered.get("yes", 0),
+            "total_no": answered.get("no", 0),
+            "total_pending": answered.get(None, 0),
+            "total_viewed": sum(viewed for _, _, viewed in groups),
+            "total_messages": len(invitation.messages),
+            "response_rate": round(responded / sent * 100, 1) if sent else 0.0,
+        },
+    }
+
+async def get_invitation_version(db: AsyncSession, invitation_id: int, creator_id: int) -> Optional[Tuple[datetime]]:
+    """
+    The invitation's updated_at stamp, or None if it is not the user's
+    Returned as a 1-tuple so an invitation with no stamp is distinguishable from a missing one
+    """
+    row = (await db.execute(
+        select(Invitation.updated_at)
+        .where(Invitation.id == invitation_id, Invitation.creator_id == creator_id)
+    )).first()
+    return tuple(row) if row is not None else None
+
+async def existing_recipient_phones(db: AsyncSession, invitation_id: int) -> set:
+    return set(await db.scalars(select(Response.recipient_phone).where(Response.invitation_id == invitation_id)))
+
+INVITATION_STATUSES = ("active", "expired", "past")
+
+def encode_cursor(invitation: dict) -> str:
+    """Opaque keyset cursor pointing just after the given invitation"""
+    raw = json.dumps([invitation["created_at"].isoformat(), invitation["id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, invitation_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(invitation_id)
+    except (TypeError, ValueError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+
+async def list_invitations(
+    db: AsyncSession,
+    creator_id: int,
+    status: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 50
+) -> Tuple[List[dict], Optional[str]]:
+    """
+    Return one page of a user's invitations, newest first, with their maintained counters
+    Pages are keyset-paginated on (created_at, id), so deep pages cost the same as the first
+    Returns the page and the cursor for the next one (None on the last page)
+    """
+    now = datetime.utcnow()
+    query = select(Invitation).where(Invitation.creator_id == creator_id)
+
+    if status == "active":
+        query = query.where(
+            or_(Invitation.expires_at.is_(None), Invitation.expires_at > now),
+            or_(Invitation.event_date.is_(None), Invitation.event_date > now),
+        )
+    elif status == "expired":
+        query = query.where(Invitation.expires_at <= now)
+    elif status == "past":
+        query = query.where(Invitation.event_date <= now)
+    elif status is not None:
+        raise ValueError(f"Unknown status: {status}")
+
+    if cursor:
+        created_at, invitation_id = decode_cursor(cursor)
+        query = query.where(tuple_(Invitation.created_at, Invitation.id) < tuple_(created_at, invitation_id))
+
+    invitations = (await db.scalars(
+        query.order_by(Invitation.created_at.desc(), Invitation.id.desc()).limit(limit + 1)
+    )).all()
+
+    page = [invitation_to_dict(inv) for inv in invitations[:limit]]
+    next_cursor = encode_cursor(page[-1]) if len(invitations) > limit else None
+    return page, next_cursor
+
+async def render_invitation_page(db: AsyncSession, invitation_id: int) -> Optional[dict]:
+    """Build the public invitation payload shown on the response page"""
+    row = (await db.execute(
+        select(Invitation, User.name)
+        .outerjoin(User, User.id == Invitation.creator_id)
+        .where(Invitation.id == invitation_id)
+    )).first()
+    if row is None:
+        return None
+
+    invitation, creator_name = row
+    return {
+        "title": invitation.title,
+        "description": invitation.description,
+        "event_date": invitation.event_date,
+        "location": invitation.location,
+        "yes_text": invitation.yes_text,
+        "no_text": invitation.no_text,
+        "expires_at": invitation.expires_at,
+        "creator_name": creator_name,
+    }
+
+async def get_response_link_entry(db: AsyncSession, link: str) -> Optional[dict]:
+    """Resolve a response link through the cache, falling back to the indexed column"""
+    if not is_link_token(link):
+        return None
+    entry = response_link_cache.get(link)
+    if entry is not None:
+        return entry
+
+    row = (await db.execute(
+        select(
+            Response.id, Response.invitation_id, Response.recipient_name, Response.answer,
+            Response.viewed_at, Invitation.creator_id
+        )
+        .join(Invitation, Invitation.id == Response.invitation_id)
+        .where(Response.response_link == link)
+    )).first()
+    if row is None:
+        return None
+
+    entry = {
+        "response_id": row.id,
+        "invitation_id": row.invitation_id,
+        "recipient_name": row.recipient_name,
+        "answer": row.answer,
+        "viewed": row.viewed_at is not None,
+        "creator_id": row.creator_id,
+    }
+    response_link_cache.set(link, entry)
+    return entry
+
+async def get_response_page(db: AsyncSession, link: str) -> Optional[Tuple[dict, dict]]:
+    """
+    Return the (recipient entry, invitation payload) pair for a response link
+    The invitation payload is cached once per invitation and shared by all its links
+    """
+    entry = await get_response_link_entry(db, link)
+    if entry is None:
+        return None
+
+    invitation = invitation_page_cache.get(entry["invitation_id"])
+    if invitation is None:
+        invitation = await render_invitation_page(db, entry["invitation_id"])
+        if invitation is None:
+            return None
+        invitation_page_cache.set(entry["invitation_id"], invitation)
+
+    return entry, invitation
+
+def message_fingerprint(data: ResponseUpdate) -> str:
+    return hashlib.blake2b(data.message.encode(), digest_size=8).hexdigest()
+
+# Messages this process is writing: (link, fingerprint) -> future resolved once the write ends
+_pending_messages: Dict[Tuple[str, str], asyncio.Future] = {}
+
+async def claim_message(link: str, data: ResponseUpdate) -> bool:
+    """
+    Decide whether a submission stores its message
+    Only messages are deduplicated here; whether the answer changes is decided by
+    the database. Returns False when the same message from this link was stored in
+    the last RSVP_DEDUP_SECONDS. While an identical message is still being written
+    this waits for that write, so a double tap is only acknowledged without its
+    message once the first copy is durable. After a True result the caller must
+    call release_message.
+    """
+    if not data.message:
+        return False
+    fingerprint = message_fingerprint(data)
+    key = (link, fingerprint)
+    while True:
+        if recent_submissions.get(link) == fingerprint:
+            return False
+        pending = _pending_messages.get(key)
+        if pending is None:
+            _pending_messages[key] = asyncio.get_running_loop().create_future()
+            return True
+        await asyncio.shield(pending)
+
+def release_message(link: str, data: ResponseUpdate, stored: bool) -> None:
+    """End a claim_message claim; waiting duplicates are skipped if stored, else they write it"""
+    fingerprint = message_fingerprint(data)
+    if stored:
+        recent_submissions.set(link, fingerprint, size=len(fingerprint))
+    pending = _pending_messages.pop((link, fingerprint), None)
+    if pending is not None and not pending.done():
+        pending.set_result(stored)
+
+@dataclass(frozen=True)
+class AnswerChange:
+    """What a submission did to the stored response"""
+    changed: bool  # The response row was written
+    previous: Optional[str]  # Answer stored before the submission
+
+async def _record_answer(db: AsyncSession, response_id: int, data: ResponseUpdate, now: datetime) -> AnswerChange:
+    """
+    Store the answer and report the one it replaced
+    Each UPDATE is conditional on the stored answer, so the previous value is
+    known without a separate read that a concurrent submission could invalidate.
+    Repeating the stored answer without custom fields writes nothing.
+    """
+    statement = (
+        update(Response)
+        .where(Response.id == response_id)
+        .values(answer=data.answer, responded_at=now, custom_responses=data.custom_responses)
+    )
+    if (await db.execute(statement.where(Response.answer.is_(None)))).rowcount:
+        return AnswerChange(True, None)
+    if (await db.execute(statement.where(Response.answer != data.answer))).rowcount:
+        return AnswerChange(True, "no" if data.answer == "yes" else "yes")
+    if data.custom_responses is not None:
+        await db.execute(statement)
+        return AnswerChange(True, data.answer)
+    return AnswerChange(False, data.answer)
+
+async def apply_response(db: AsyncSession, entry: dict, data: ResponseUpdate, now: datetime) -> AnswerChange:
+    """
+    Write a recipient's answer and optional message, with counter and rollup updates
+    Does not commit, so several responses can share one transaction (see writer.py)
+    """
+    change = await _record_answer(db, entry["response_id"], data, now)
+    changes = answer_deltas(change.previous, data.answer)
+    deltas = dict(changes)
+
+    if data.message:
+        await db.execute(insert(Message).values(
+            invitation_id=entry["invitation_id"],
+            response_id=entry["response_id"],
+            sender_name=entry["recipient_name"],
+            content=data.message,
+            created_at=now,
+        ))
+        deltas["total_messages"] = 1
+        await record_message(db, entry["creator_id"], now)
+
+    await apply_counter_deltas(db, entry["invitation_id"], deltas)
+    if changes:
+        await record_answer(db, entry["creator_id"], changes, now)
+    return change
+
+class StaleAnswers(Exception):
+    """Raised when answers changed between apply_responses reading and updating them"""
+
+async def apply_responses(
+    db: AsyncSession, items: List[Tuple[dict, ResponseUpdate]], now: datetime
+) -> List[AnswerChange]:
+    """
+    Set-based apply_response for a batch of (entry, data) pairs, without committing
+    The batch is coalesced first: each response gets one UPDATE to its final answer,
+    a response whose answer and custom fields are unchanged is not written at all,
+    identical messages from one recipient are stored once, and counter and rollup
+    changes are summed per invitation and per user, so a burst on one invitation
+    touches its counter row once per batch.
+    Each UPDATE is conditional on the answer that was read; if any of them misses
+    (a concurrent writer got there first) StaleAnswers is raised and the caller
+    should roll back and fall back to apply_response.
+    Returns an AnswerChange per item; a submission superseded by a later one for
+    the same response in the batch is reported as unchanged.
+    """
+    current = {
+        row.id: (row.answer, row.custom_responses)
+        for row in (await db.execute(
+            select(Response.id, Response.answer, Response.custom_responses)
+            .where(Response.id.in_({entry["response_id"] for entry, _ in items}))
+        )).all()
+    }
+
+    final: Dict[int, int] = {}  # Last submission per response wins: response_id -> index in items
+    messages, seen_messages = [], set()
+    user_messages: Dict[int, int] = defaultdict(int)
+    message_counts: Dict[int, int] = defaultdict(int)
+    for index, (entry, data) in enumerate(items):
+        final[entry["response_id"]] = index
+        key = (entry["response_id"], data.message)
+        if data.message and key not in seen_messages:
+            seen_messages.add(key)
+            messages.append({
+                "invitation_id": entry["invitation_id"],
+                "response_id": entry["response_id"],
+                "sender_name": entry["recipient_name"],
+                "content": data.message,
+                "created_at": now,
+            })
+            message_counts[entry["invitation_id"]] += 1
+            user_messages[entry["creator_id"]] += 1
+
+    answers = []
+    invitation_deltas: Dict[int, Counter] = defaultdict(Counter)
+    user_deltas: Dict[int, Counter] = defaultdict(Counter)
+    written = set()
+    for response_id, index in final.items():
+        entry, data = items[index]
+        previous, previous_custom = current.get(response_id, (None, None))
+        if previous == data.answer and data.custom_responses in (None, previous_custom):
+            continue
+        written.add(index)
+        answers.append({
+            "response_id": response_id, "previous": previous, "new_answer": data.answer,
+            "new_responded_at": now, "new_custom_responses": data.custom_responses,
+        })
+        deltas = answer_deltas(previous, data.answer)
+        invitation_deltas[entry["invitation_id"]].update(deltas)
+        user_deltas[entry["creator_id"]].update(deltas)
+    for invitation_id, count in message_counts.items():
+        invitation_deltas[invitation_id]["total_messages"] += count
+
+    if answers:
+        table = Response.__table__
+        statement = (
+            update(table)
+            .where(
+                table.c.id == bindparam("response_id"),
+                table.c.answer.is_not_distinct_from(bindparam("previous")),
+            )
+            .values(
+                answer=bindparam("new_answer"),
+                responded_at=bindparam("new_responded_at"),
+                custom_responses=bindparam("new_custom_responses"),
+            )
+        )
+        if db.get_bind().dialect.supports_sane_multi_rowcount:
+            updated = (await db.execute(statement, answers)).rowcount
+        else:
+            # executemany reports no rowcount here (asyncpg gives -1), so check each row's own UPDATE
+            updated = 0
+            for params in answers:
+                updated += (await db.execute(statement, params)).rowcount
+        if updated != len(answers):
+            raise StaleAnswers(f"{len(answers) - updated} of {len(answers)} answers changed concurrently")
+
+    if messages:
+        await db.execute(insert(Message), messages)
+    # Sorted, so concurrent batches lock counter and rollup rows in the same order
+    for invitation_id in sorted(invitation_deltas):
+        deltas = invitation_deltas[invitation_id]
+        await apply_counter_deltas(db, invitation_id, {column: delta for column, delta in deltas.items() if delta})
+    for user_id in sorted(user_deltas.keys() | user_messages.keys()):
+        if user_deltas[user_id]:
+            await record_answer(db, user_id, user_deltas[user_id], now)
+        if user_messages[user_id]:
+            await record_message(db, user_id, now, user_messages[user_id])
+
+    return [
+        AnswerChange(index in written, current.get(entry["response_id"], (None, None))[0])
+        for index, (entry, _) in enumerate(items)
+    ]
+
+async def submit_response(db: AsyncSession, link: str, entry: dict, data: ResponseUpdate) -> AnswerChange:
+    """Record a recipient's answer and optional message, updating the invitation counters"""
+    try:
+        change = await apply_response(db, entry, data, datetime.utcnow())
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        invalidate_response_link(link)
+    return change
+
+async def mark_message_read(db: AsyncSession, message_id: int, creator_id: int) -> bool:
+    """Mark one of the creator's messages as read; returns False if it does not exist"""
+    owned = select(Invitation.id).where(Invitation.creator_id == creator_id)
+    invitation_id = await db.scalar(
+        select(Message.invitation_id).where(Message.id == message_id, Message.invitation_id.in_(owned))
+    )
+    if invitation_id is None:
+        return False
+
+    try:
+        changed = (await db.execute(
+            update(Message)
+            .where(Message.id == message_id, Message.is_read.is_(False))
+            .values(is_read=True)
+        )).rowcount
+        if changed:
+            now = datetime.utcnow()
+            await db.execute(update(Invitation).where(Invitation.id == invitation_id).values(updated_at=now))
+            await record_messages_read(db, creator_id, changed, now)
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    return True
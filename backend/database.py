@@ -1,22 +1,112 @@
-from sqlalchemy import create_engine
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
-import os
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+import time
+
+from config import env_bool, env_float, env_int, env_str, settings
 
 # Use SQLite for local development
-DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./inviter.db")
+DATABASE_URL = settings.database_url
+
+# Connection pool tuning (ignored for in-memory SQLite, which uses a single shared connection)
+DB_POOL_SIZE = env_int("DB_POOL_SIZE", 10)
+DB_MAX_OVERFLOW = env_int("DB_MAX_OVERFLOW", 20)
+DB_POOL_TIMEOUT = env_float("DB_POOL_TIMEOUT", 30)  # Seconds to wait for a free connection
+DB_POOL_RECYCLE = env_int("DB_POOL_RECYCLE", 1800)  # Seconds before a connection is replaced
+DB_POOL_PRE_PING = env_bool("DB_POOL_PRE_PING", True)
+
+# Opt-in SQLite production mode: WAL journal, relaxed fsync, memory-mapped reads,
+# and a single writer task that group-commits RSVPs (see writer.py)
+SQLITE_PRODUCTION = env_bool("SQLITE_PRODUCTION", False)
+SQLITE_SYNCHRONOUS = env_str("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_MMAP_SIZE = env_int("SQLITE_MMAP_SIZE", 256 * 1024 * 1024)
+SQLITE_BUSY_TIMEOUT_MS = env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+
+# Async drivers used when DATABASE_URL names a plain dialect
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg", "postgres": "postgresql+asyncpg"}
+
+def async_database_url(url: str) -> str:
+    """Point a plain sqlite:// or postgresql:// URL at its async driver; explicit drivers are kept"""
+    scheme, sep, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme, scheme) + sep + rest
+
+class PoolWaitStats:
+    """How long requests wait to check a connection out of the pool"""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+
+    def record(self, wait: float, timed_out: bool = False) -> None:
+        self.checkouts += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.timeouts += timed_out
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+pool_wait_stats = PoolWaitStats()
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+class TimedQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records the time spent waiting for each checkout"""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_wait_stats.record(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_wait_stats.record(time.perf_counter() - start)
+        return connection
+
+def _engine_options(url: str) -> dict:
+    if url.startswith("sqlite") and (":memory:" in url or url.endswith("://")):
+        return {}
+    return {
+        "poolclass": TimedQueuePool,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+engine = create_async_engine(async_database_url(DATABASE_URL), **_engine_options(DATABASE_URL))
+
+IS_SQLITE = engine.dialect.name == "sqlite"
+
+if IS_SQLITE and SQLITE_PRODUCTION:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # journal_mode is stored in the database file; the rest are per connection
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.close()
+
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
 Base = declarative_base()
 
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
+
+def pool_status() -> dict:
+    """Pool occupancy and checkout wait times, for health checks and metrics"""
+    pool = engine.pool
+    status = {"class": type(pool).__name__}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        status.update(size=pool.size(), checked_out=pool.checkedout(), overflow=pool.overflow())
+    stats = pool_wait_stats
+    status.update(
+        checkouts=stats.checkouts,
+        wait_seconds_total=round(stats.total_wait, 6),
+        wait_seconds_max=round(stats.max_wait, 6),
+        wait_seconds_avg=round(stats.total_wait / stats.checkouts, 6) if stats.checkouts else 0.0,
+        timeouts=stats.timeouts,
+    )
+    return status
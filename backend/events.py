@@ -0,0 +1,138 @@
+# File: backend/events.py
+# Path: /inviter-app/backend/events.py
+# Description: In-process pub/sub hub fanning RSVP events out to Server-Sent Events streams
+
+import asyncio
+import json
+from collections import defaultdict
+from typing import AsyncIterator, Dict, Iterable, Optional, Set
+
+from config import env_float, env_int
+
+EVENTS_QUEUE_SIZE = env_int("EVENTS_QUEUE_SIZE", 100)
+EVENTS_HEARTBEAT_SECONDS = env_float("EVENTS_HEARTBEAT_SECONDS", 15)
+
+HEARTBEAT_FRAME = ": keep-alive\n\n"
+_CLOSED = None  # Queue sentinel telling a stream to end
+
+def format_event(event: str, data: dict) -> str:
+    """Render one SSE frame"""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+class Subscriber:
+    """One open stream: the topics it listens to and its bounded frame queue"""
+    __slots__ = ("topics", "queue", "dropped")
+
+    def __init__(self, topics: Iterable[str], queue_size: int):
+        self.topics = tuple(topics)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+class EventHub:
+    """
+    Topic-based fan-out for live updates
+    Frames are rendered once per event and shared by every subscriber. Each
+    subscriber has a bounded queue; one that falls behind is disconnected
+    rather than allowed to buffer without limit. A single hub-wide task sends
+    heartbeats, so idle streams cost a queue and a suspended task, no timers.
+    """
+
+    def __init__(self, queue_size: int = EVENTS_QUEUE_SIZE, heartbeat: float = EVENTS_HEARTBEAT_SECONDS):
+        self.queue_size = queue_size
+        self.heartbeat = heartbeat
+        self.published = 0
+        self.dropped = 0
+        self._topics: Dict[str, Set[Subscriber]] = defaultdict(set)
+        self._subscribers: Set[Subscriber] = set()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+
+    def subscribe(self, topics: Iterable[str]) -> Subscriber:
+        subscriber = Subscriber(topics, self.queue_size)
+        for topic in subscriber.topics:
+            self._topics[topic].add(subscriber)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        self._subscribers.discard(subscriber)
+        for topic in subscriber.topics:
+            listeners = self._topics.get(topic)
+            if listeners is not None:
+                listeners.discard(subscriber)
+                if not listeners:
+                    del self._topics[topic]
+
+    def _deliver(self, subscriber: Subscriber, frame: str) -> None:
+        try:
+            subscriber.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            self._drop(subscriber)
+
+    def _drop(self, subscriber: Subscriber) -> None:
+        """Disconnect a slow consumer: discard its backlog and tell its stream to end"""
+        self.dropped += 1
+        subscriber.dropped = True
+        self.unsubscribe(subscriber)
+        while not subscriber.queue.empty():
+            subscriber.queue.get_nowait()
+        subscriber.queue.put_nowait(_CLOSED)
+
+    def publish(self, topics: Iterable[str], event: str, data: dict) -> int:
+        """Send an event to everyone subscribed to any of the topics; returns the number reached"""
+        frame = format_event(event, data)
+        reached = set()
+        for topic in topics:
+            reached.update(self._topics.get(topic, ()))
+        for subscriber in reached:
+            self._deliver(subscriber, frame)
+        self.published += 1
+        return len(reached)
+
+    async def stream(self, subscriber: Subscriber) -> AsyncIterator[str]:
+        """Yield SSE frames for a subscriber until it is dropped or the client goes away"""
+        try:
+            yield f"retry: 3000\nevent: ready\ndata: {json.dumps({'topics': subscriber.topics})}\n\n"
+            while True:
+                frame = await subscriber.queue.get()
+                if frame is _CLOSED:
+                    return
+                yield frame
+        finally:
+            self.unsubscribe(subscriber)
+
+    async def _send_heartbeats(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            for subscriber in list(self._subscribers):
+                self._deliver(subscriber, HEARTBEAT_FRAME)
+
+    def start(self) -> None:
+        if self._heartbeat_task is None:
+            self._heartbeat_task = asyncio.create_task(self._send_heartbeats())
+
+    async def stop(self) -> None:
+        """Stop heartbeats and end every open stream"""
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        for subscriber in list(self._subscribers):
+            self.unsubscribe(subscriber)
+            while not subscriber.queue.empty():
+                subscriber.queue.get_nowait()
+            subscriber.queue.put_nowait(_CLOSED)
+
+    def stats(self) -> dict:
+        return {
+            "subscribers": len(self._subscribers),
+            "topics": len(self._topics),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
+
+def invitation_topic(invitation_id: int) -> str:
+    return f"invitation:{invitation_id}"
+
+def user_topic(user_id: int) -> str:
+    return f"user:{user_id}"
+
+hub = EventHub()
@@ -0,0 +1,70 @@
+# File: backend/exporter.py
+# Path: /inviter-app/backend/exporter.py
+# Description: Chunked CSV/NDJSON export of an invitation's responses and messages
+
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator
+
+from sqlalchemy import select
+
+from config import env_int
+from database import SessionLocal
+from models import Message, Response
+
+EXPORT_CHUNK_SIZE = env_int("EXPORT_CHUNK_SIZE", 1000)
+
+EXPORT_MEDIA_TYPES = {"csv": "text/csv", "ndjson": "application/x-ndjson"}
+
+# Columns exported for each record type, in output order
+EXPORT_COLUMNS = {
+    "responses": (
+        Response.id, Response.recipient_name, Response.recipient_phone, Response.answer,
+        Response.viewed_at, Response.responded_at, Response.reminder_sent_at,
+    ),
+    "messages": (
+        Message.id, Message.response_id, Message.sender_name, Message.content,
+        Message.is_read, Message.created_at,
+    ),
+}
+
+def _plain(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+def _csv_chunk(rows) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows([_plain(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+def _ndjson_chunk(names, rows) -> str:
+    return "".join(
+        json.dumps(dict(zip(names, (_plain(value) for value in row)))) + "\n"
+        for row in rows
+    )
+
+async def export_rows(invitation_id: int, records: str, fmt: str, chunk_size: int = EXPORT_CHUNK_SIZE) -> AsyncIterator[str]:
+    """
+    Yield the export as text chunks of up to chunk_size rows
+    Rows are streamed from a server-side cursor, so memory stays flat however
+    many rows the invitation has. Uses its own session because the generator
+    outlives the request handler.
+    """
+    columns = EXPORT_COLUMNS[records]
+    model = columns[0].class_
+    names = [column.key for column in columns]
+
+    if fmt == "csv":
+        yield _csv_chunk([names])  # Header goes out before the first query for a fast first byte
+
+    async with SessionLocal() as db:
+        result = await db.stream(
+            select(*columns)
+            .where(model.invitation_id == invitation_id)
+            .order_by(model.id)
+            .execution_options(yield_per=chunk_size)
+        )
+        async for rows in result.partitions():
+            yield _csv_chunk(rows) if fmt == "csv" else _ndjson_chunk(names, rows)
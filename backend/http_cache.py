@@ -0,0 +1,57 @@
+# File: backend/http_cache.py
+# Path: /inviter-app/backend/http_cache.py
+# Description: ETag / conditional-GET helpers and pre-serialized static JSON responses
+
+import hashlib
+import json
+from typing import Any
+
+from fastapi import Request, Response
+
+# Per-user data: browsers may store it but must revalidate before reuse
+PRIVATE_REVALIDATE = "private, no-cache"
+# Static data shared by every client
+PUBLIC_STATIC = "public, max-age=86400"
+
+def make_etag(*parts: Any) -> str:
+    """Strong ETag over the parts that determine a response body"""
+    digest = hashlib.blake2b("|".join(map(str, parts)).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match already names this ETag (weak or strong)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def not_modified(etag: str, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+
+def set_cache_headers(response: Response, etag: str, cache_control: str = PRIVATE_REVALIDATE) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+
+class StaticJSON:
+    """
+    A constant JSON payload serialized once at startup
+    Every request gets the same bytes and ETag, or a bodiless 304
+    """
+
+    def __init__(self, payload: Any, cache_control: str = PUBLIC_STATIC):
+        self.body = json.dumps(payload, separators=(",", ":")).encode()
+        self.etag = f'"{hashlib.blake2b(self.body, digest_size=16).hexdigest()}"'
+        self.cache_control = cache_control
+
+    def respond(self, request: Request) -> Response:
+        if etag_matches(request, self.etag):
+            return not_modified(self.etag, self.cache_control)
+        return Response(
+            content=self.body,
+            media_type="application/json",
+            headers={"ETag": self.etag, "Cache-Control": self.cache_control}
+        )
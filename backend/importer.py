@@ -0,0 +1,186 @@
+# File: backend/importer.py
+# Path: /inviter-app/backend/importer.py
+# Description: Streaming CSV/NDJSON recipient import with batched inserts
+
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Set, Tuple
+
+from config import env_int
+from phones import normalize_phone
+
+IMPORT_BATCH_SIZE = env_int("IMPORT_BATCH_SIZE", 1000)
+IMPORT_MAX_ERROR_DETAILS = env_int("IMPORT_MAX_ERROR_DETAILS", 1000)
+IMPORT_MAX_LINE_LENGTH = env_int("IMPORT_MAX_LINE_LENGTH", 4096)  # Characters; longer lines fail their row
+IMPORT_FORMATS = {"text/csv": "csv", "application/x-ndjson": "ndjson", "application/jsonl": "ndjson"}
+
+class ImportFormatError(ValueError):
+    """Raised when the upload cannot be parsed at all (e.g. missing CSV columns)"""
+
+async def iter_lines(
+    chunks: AsyncIterator[bytes], max_length: int = IMPORT_MAX_LINE_LENGTH
+) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    Decode a byte stream into (line number, line) pairs without buffering the whole body
+    Only each new chunk is split on newlines. A line longer than max_length is
+    yielded as None and the rest of it is dropped as it arrives, so memory stays
+    bounded even for an upload without any newlines.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    parts: List[str] = []  # Pieces of the unfinished line
+    length = 0  # Characters in the unfinished line, counted even once it is too long
+    number = 0
+    async for chunk in chunks:
+        lines = decoder.decode(chunk).split("\n")
+        tail = lines.pop()
+        if lines:
+            # The first piece finishes the line carried over from earlier chunks
+            length += len(lines[0])
+            parts.append(lines[0])
+            lines[0] = "".join(parts) if length <= max_length else None
+            parts, length = [], 0
+            for line in lines:
+                number += 1
+                if line is None or len(line) > max_length:
+                    yield number, None
+                else:
+                    yield number, line.rstrip("\r")
+
+        length += len(tail)
+        if length <= max_length:
+            parts.append(tail)
+        else:
+            parts = []
+
+    tail = decoder.decode(b"", final=True)
+    length += len(tail)
+    if length > max_length:
+        yield number + 1, None
+    elif length:
+        yield number + 1, ("".join(parts) + tail).rstrip("\r")
+
+def line_too_long() -> str:
+    return f"Line is longer than {IMPORT_MAX_LINE_LENGTH} characters"
+
+async def iter_csv_rows(lines: AsyncIterator[Tuple[int, str]]) -> AsyncIterator[Tuple[int, object]]:
+    """
+    Yield (line number, row dict or error) for a CSV with a header row
+    Quoted fields may not span lines
+    """
+    columns = None
+    async for number, line in lines:
+        if line is None:
+            if columns is None:
+                raise ImportFormatError(f"CSV header: {line_too_long()}")
+            yield number, line_too_long()
+            continue
+        if not line.strip():
+            continue
+        try:
+            values = next(csv.reader([line]))
+        except csv.Error as e:
+            yield number, f"Malformed CSV: {e}"
+            continue
+
+        if columns is None:
+            columns = [value.strip().lower() for value in values]
+            if "name" not in columns or "phone" not in columns:
+                raise ImportFormatError("CSV header must include 'name' and 'phone' columns")
+            continue
+        yield number, dict(zip(columns, values))
+
+async def iter_ndjson_rows(lines: AsyncIterator[Tuple[int, str]]) -> AsyncIterator[Tuple[int, object]]:
+    """Yield (line number, row dict or error) for newline-delimited JSON objects"""
+    async for number, line in lines:
+        if line is None:
+            yield number, line_too_long()
+            continue
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield number, f"Malformed JSON: {e.msg}"
+            continue
+        yield number, row if isinstance(row, dict) else "Each line must be a JSON object"
+
+def validate_row(row) -> Tuple[Optional[Tuple[str, str]], Optional[str]]:
+    """Returns ((name, E.164 phone), None) or (None, error)"""
+    if isinstance(row, str):
+        return None, row
+
+    name = str(row.get("name") or "").strip()
+    phone = str(row.get("phone") or "").strip()
+    if not name:
+        return None, "Missing name"
+    if not phone:
+        return None, "Missing phone"
+    if len(name) > 255:
+        return None, "Name is too long"
+    try:
+        return (name, normalize_phone(phone)), None
+    except ValueError as e:
+        return None, str(e)
+
+class ImportReport:
+    """Per-row outcome of an import; error details are capped, counts are not"""
+
+    def __init__(self):
+        self.imported = 0
+        self.duplicates = 0
+        self.error_count = 0
+        self.errors: List[dict] = []
+
+    def add_error(self, line: int, error: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < IMPORT_MAX_ERROR_DETAILS:
+            self.errors.append({"line": line, "error": error})
+
+    def as_dict(self) -> dict:
+        return {
+            "imported": self.imported,
+            "duplicates": self.duplicates,
+            "error_count": self.error_count,
+            "errors": self.errors,
+            "errors_truncated": self.error_count > len(self.errors),
+        }
+
+async def import_recipients(
+    chunks: AsyncIterator[bytes],
+    fmt: str,
+    seen_phones: Set[str],
+    write_batch: Callable[[List[Tuple[str, str]]], Awaitable[None]],
+    batch_size: int = IMPORT_BATCH_SIZE
+) -> ImportReport:
+    """
+    Stream recipients out of an upload, validating rows as they arrive
+    Valid, previously unseen recipients are handed to write_batch in groups of
+    batch_size, so memory is bounded by the batch rather than the upload
+    (plus the set of phone numbers used for de-duplication)
+    """
+    lines = iter_lines(chunks)
+    rows = iter_csv_rows(lines) if fmt == "csv" else iter_ndjson_rows(lines)
+    report = ImportReport()
+    batch: List[Tuple[str, str]] = []
+
+    async for line, row in rows:
+        recipient, error = validate_row(row)
+        if error:
+            report.add_error(line, error)
+            continue
+        if recipient[1] in seen_phones:
+            report.duplicates += 1
+            continue
+
+        seen_phones.add(recipient[1])
+        batch.append(recipient)
+        if len(batch) >= batch_size:
+            await write_batch(batch)
+            report.imported += len(batch)
+            batch = []
+
+    if batch:
+        await write_batch(batch)
+        report.imported += len(batch)
+    return report
@@ -1,6 +1,13 @@
+import asyncio
+
 from database import engine
 from models import Base
 
-# Create all tables
-Base.metadata.create_all(bind=engine)
-print("Database tables created!")
\ No newline at end of file
+async def main():
+    # Create all tables
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    await engine.dispose()
+
+asyncio.run(main())
+print("Database tables created!")
@@ -2,12 +2,14 @@
 # Path: /inviter-app/backend/main.py
 # Description: Main FastAPI application entry point with all routes and configurations
 
-from fastapi import FastAPI, HTTPException, Depends, status
+import asyncio
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response as FastAPIResponse, status
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional
-from datetime import datetime, timedelta
-import secrets
+from datetime import datetime
 from pydantic import BaseModel
 
 # Import your schemas (keep your existing schemas.py file as is)
@@ -15,12 +17,40 @@ from schemas import (
     UserCreate, UserResponse, InvitationCreate, InvitationResponse,
     ResponseCreate, ResponseUpdate, MessageCreate, DashboardAnalytics
 )
+from database import engine, get_db, pool_status
+from models import Base
+from crud import (
+    create_invitation_with_recipients, list_invitations,
+    get_response_page as load_response_page, submit_response as save_response,
+    mark_message_read, get_invitation, get_invitation_details as load_invitation_details,
+    get_invitation_version, add_recipients, existing_recipient_phones, invitation_to_dict,
+    claim_message, release_message
+)
+from importer import IMPORT_FORMATS, ImportFormatError, import_recipients
+from exporter import EXPORT_MEDIA_TYPES, export_rows
+from rollups import get_dashboard, get_user_version
+from cache import cache_stats
+from serialization import DefaultResponse, trusted
+from http_cache import StaticJSON, etag_matches, make_etag, not_modified, set_cache_headers
+from auth import (
+    create_access_token, create_stream_token, get_current_user_id, get_stream_user_id,
+    password_hasher, HasherOverloaded, STREAM_TOKEN_EXPIRE_SECONDS
+)
+from events import hub, invitation_topic, user_topic
+from state import EmailTaken, user_store
+from views import view_buffer
+from writer import WRITE_QUEUE_ENABLED, WriterOverloaded, response_writer
+from reminders import REMINDER_INTERVAL_SECONDS, run_scheduler as run_reminder_scheduler
+from sms import SMSMessage, dispatcher_stats, get_dispatcher, shutdown_dispatcher
+from metrics import MetricsMiddleware, instrument_engine, registry as metrics_registry, render_metrics
+from utils import build_response_link, format_invitation_sms
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Inviter API",
     description="Modern invitation management system",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=DefaultResponse
 )
 
 # CORS middleware for web app access
@@ -30,28 +60,84 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],
 )
+app.add_middleware(MetricsMiddleware)
+instrument_engine(engine)
+
+async def create_tables(attempts: int = 3) -> None:
+    """
+    Create missing tables
+    Workers started together against a new database race to create them; a worker
+    that loses (table already exists, or locked) retries and then finds them in place.
+    """
+    for attempt in range(1, attempts + 1):
+        try:
+            async with engine.begin() as conn:
+                await conn.run_sync(Base.metadata.create_all)
+            return
+        except DBAPIError:
+            if attempt == attempts:
+                raise
+            await asyncio.sleep(0.2 * attempt)
 
-# ==================== MOCK DATA STORE (for testing without database) ====================
-# This replaces the database temporarily
-mock_users = {}
-mock_invitations = []
-mock_tokens = {}
+@app.on_event("startup")
+async def startup():
+    await create_tables()
+    hub.start()
+    view_buffer.start()
+    if WRITE_QUEUE_ENABLED:
+        response_writer.start()
+    if REMINDER_INTERVAL_SECONDS > 0:
+        app.state.reminder_task = asyncio.create_task(run_reminder_scheduler())
+
+@app.on_event("shutdown")
+async def shutdown():
+    reminder_task = getattr(app.state, "reminder_task", None)
+    if reminder_task is not None:
+        reminder_task.cancel()
+        await asyncio.gather(reminder_task, return_exceptions=True)
+    # Close live streams, then let in-flight SMS batches finish before the process exits
+    await hub.stop()
+    await response_writer.stop()
+    await view_buffer.stop()
+    await shutdown_dispatcher()
+    password_hasher.shutdown()
+    await engine.dispose()
 
 # ==================== HELPER FUNCTIONS ====================
-def create_mock_token(user_id: str):
-    """Create a mock authentication token"""
-    token = f"mock-token-{secrets.token_hex(16)}"
-    mock_tokens[token] = user_id
-    return token
-
-def get_current_user_mock(token: str):
-    """Mock function to get current user from token"""
-    # In real app, this would decode JWT and query database
-    if token in mock_tokens:
-        user_id = mock_tokens[token]
-        return mock_users.get(user_id)
-    return None
+def public_user(user: dict) -> dict:
+    """User fields that are safe to return to clients"""
+    return {key: value for key, value in user.items() if key != "hashed_password"}
+
+async def lookup_user(email: str) -> dict:
+    user = await user_store.get(email)
+    if not user:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return user
+
+async def get_current_user(email: str = Depends(get_current_user_id)) -> dict:
+    """Dependency resolving the authenticated user from the Bearer token"""
+    return await lookup_user(email)
+
+def invitation_messages(recipients: List[dict], sender_name: str, invitation: dict) -> List[SMSMessage]:
+    """One SMS per inserted Response row"""
+    return [
+        SMSMessage(
+            to=recipient["recipient_phone"],
+            body=format_invitation_sms(
+                recipient["recipient_name"], sender_name, invitation,
+                build_response_link(recipient["response_link"])
+            )
+        )
+        for recipient in recipients
+    ]
+
+def overloaded() -> HTTPException:
+    """503 for when the password hashing pool is saturated"""
+    return HTTPException(
+        status_code=503, detail="Too many sign-in attempts, please retry", headers={"Retry-After": "1"}
+    )
 
 # ==================== BASIC ROUTES ====================
 @app.get("/")
@@ -63,9 +149,39 @@ async def health_check():
     return {
         "status": "healthy",
         "timestamp": datetime.utcnow(),
-        "version": "1.0.0"
+        "version": "1.0.0",
+        "caches": cache_stats(),
+        "events": hub.stats(),
+        "database": pool_status(),
+        "writer": response_writer.status(),
+        "views": view_buffer.status()
     }
 
+# Component state sampled on each scrape
+metrics_registry.collect("db_pool_checked_out", "Connections checked out of the pool",
+                         lambda: pool_status().get("checked_out"))
+metrics_registry.collect("db_pool_overflow", "Connections open beyond the pool size",
+                         lambda: pool_status().get("overflow"))
+metrics_registry.collect("db_pool_checkouts_total", "Pool checkouts", lambda: pool_status()["checkouts"], "counter")
+metrics_registry.collect("db_pool_wait_seconds_total", "Time spent waiting for a pooled connection",
+                         lambda: pool_status()["wait_seconds_total"], "counter")
+metrics_registry.collect("db_pool_timeouts_total", "Pool checkouts that timed out",
+                         lambda: pool_status()["timeouts"], "counter")
+metrics_registry.collect("sms_queue_depth", "Messages accepted but not yet sent",
+                         lambda: dispatcher_stats().queued if dispatcher_stats() else 0)
+metrics_registry.collect("sms_sent_total", "SMS delivered",
+                         lambda: dispatcher_stats().sent if dispatcher_stats() else 0, "counter")
+metrics_registry.collect("sms_failed_total", "SMS that failed after retries",
+                         lambda: dispatcher_stats().failed if dispatcher_stats() else 0, "counter")
+metrics_registry.collect("rsvp_writer_queue_depth", "RSVPs waiting for the group-commit writer",
+                         lambda: response_writer.status()["queued"])
+metrics_registry.collect("events_subscribers", "Open live event streams", lambda: hub.stats()["subscribers"])
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint"""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 # ==================== AUTH ROUTES ====================
 class LoginRequest(BaseModel):
     email: str
@@ -74,25 +190,28 @@ class LoginRequest(BaseModel):
 @app.post("/auth/signup", response_model=UserResponse)
 async def signup(user_data: UserCreate):
     """Create new user account"""
-    # Check if user exists
-    if user_data.email in mock_users:
+    # Cheap early check; the store's unique email is what actually prevents duplicates
+    if await user_store.get(user_data.email, fresh=True):
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Create mock user
-    user_id = len(mock_users) + 1
-    mock_user = {
-        "id": user_id,
-        "email": user_data.email,
-        "name": user_data.name,
-        "created_at": datetime.utcnow()
-    }
-    mock_users[user_data.email] = mock_user
+    # Hash off the event loop; OAuth users have no password
+    hashed_password = None
+    if user_data.password:
+        try:
+            hashed_password = await password_hasher.hash(user_data.password)
+        except HasherOverloaded:
+            raise overloaded()
+    
+    try:
+        user = await user_store.create(user_data.email, user_data.name, hashed_password)
+    except EmailTaken:
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Generate token
-    access_token = create_mock_token(user_data.email)
+    access_token = create_access_token({"sub": user_data.email})
     
     return {
-        "id": user_id,
+        "id": user["id"],
         "email": user_data.email,
         "name": user_data.name,
         "access_token": access_token,
@@ -102,246 +221,339 @@ async def signup(user_data: UserCreate):
 @app.post("/auth/login")
 async def login(login_data: LoginRequest):
     """Login with email and password"""
-    # Mock login - accept any password for demo
-    if login_data.email not in mock_users:
+    user = await user_store.get(login_data.email, fresh=True)
+    if not user or not user["hashed_password"]:
         raise HTTPException(status_code=401, detail="Invalid credentials")
     
-    user = mock_users[login_data.email]
-    access_token = create_mock_token(login_data.email)
+    try:
+        valid, new_hash = await password_hasher.verify_and_update(
+            login_data.password, user["hashed_password"]
+        )
+    except HasherOverloaded:
+        raise overloaded()
+    if not valid:
+        raise HTTPException(status_code=401, detail="Invalid credentials")
+    if new_hash:
+        # Work factor changed since this hash was made
+        await user_store.set_password(user, new_hash)
+    
+    access_token = create_access_token({"sub": login_data.email})
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": user
+        "user": public_user(user)
     }
 
 @app.get("/auth/me")
-async def get_current_user(authorization: str = None):
+async def get_current_user_profile(user: dict = Depends(get_current_user)):
     """Get current user info"""
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Not authenticated")
-    
-    token = authorization.replace("Bearer ", "")
-    user = get_current_user_mock(token)
-    
-    if not user:
-        raise HTTPException(status_code=401, detail="Invalid token")
-    
-    return user
+    return public_user(user)
 
 # ==================== INVITATION ROUTES ====================
 @app.post("/invitations", response_model=InvitationResponse)
-async def create_invitation(invitation: InvitationCreate):
+async def create_invitation(
+    invitation: InvitationCreate,
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     """Create a new invitation"""
-    # Create mock invitation
-    new_invitation = {
-        "id": len(mock_invitations) + 1,
-        "title": invitation.title,
-        "description": invitation.description,
-        "event_type": invitation.event_type,
-        "event_date": invitation.event_date,
-        "location": invitation.location,
-        "yes_text": invitation.yes_text,
-        "no_text": invitation.no_text,
-        "creator_id": 1,  # Mock user ID
-        "expires_at": invitation.expires_at,
-        "created_at": datetime.utcnow(),
-        "total_sent": len(invitation.recipients),
-        "total_yes": 0,
-        "total_no": 0,
-        "total_pending": len(invitation.recipients),
-        "total_messages": 0
-    }
-    
-    mock_invitations.append(new_invitation)
+    new_invitation, recipients = await create_invitation_with_recipients(
+        db, creator_id=user["id"], invitation=invitation
+    )
+
+    # Hand recipients to the dispatch engine; delivery happens in the background
+    get_dispatcher().submit(invitation_messages(recipients, user["name"], new_invitation))
+    hub.publish([user_topic(user["id"])], "invitation", new_invitation)
+
     return new_invitation
 
 @app.get("/invitations", response_model=List[InvitationResponse])
-async def get_invitations(status: Optional[str] = None):
-    """Get all invitations for current user"""
-    # Return mock invitations with some sample data
-    if not mock_invitations:
-        # Add some sample data
-        sample_invitations = [
-            {
-                "id": 1,
-                "title": "Team Standup - Project Kickoff",
-                "description": "Weekly team sync to discuss project progress",
-                "event_type": "meeting",
-                "event_date": datetime.utcnow() + timedelta(days=2),
-                "location": "Zoom Meeting",
-                "yes_text": "I'll join",
-                "no_text": "Can't make it",
-                "creator_id": 1,
-                "expires_at": datetime.utcnow() + timedelta(days=5),
-                "created_at": datetime.utcnow() - timedelta(hours=2),
-                "total_sent": 24,
-                "total_yes": 15,
-                "total_no": 3,
-                "total_pending": 6,
-                "total_messages": 5
-            },
-            {
-                "id": 2,
-                "title": "Sarah's Birthday Party",
-                "description": "Come celebrate Sarah's 30th birthday!",
-                "event_type": "birthday",
-                "event_date": datetime.utcnow() - timedelta(days=10),
-                "location": "123 Party Street",
-                "yes_text": "Count me in!",
-                "no_text": "Sorry, can't attend",
-                "creator_id": 1,
-                "expires_at": datetime.utcnow() - timedelta(days=5),
-                "created_at": datetime.utcnow() - timedelta(days=20),
-                "total_sent": 45,
-                "total_yes": 38,
-                "total_no": 4,
-                "total_pending": 3,
-                "total_messages": 0
-            },
-            {
-                "id": 3,
-                "title": "Q1 2025 Planning Session",
-                "description": "Strategic planning for Q1",
-                "event_type": "meeting",
-                "event_date": datetime.utcnow() + timedelta(days=3),
-                "location": "Conference Room A",
-                "yes_text": "I'll attend",
-                "no_text": "Can't make it",
-                "creator_id": 1,
-                "expires_at": datetime.utcnow() + timedelta(days=3),
-                "created_at": datetime.utcnow() - timedelta(days=1),
-                "total_sent": 12,
-                "total_yes": 7,
-                "total_no": 1,
-                "total_pending": 4,
-                "total_messages": 2
-            }
-        ]
-        return sample_invitations
-    
-    return mock_invitations
+async def get_invitations(
+    request: Request,
+    response: FastAPIResponse,
+    status: Optional[str] = Query(None, description="active, expired or past"),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get a page of invitations for current user; the next page's cursor is in X-Next-Cursor
+    Answers 304 when the user's data has not changed since the client's ETag
+    """
+    # Status filters depend on the clock as well as the data, so those pages age out every minute
+    clock = datetime.utcnow().strftime("%Y%m%d%H%M") if status else None
+    version = await get_user_version(db, user["id"])
+    etag = make_etag("invitations", user["id"], version, status, cursor, limit, clock)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    try:
+        page, next_cursor = await list_invitations(
+            db, creator_id=user["id"], status=status, cursor=cursor, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    set_cache_headers(response, etag)
+    return trusted(page, response)
+
+@app.post("/invitations/{invitation_id}/recipients/import")
+async def import_invitation_recipients(
+    invitation_id: int,
+    request: Request,
+    format: Optional[str] = Query(None, description="csv or ndjson; defaults from Content-Type"),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Stream recipients into an invitation from a CSV (name,phone header) or NDJSON body
+    Rows are validated as they arrive and inserted in batches; not limited to 1000 recipients
+    """
+    invitation = await get_invitation(db, invitation_id, user["id"])
+    if not invitation:
+        raise HTTPException(status_code=404, detail="Invitation not found")
+    # Closed to responses, so new recipients could only be sent a dead link
+    if invitation.expires_at and invitation.expires_at <= datetime.utcnow():
+        raise HTTPException(status_code=410, detail="This invitation has expired")
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    fmt = format or IMPORT_FORMATS.get(content_type)
+    if fmt not in ("csv", "ndjson"):
+        raise HTTPException(status_code=415, detail="Upload must be text/csv or application/x-ndjson")
+
+    invitation_data = invitation_to_dict(invitation)
+    dispatcher = get_dispatcher()
+
+    async def write_batch(batch):
+        rows = await add_recipients(db, invitation_id, user["id"], batch)
+        dispatcher.submit(invitation_messages(rows, user["name"], invitation_data))
+
+    try:
+        report = await import_recipients(
+            request.stream(), fmt, await existing_recipient_phones(db, invitation_id), write_batch
+        )
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return report.as_dict()
+
+@app.get("/invitations/{invitation_id}/export")
+async def export_invitation(
+    invitation_id: int,
+    records: str = Query("responses", pattern="^(responses|messages)$"),
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Stream an invitation's responses or messages as CSV or NDJSON"""
+    if not await get_invitation(db, invitation_id, user["id"]):
+        raise HTTPException(status_code=404, detail="Invitation not found")
+
+    filename = f"invitation-{invitation_id}-{records}.{format}"
+    return StreamingResponse(
+        export_rows(invitation_id, records, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
 
 @app.get("/invitations/{invitation_id}")
-async def get_invitation_details(invitation_id: int):
-    """Get detailed information about a specific invitation"""
-    # Mock response
-    return {
-        "invitation": {
-            "id": invitation_id,
-            "title": "Team Meeting",
-            "description": "Weekly sync",
-            "event_type": "meeting",
-            "event_date": datetime.utcnow() + timedelta(days=1),
-            "total_sent": 10,
-            "total_yes": 7,
-            "total_no": 1,
-            "total_pending": 2,
-            "total_messages": 3,
-            "created_at": datetime.utcnow() - timedelta(days=1)
-        },
-        "responses": [],
-        "messages": [],
-        "statistics": {
-            "total_sent": 10,
-            "total_responded": 8,
-            "total_yes": 7,
-            "total_no": 1,
-            "total_viewed": 9,
-            "response_rate": 80.0
-        }
-    }
+async def get_invitation_details(
+    invitation_id: int,
+    request: Request,
+    response: FastAPIResponse,
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Get detailed information about a specific invitation
+    Versioned by the invitation's updated_at, so an unchanged invitation answers 304
+    """
+    version = await get_invitation_version(db, invitation_id, user["id"])
+    if version is None:
+        raise HTTPException(status_code=404, detail="Invitation not found")
+    etag = make_etag("invitation", invitation_id, *version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    details = await load_invitation_details(db, invitation_id, user["id"])
+    set_cache_headers(response, etag)
+    return trusted(details, response)
 
 # ==================== RESPONSE ROUTES (Public) ====================
+async def _load_open_invitation(db: AsyncSession, response_link: str):
+    """Resolve a response link, rejecting unknown links and expired invitations"""
+    page = await load_response_page(db, response_link)
+    if page is None:
+        raise HTTPException(status_code=404, detail="Invitation not found")
+
+    entry, invitation = page
+    if invitation["expires_at"] and invitation["expires_at"] <= datetime.utcnow():
+        raise HTTPException(status_code=410, detail="This invitation has expired")
+    return entry, invitation
+
 @app.get("/respond/{response_link}")
-async def get_response_page(response_link: str):
+async def get_response_page(response_link: str, db: AsyncSession = Depends(get_db)):
     """Get invitation details for response page (public endpoint)"""
-    # Mock response
+    entry, invitation = await _load_open_invitation(db, response_link)
+    # The flag lives on the cached entry, so re-opening the link does not record the view again
+    if not entry["viewed"] and view_buffer.record(entry["response_id"], entry["invitation_id"]):
+        entry["viewed"] = True
     return {
-        "invitation": {
-            "title": "Team Meeting",
-            "description": "Join us for our weekly team sync",
-            "event_date": datetime.utcnow() + timedelta(days=1),
-            "location": "Zoom Meeting",
-            "yes_text": "I'll join",
-            "no_text": "Can't make it",
-            "creator_name": "John Doe"
-        },
-        "recipient_name": "Jane Smith",
-        "has_responded": False,
-        "previous_answer": None
+        "invitation": invitation,
+        "recipient_name": entry["recipient_name"],
+        "has_responded": entry["answer"] is not None,
+        "previous_answer": entry["answer"]
     }
 
 @app.post("/respond/{response_link}")
-async def submit_response(response_link: str, answer: str, message: Optional[str] = None):
-    """Submit response to invitation (public endpoint)"""
-    if answer not in ["yes", "no"]:
-        raise HTTPException(status_code=400, detail="Answer must be 'yes' or 'no'")
-    
+async def submit_response(response_link: str, response: ResponseUpdate, db: AsyncSession = Depends(get_db)):
+    """
+    Submit response to invitation (public endpoint)
+    Idempotent per link: the database decides whether the answer changes, and the same
+    message sent again within RSVP_DEDUP_SECONDS is stored once
+    """
+    entry, _ = await _load_open_invitation(db, response_link)
+    store_message = await claim_message(response_link, response)
+    data = response if store_message or not response.message else response.model_copy(update={"message": None})
+    stored = False
+    try:
+        if response_writer.running:
+            # Release the connection while queued; the writer uses its own session
+            await db.close()
+            try:
+                change = await response_writer.submit(response_link, entry, data)
+            except WriterOverloaded:
+                raise HTTPException(status_code=503, detail="Too many responses, please retry", headers={"Retry-After": "1"})
+        else:
+            change = await save_response(db, response_link, entry, data)
+        stored = True
+    finally:
+        if store_message:
+            release_message(response_link, response, stored)
+
+    # Push to live dashboards watching this invitation or its creator; a repeated
+    # answer changed nothing, so it sends nothing
+    topics = [invitation_topic(entry["invitation_id"]), user_topic(entry["creator_id"])]
+    event = {
+        "invitation_id": entry["invitation_id"],
+        "response_id": entry["response_id"],
+        "recipient_name": entry["recipient_name"],
+        "answer": response.answer,
+        "previous_answer": change.previous,
+    }
+    if change.changed:
+        hub.publish(topics, "response", event)
+    if data.message:
+        hub.publish(topics, "message", {**event, "content": data.message})
+
     return {
         "status": "success",
         "message": "Thank you for your response!",
-        "answer": answer
+        "answer": response.answer
     }
 
+# ==================== MESSAGE ROUTES ====================
+@app.put("/messages/{message_id}/read")
+async def mark_message_as_read(
+    message_id: int,
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
+    """Mark a recipient message as read"""
+    if not await mark_message_read(db, message_id, creator_id=user["id"]):
+        raise HTTPException(status_code=404, detail="Message not found")
+    return {"status": "success"}
+
+# ==================== LIVE EVENTS ====================
+@app.post("/events/token")
+async def issue_stream_token(email: str = Depends(get_current_user_id)):
+    """
+    Short-lived token for opening /events/stream with ?stream_token=
+    EventSource cannot send an Authorization header; this keeps the access token out of URLs
+    """
+    return {"stream_token": create_stream_token(email), "expires_in": STREAM_TOKEN_EXPIRE_SECONDS}
+
+@app.get("/events/stream")
+async def stream_events(
+    invitation_id: Optional[int] = None,
+    email: str = Depends(get_stream_user_id),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Server-Sent Events feed of responses and messages
+    Covers all of the user's invitations, or just one when invitation_id is given
+    """
+    user = await lookup_user(email)
+    if invitation_id is not None:
+        if not await get_invitation(db, invitation_id, user["id"]):
+            raise HTTPException(status_code=404, detail="Invitation not found")
+        topics = [invitation_topic(invitation_id)]
+    else:
+        topics = [user_topic(user["id"])]
+    # Release the connection now; the stream can stay open for hours
+    await db.close()
+
+    subscriber = hub.subscribe(topics)
+    return StreamingResponse(
+        hub.stream(subscriber),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 # ==================== ANALYTICS ROUTES ====================
 @app.get("/analytics/dashboard", response_model=DashboardAnalytics)
-async def get_dashboard_analytics():
+async def get_dashboard_analytics(
+    user: dict = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+):
     """Get dashboard statistics for the current user"""
-    # Mock analytics data
-    return {
-        "total_invitations": len(mock_invitations) if mock_invitations else 3,
-        "total_responses_sent": 81,
-        "response_rate": 87.5,
-        "pending_responses": 10,
-        "total_accepted": 65,
-        "total_declined": 6,
-        "unread_messages": 2,
-        "recent_activity": {
-            "last_week_invitations": 2,
-            "last_week_responses": 15
+    return await get_dashboard(db, user_id=user["id"], now=datetime.utcnow())
+
+# ==================== TEMPLATE ROUTES ====================
+# Serialized once at import; every request reuses the same bytes and ETag
+TEMPLATES = StaticJSON([
+    {
+        "id": "meeting_virtual",
+        "name": "Virtual Meeting",
+        "category": "Professional",
+        "preview": {
+            "title": "Team Meeting",
+            "description": "Join us for our weekly team sync",
+            "yes_text": "I'll join",
+            "no_text": "Can't make it"
+        }
+    },
+    {
+        "id": "birthday_party",
+        "name": "Birthday Party",
+        "category": "Social",
+        "preview": {
+            "title": "Birthday Celebration",
+            "description": "You're invited to celebrate!",
+            "yes_text": "Count me in!",
+            "no_text": "Sorry, can't attend"
+        }
+    },
+    {
+        "id": "wedding",
+        "name": "Wedding",
+        "category": "Formal",
+        "preview": {
+            "title": "Wedding Invitation",
+            "description": "We request the honor of your presence",
+            "yes_text": "Joyfully accept",
+            "no_text": "Regretfully decline"
         }
     }
+])
 
-# ==================== TEMPLATE ROUTES ====================
 @app.get("/templates")
-async def get_invitation_templates():
+async def get_invitation_templates(request: Request):
     """Get available invitation templates"""
-    return [
-        {
-            "id": "meeting_virtual",
-            "name": "Virtual Meeting",
-            "category": "Professional",
-            "preview": {
-                "title": "Team Meeting",
-                "description": "Join us for our weekly team sync",
-                "yes_text": "I'll join",
-                "no_text": "Can't make it"
-            }
-        },
-        {
-            "id": "birthday_party",
-            "name": "Birthday Party",
-            "category": "Social",
-            "preview": {
-                "title": "Birthday Celebration",
-                "description": "You're invited to celebrate!",
-                "yes_text": "Count me in!",
-                "no_text": "Sorry, can't attend"
-            }
-        },
-        {
-            "id": "wedding",
-            "name": "Wedding",
-            "category": "Formal",
-            "preview": {
-                "title": "Wedding Invitation",
-                "description": "We request the honor of your presence",
-                "yes_text": "Joyfully accept",
-                "no_text": "Regretfully decline"
-            }
-        }
-    ]
+    return TEMPLATES.respond(request)
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,251 @@
+# File: backend/metrics.py
+# Path: /inviter-app/backend/metrics.py
+# Description: In-process request, database and SMS metrics rendered in Prometheus text format
+
+import bisect
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+
+from config import env_float, env_int
+
+logger = logging.getLogger(__name__)
+
+# Requests slower than this are logged with the SQL they ran; 0 disables the log
+SLOW_REQUEST_MS = env_float("SLOW_REQUEST_MS", 0)
+SLOW_REQUEST_MAX_STATEMENTS = env_int("SLOW_REQUEST_MAX_STATEMENTS", 50)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+LabelValues = Tuple[str, ...]
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def _format_labels(names: Iterable[str], values: Iterable) -> str:
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return f"{{{pairs}}}" if pairs else ""
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+class Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.labels = labels
+
+    def samples(self) -> Iterable[Tuple[str, str, float]]:
+        """(sample name, formatted labels, value) triples"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(f"{name}{labels} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = ()):
+        super().__init__(name, help, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *label_values, amount: float = 1) -> None:
+        self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def samples(self):
+        for values, total in self._values.items():
+            yield self.name, _format_labels(self.labels, values), total
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, *label_values, amount: float = 1) -> None:
+        self.inc(*label_values, amount=-amount)
+
+class Histogram(Metric):
+    """Cumulative-bucket histogram; buckets are stored per label set as plain counts"""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+        self._series: Dict[LabelValues, list] = {}  # label values -> [bucket counts..., sum, count]
+
+    def observe(self, value: float, *label_values) -> None:
+        series = self._series.get(label_values)
+        if series is None:
+            series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):  # Larger values only show up in +Inf, which is the count
+            series[index] += 1
+        series[-2] += value
+        series[-1] += 1
+
+    def samples(self):
+        for values, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                yield f"{self.name}_bucket", _format_labels(self.labels + ("le",), values + (f"{bound:g}",)), cumulative
+            yield f"{self.name}_bucket", _format_labels(self.labels + ("le",), values + ("+Inf",)), series[-1]
+            yield f"{self.name}_sum", _format_labels(self.labels, values), series[-2]
+            yield f"{self.name}_count", _format_labels(self.labels, values), series[-1]
+
+class Collected(Metric):
+    """A metric read from another component's stats when scraped"""
+
+    def __init__(self, name: str, help: str, kind: str, collect: Callable[[], Optional[float]]):
+        super().__init__(name, help)
+        self.kind = kind
+        self.collect = collect
+
+    def samples(self):
+        value = self.collect()
+        if value is not None:
+            yield self.name, "", value
+
+class Registry:
+    def __init__(self):
+        self.metrics: List[Metric] = []
+
+    def add(self, metric: Metric) -> Metric:
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, help: str, labels: Tuple[str, ...] = ()) -> Counter:
+        return self.add(Counter(name, help, labels))
+
+    def gauge(self, name: str, help: str, labels: Tuple[str, ...] = ()) -> Gauge:
+        return self.add(Gauge(name, help, labels))
+
+    def histogram(self, name: str, help: str, labels: Tuple[str, ...] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self.add(Histogram(name, help, labels, buckets))
+
+    def collect(self, name: str, help: str, collect: Callable[[], Optional[float]], kind: str = "gauge") -> None:
+        self.add(Collected(name, help, kind, collect))
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+registry = Registry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+http_latency = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency", ("method", "route")
+)
+http_in_flight = registry.gauge("http_requests_in_flight", "HTTP requests being served")
+request_queries = registry.histogram(
+    "http_request_db_queries", "SQL statements executed per request", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+request_db_time = registry.histogram(
+    "http_request_db_duration_seconds", "Time spent in SQL per request", ("method", "route")
+)
+db_queries = registry.counter("db_queries_total", "SQL statements executed")
+db_query_time = registry.histogram("db_query_duration_seconds", "SQL statement latency")
+sms_send_time = registry.histogram(
+    "sms_send_duration_seconds", "Time to deliver one SMS, including rate limiting and retries", ("outcome",)
+)
+
+# ==================== PER-REQUEST QUERY TRACKING ====================
+class RequestQueries:
+    """SQL issued while serving one request; statements are kept only for the slow-request log"""
+    __slots__ = ("count", "seconds", "statements")
+
+    def __init__(self, keep_statements: bool):
+        self.count = 0
+        self.seconds = 0.0
+        self.statements: Optional[List[Tuple[float, str]]] = [] if keep_statements else None
+
+_current_request: ContextVar[Optional[RequestQueries]] = ContextVar("current_request", default=None)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    db_queries.inc()
+    db_query_time.observe(elapsed)
+    tracker = _current_request.get()
+    if tracker is not None:
+        tracker.count += 1
+        tracker.seconds += elapsed
+        if tracker.statements is not None and len(tracker.statements) < SLOW_REQUEST_MAX_STATEMENTS:
+            tracker.statements.append((elapsed, statement))
+
+def instrument_engine(engine) -> None:
+    """Time every statement on the engine; async engines are instrumented through their sync core"""
+    target = getattr(engine, "sync_engine", engine)
+    event.listen(target, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+# ==================== ASGI MIDDLEWARE ====================
+class MetricsMiddleware:
+    """
+    Records latency, status and SQL usage per route template
+    Written as plain ASGI so streaming responses (SSE, exports) pass through untouched;
+    their duration is measured until the stream ends.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        tracker = RequestQueries(keep_statements=SLOW_REQUEST_MS > 0)
+        token = _current_request.set(tracker)
+        http_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_in_flight.dec()
+            _current_request.reset(token)
+
+            # The router stores the matched route in the scope, so labels use the
+            # template (/respond/{response_link}) instead of one series per link
+            route = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            method = scope["method"]
+            http_requests.inc(method, path, str(status))
+            http_latency.observe(elapsed, method, path)
+            request_queries.observe(tracker.count, method, path)
+            request_db_time.observe(tracker.seconds, method, path)
+            if SLOW_REQUEST_MS and elapsed * 1000 >= SLOW_REQUEST_MS:
+                _log_slow_request(method, scope["path"], status, elapsed, tracker)
+
+def _log_slow_request(method: str, path: str, status: int, elapsed: float, tracker: RequestQueries) -> None:
+    statements = "\n".join(
+        f"  {seconds * 1000:8.2f} ms  {' '.join(statement.split())}" for seconds, statement in tracker.statements
+    )
+    logger.warning(
+        "Slow request %s %s -> %d in %.1f ms, %d statement(s) taking %.1f ms\n%s",
+        method, path, status, elapsed * 1000, tracker.count, tracker.seconds * 1000, statements
+    )
+
+def render_metrics() -> str:
+    return registry.render()
@@ -0,0 +1,54 @@
+# File: backend/migrate_links.py
+# Path: /inviter-app/backend/migrate_links.py
+# Description: One-off migration of stored response links from full URLs to bare tokens
+#
+# Usage: python migrate_links.py   (safe to re-run; already-migrated rows are skipped)
+
+import asyncio
+
+from sqlalchemy import bindparam, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import Response
+
+async def strip_link_urls(db: AsyncSession, batch_size: int = 1000) -> int:
+    """
+    Rewrite response_link values like https://host/respond/<token> to <token>
+    Legacy tokens are 20 hex characters and keep resolving after the rewrite,
+    so links in SMS messages already sent stay valid
+    """
+    table = Response.__table__
+    migrated = 0
+    while True:
+        rows = (await db.execute(
+            select(Response.id, Response.response_link)
+            .where(Response.response_link.like("%/%"))
+            .limit(batch_size)
+        )).all()
+        if not rows:
+            break
+
+        await db.execute(
+            update(table).where(table.c.id == bindparam("row_id")).values(response_link=bindparam("token")),
+            [{"row_id": row.id, "token": row.response_link.rstrip("/").rsplit("/", 1)[-1]} for row in rows]
+        )
+        await db.commit()
+        migrated += len(rows)
+    return migrated
+
+async def narrow_link_column(db: AsyncSession) -> None:
+    """Shrink the column to its fixed width; SQLite ignores declared lengths, so only PostgreSQL needs it"""
+    if db.bind.dialect.name == "postgresql":
+        await db.execute(text("ALTER TABLE responses ALTER COLUMN response_link TYPE CHAR(22)"))
+        await db.commit()
+
+if __name__ == "__main__":
+    from database import SessionLocal, engine
+
+    async def main():
+        async with SessionLocal() as db:
+            print(f"Migrated {await strip_link_urls(db)} response link(s)")
+            await narrow_link_column(db)
+        await engine.dispose()
+
+    asyncio.run(main())
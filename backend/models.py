@@ -2,7 +2,7 @@
 # Path: /inviter-app/backend/models.py
 # Description: SQLAlchemy database models for all entities
 
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, JSON, Text, Enum
+from sqlalchemy import CHAR, Column, Integer, String, DateTime, Boolean, ForeignKey, JSON, Text, Enum, UniqueConstraint, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -40,6 +40,16 @@ class User(Base):
 class Invitation(Base):
     """Invitation model for storing invitation details"""
     __tablename__ = "invitations"
+    __table_args__ = (
+        # Keyset pagination of a user's invitations, newest first
+        Index("ix_invitations_creator_created", "creator_id", "created_at", "id"),
+        # Status filters (active/expired/past)
+        Index("ix_invitations_creator_expires", "creator_id", "expires_at"),
+        Index("ix_invitations_creator_event", "creator_id", "event_date"),
+        # Reminder scheduler: invitations whose deadline falls in the next window
+        Index("ix_invitations_expires", "expires_at"),
+        Index("ix_invitations_event_date", "event_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -60,6 +70,13 @@ class Invitation(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    # Denormalized counters, kept in step with responses/messages (see counters.py)
+    total_sent = Column(Integer, nullable=False, default=0, server_default="0")
+    total_yes = Column(Integer, nullable=False, default=0, server_default="0")
+    total_no = Column(Integer, nullable=False, default=0, server_default="0")
+    total_pending = Column(Integer, nullable=False, default=0, server_default="0")
+    total_messages = Column(Integer, nullable=False, default=0, server_default="0")
+    
     # Relationships
     creator = relationship("User", back_populates="invitations")
     responses = relationship("Response", back_populates="invitation", cascade="all, delete-orphan")
@@ -68,6 +85,15 @@ class Invitation(Base):
 class Response(Base):
     """Response model for tracking invitation responses"""
     __tablename__ = "responses"
+    __table_args__ = (
+        # Reminder scheduler: only rows still awaiting a reminder are indexed,
+        # so the index shrinks as recipients answer or get reminded
+        Index(
+            "ix_responses_reminder_due", "invitation_id", "id",
+            sqlite_where=text("answer IS NULL AND reminder_sent_at IS NULL"),
+            postgresql_where=text("answer IS NULL AND reminder_sent_at IS NULL"),
+        ),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     invitation_id = Column(Integer, ForeignKey("invitations.id"), nullable=False)
@@ -78,7 +104,7 @@ class Response(Base):
     recipient_email = Column(String(255), nullable=True)  # Optional for future use
     
     # Response tracking
-    response_link = Column(String(255), unique=True, nullable=False, index=True)  # Secure unique link
+    response_link = Column(CHAR(22), unique=True, nullable=False, index=True)  # Link token (utils.generate_link_tokens)
     answer = Column(String(10), nullable=True)  # yes, no, or null for pending
     custom_responses = Column(JSON, nullable=True)  # For custom field answers
     
@@ -106,4 +132,33 @@ class Message(Base):
     
     # Relationships
     invitation = relationship("Invitation", back_populates="messages")
-    response = relationship("Response", back_populates="messages")
\ No newline at end of file
+    response = relationship("Response", back_populates="messages")
+
+class UserStats(Base):
+    """Per-user running totals backing the dashboard (see rollups.py)"""
+    __tablename__ = "user_stats"
+    
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    total_invitations = Column(Integer, nullable=False, default=0, server_default="0")
+    total_sent = Column(Integer, nullable=False, default=0, server_default="0")
+    total_yes = Column(Integer, nullable=False, default=0, server_default="0")
+    total_no = Column(Integer, nullable=False, default=0, server_default="0")
+    total_pending = Column(Integer, nullable=False, default=0, server_default="0")
+    total_messages = Column(Integer, nullable=False, default=0, server_default="0")
+    unread_messages = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class ActivityBucket(Base):
+    """Hourly or daily activity counts per user (see rollups.py)"""
+    __tablename__ = "activity_buckets"
+    __table_args__ = (
+        UniqueConstraint("user_id", "granularity", "bucket_start", name="uq_activity_bucket"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    granularity = Column(String(10), nullable=False)  # hour or day
+    bucket_start = Column(DateTime, nullable=False)
+    invitations = Column(Integer, nullable=False, default=0, server_default="0")
+    responses = Column(Integer, nullable=False, default=0, server_default="0")
+    messages = Column(Integer, nullable=False, default=0, server_default="0")
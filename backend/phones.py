@@ -0,0 +1,58 @@
+# File: backend/phones.py
+# Path: /inviter-app/backend/phones.py
+# Description: Memoized phone number normalization and batch recipient validation
+
+from functools import lru_cache
+from typing import Iterable, List, Tuple
+
+from config import env_int, env_str
+
+# Region assumed for numbers written without a country code
+DEFAULT_PHONE_REGION = env_str("DEFAULT_PHONE_REGION", "US")
+PHONE_CACHE_SIZE = env_int("PHONE_CACHE_SIZE", 65536)
+
+@lru_cache(maxsize=PHONE_CACHE_SIZE)
+def _normalize(raw: str) -> Tuple[str, str]:
+    """Returns (E.164 number, "") or ("", error message); cached per raw string"""
+    # The metadata package is large, so it is loaded by the first number validated, not at startup
+    import phonenumbers
+
+    try:
+        parsed = phonenumbers.parse(raw, DEFAULT_PHONE_REGION)
+    except phonenumbers.NumberParseException:
+        return "", "Invalid phone number format"
+    if not phonenumbers.is_valid_number(parsed):
+        return "", "Invalid phone number"
+    return phonenumbers.format_number(parsed, phonenumbers.PhoneNumberFormat.E164), ""
+
+def normalize_phone(phone: str) -> str:
+    """
+    Validate a phone number and return it in E.164 format
+    Raises ValueError for unparseable or invalid numbers
+    """
+    number, error = _normalize(phone.strip())
+    if error:
+        raise ValueError(error)
+    return number
+
+def normalize_recipients(recipients: Iterable) -> Tuple[List, List[Tuple[int, str]]]:
+    """
+    Validate a whole recipient list in one pass
+    Rewrites each recipient's phone to E.164 and drops later duplicates of
+    the same number. Returns (unique recipients, [(index, error), ...])
+    """
+    unique, errors, seen = [], [], set()
+    for index, recipient in enumerate(recipients):
+        number, error = _normalize(recipient.phone.strip())
+        if error:
+            errors.append((index, error))
+            continue
+        if number in seen:
+            continue
+        seen.add(number)
+        recipient.phone = number
+        unique.append(recipient)
+    return unique, errors
+
+def cache_info():
+    return _normalize.cache_info()
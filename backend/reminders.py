@@ -0,0 +1,163 @@
+# File: backend/reminders.py
+# Path: /inviter-app/backend/reminders.py
+# Description: Scheduled SMS reminders for recipients who have not answered before the deadline
+#
+# Usage: python reminders.py   (runs a single reminder pass against the configured database)
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import select, update, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config import env_float, env_int
+from models import Invitation, Response, User
+from sms import SMSMessage, SMSDispatcher
+from utils import build_response_link, format_reminder_sms
+
+logger = logging.getLogger(__name__)
+
+REMINDER_WINDOW_HOURS = env_float("REMINDER_WINDOW_HOURS", 24)  # Remind this long before the deadline
+REMINDER_BATCH_SIZE = env_int("REMINDER_BATCH_SIZE", 500)
+REMINDER_INTERVAL_SECONDS = env_float("REMINDER_INTERVAL_SECONDS", 300)  # 0 disables the in-process scheduler
+
+async def due_invitations(db: AsyncSession, now: datetime, window: timedelta) -> List[dict]:
+    """
+    Invitations whose deadline falls between now and now + window
+    The deadline is expires_at, or event_date when there is no expiry. The two
+    cases are separate range conditions so each can use its own index instead
+    of scanning every invitation for a computed deadline.
+    """
+    horizon = now + window
+    rows = (await db.execute(
+        select(Invitation, User.name)
+        .outerjoin(User, User.id == Invitation.creator_id)
+        .where(or_(
+            Invitation.expires_at.between(now, horizon),
+            and_(Invitation.expires_at.is_(None), Invitation.event_date.between(now, horizon)),
+        ))
+        .order_by(Invitation.id)
+    )).all()
+    return [
+        {
+            "id": invitation.id,
+            "title": invitation.title,
+            "event_date": invitation.event_date,
+            "creator_name": creator_name,
+        }
+        for invitation, creator_name in rows
+    ]
+
+async def claim_batch(db: AsyncSession, invitation_id: int, now: datetime, limit: int) -> List[dict]:
+    """
+    Atomically stamp up to `limit` pending, un-reminded responses and return them
+    The stamp is the claim: the outer UPDATE re-checks reminder_sent_at, so when
+    several workers race for the same rows each row is returned to exactly one
+    of them. On PostgreSQL the inner SELECT also skips rows another worker has
+    locked rather than waiting on them. Commits before returning, so the claim
+    is visible to other workers before any SMS goes out.
+    """
+    pending = and_(Response.answer.is_(None), Response.reminder_sent_at.is_(None))
+    candidates = (
+        select(Response.id)
+        .where(Response.invitation_id == invitation_id, pending)
+        .order_by(Response.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    rows = (await db.execute(
+        update(Response)
+        .where(Response.id.in_(candidates), pending)
+        .values(reminder_sent_at=now)
+        .returning(Response.id, Response.recipient_name, Response.recipient_phone, Response.response_link)
+        .execution_options(synchronize_session=False)
+    )).all()
+    await db.commit()
+    return [row._asdict() for row in rows]
+
+async def release_claims(db: AsyncSession, response_ids: List[int], claimed_at: datetime) -> None:
+    """Clear the stamp on reminders that failed to send so the next pass retries them"""
+    if not response_ids:
+        return
+    await db.execute(
+        update(Response)
+        .where(Response.id.in_(response_ids), Response.reminder_sent_at == claimed_at)
+        .values(reminder_sent_at=None)
+        .execution_options(synchronize_session=False)
+    )
+    await db.commit()
+
+async def send_reminders(
+    db: AsyncSession,
+    dispatcher: SMSDispatcher,
+    now: Optional[datetime] = None,
+    window_hours: float = REMINDER_WINDOW_HOURS,
+    batch_size: int = REMINDER_BATCH_SIZE
+) -> Dict[str, int]:
+    """
+    One reminder pass: claim due recipients invitation by invitation, send each
+    batch through the dispatcher, and release the claims that failed
+    Safe to run concurrently from several processes
+    """
+    now = now or datetime.utcnow()
+    totals = {"invitations": 0, "sent": 0, "failed": 0}
+
+    for invitation in await due_invitations(db, now, timedelta(hours=window_hours)):
+        totals["invitations"] += 1
+        while True:
+            batch = await claim_batch(db, invitation["id"], now, batch_size)
+            if not batch:
+                break
+
+            results = await dispatcher.send_batch(
+                SMSMessage(
+                    to=row["recipient_phone"],
+                    body=format_reminder_sms(
+                        row["recipient_name"], invitation["creator_name"], invitation,
+                        build_response_link(row["response_link"])
+                    )
+                )
+                for row in batch
+            )
+            failed = [row["id"] for row, result in zip(batch, results) if not result.success]
+            await release_claims(db, failed, now)
+            totals["sent"] += len(batch) - len(failed)
+            totals["failed"] += len(failed)
+            if failed:
+                # Leave the rest of this invitation for the next pass rather
+                # than re-claiming the rows that just failed
+                break
+
+    return totals
+
+async def run_scheduler(interval: float = REMINDER_INTERVAL_SECONDS) -> None:
+    """Run reminder passes forever, every `interval` seconds"""
+    from database import SessionLocal
+    from sms import get_dispatcher
+
+    while True:
+        try:
+            async with SessionLocal() as db:
+                totals = await send_reminders(db, get_dispatcher())
+            if totals["sent"] or totals["failed"]:
+                logger.info("Reminder pass: %s", totals)
+        except Exception:  # A bad pass must not kill the scheduler
+            logger.exception("Reminder pass failed")
+        await asyncio.sleep(interval)
+
+if __name__ == "__main__":
+    from database import SessionLocal, engine
+    from sms import get_dispatcher, shutdown_dispatcher
+
+    async def main():
+        try:
+            async with SessionLocal() as db:
+                print(f"Reminder pass: {await send_reminders(db, get_dispatcher())}")
+        finally:
+            await shutdown_dispatcher()
+            await engine.dispose()
+
+    asyncio.run(main())
@@ -0,0 +1,209 @@
+# File: backend/rollups.py
+# Path: /inviter-app/backend/rollups.py
+# Description: Incrementally maintained per-user rollups for the analytics dashboard
+#
+# Usage: python rollups.py   (rebuilds every user's totals from the invitation counters)
+
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select, delete, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import ActivityBucket, Invitation, Message, UserStats
+
+GRANULARITIES = ("hour", "day")
+RECENT_ACTIVITY_DAYS = 7
+HOURLY_RETENTION = timedelta(days=14)
+
+def bucket_start(moment: datetime, granularity: str) -> datetime:
+    """Truncate a timestamp to the start of its hourly or daily bucket"""
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    if granularity == "day":
+        moment = moment.replace(hour=0)
+    return moment
+
+def _dialect_insert(db: AsyncSession):
+    """INSERT construct supporting ON CONFLICT for the session's database"""
+    if db.bind.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+async def _increment_user_stats(db: AsyncSession, user_id: int, increments: Dict[str, int], now: datetime) -> None:
+    increments = {column: delta for column, delta in increments.items() if delta}
+    if not increments:
+        return
+
+    insert = _dialect_insert(db)
+    statement = insert(UserStats).values(user_id=user_id, updated_at=now, **increments)
+    statement = statement.on_conflict_do_update(
+        index_elements=[UserStats.user_id],
+        set_={
+            **{column: getattr(UserStats, column) + statement.excluded[column] for column in increments},
+            "updated_at": statement.excluded.updated_at,
+        }
+    )
+    await db.execute(statement)
+
+async def _increment_buckets(db: AsyncSession, user_id: int, increments: Dict[str, int], now: datetime) -> None:
+    increments = {column: delta for column, delta in increments.items() if delta}
+    if not increments:
+        return
+
+    insert = _dialect_insert(db)
+    statement = insert(ActivityBucket)
+    statement = statement.on_conflict_do_update(
+        index_elements=[ActivityBucket.user_id, ActivityBucket.granularity, ActivityBucket.bucket_start],
+        set_={column: getattr(ActivityBucket, column) + statement.excluded[column] for column in increments}
+    )
+    await db.execute(statement, [
+        {"user_id": user_id, "granularity": granularity, "bucket_start": bucket_start(now, granularity), **increments}
+        for granularity in GRANULARITIES
+    ])
+
+# The record_* hooks run inside the caller's transaction, next to the write they describe
+
+async def record_invitation_created(db: AsyncSession, user_id: int, recipients: int, now: datetime) -> None:
+    await _increment_user_stats(db, user_id, {
+        "total_invitations": 1,
+        "total_sent": recipients,
+        "total_pending": recipients,
+    }, now)
+    await _increment_buckets(db, user_id, {"invitations": 1}, now)
+
+async def record_recipients_added(db: AsyncSession, user_id: int, recipients: int, now: datetime) -> None:
+    await _increment_user_stats(db, user_id, {"total_sent": recipients, "total_pending": recipients}, now)
+
+async def record_answer(db: AsyncSession, user_id: int, deltas: Dict[str, int], now: datetime) -> None:
+    """Apply invitation counter deltas (see counters.answer_deltas) to the user's rollups"""
+    await _increment_user_stats(db, user_id, {
+        column: deltas.get(column, 0) for column in ("total_yes", "total_no", "total_pending")
+    }, now)
+    # A response leaving the pending state is new activity; a change of mind is not
+    if deltas.get("total_pending", 0) < 0:
+        await _increment_buckets(db, user_id, {"responses": -deltas["total_pending"]}, now)
+
+async def record_message(db: AsyncSession, user_id: int, now: datetime, count: int = 1) -> None:
+    await _increment_user_stats(db, user_id, {"total_messages": count, "unread_messages": count}, now)
+    await _increment_buckets(db, user_id, {"messages": count}, now)
+
+async def record_messages_read(db: AsyncSession, user_id: int, count: int, now: datetime) -> None:
+    await _increment_user_stats(db, user_id, {"unread_messages": -count}, now)
+
+async def get_user_version(db: AsyncSession, user_id: int) -> Optional[datetime]:
+    """
+    When anything feeding the user's dashboard or invitation list last changed
+    Every write path updates the rollups, so their timestamp doubles as a version stamp
+    """
+    return await db.scalar(select(UserStats.updated_at).where(UserStats.user_id == user_id))
+
+async def touch_user_versions(db: AsyncSession, user_ids: Iterable[int], now: datetime) -> None:
+    """Move the users' version stamps forward after a write that bypasses the record_* hooks"""
+    ids = set(user_ids)
+    if ids:
+        await db.execute(update(UserStats).where(UserStats.user_id.in_(ids)).values(updated_at=now))
+
+async def get_dashboard(db: AsyncSession, user_id: int, now: datetime) -> dict:
+    """
+    Read the dashboard from the rollups
+    One primary-key lookup plus at most RECENT_ACTIVITY_DAYS daily buckets,
+    independent of how much history the account has
+    """
+    stats = await db.get(UserStats, user_id) or UserStats(
+        total_invitations=0, total_sent=0, total_yes=0, total_no=0,
+        total_pending=0, total_messages=0, unread_messages=0
+    )
+    since = bucket_start(now, "day") - timedelta(days=RECENT_ACTIVITY_DAYS - 1)
+    invitations, responses = (await db.execute(
+        select(
+            func.coalesce(func.sum(ActivityBucket.invitations), 0),
+            func.coalesce(func.sum(ActivityBucket.responses), 0),
+        ).where(
+            ActivityBucket.user_id == user_id,
+            ActivityBucket.granularity == "day",
+            ActivityBucket.bucket_start >= since,
+        )
+    )).one()
+
+    answered = stats.total_yes + stats.total_no
+    return {
+        "total_invitations": stats.total_invitations,
+        "total_responses_sent": stats.total_sent,
+        "response_rate": round(answered / stats.total_sent * 100, 1) if stats.total_sent else 0.0,
+        "pending_responses": stats.total_pending,
+        "total_accepted": stats.total_yes,
+        "total_declined": stats.total_no,
+        "unread_messages": stats.unread_messages,
+        "recent_activity": {
+            "last_week_invitations": invitations,
+            "last_week_responses": responses,
+        }
+    }
+
+async def prune_hourly_buckets(db: AsyncSession, now: datetime) -> int:
+    """Drop hourly buckets past their retention window; daily buckets are kept"""
+    result = await db.execute(
+        delete(ActivityBucket).where(
+            ActivityBucket.granularity == "hour",
+            ActivityBucket.bucket_start < now - HOURLY_RETENTION,
+        )
+    )
+    await db.commit()
+    return result.rowcount
+
+async def rebuild_user_stats(db: AsyncSession) -> int:
+    """
+    Recompute every user's totals from the invitation counters and message flags
+    For repairing drift or backfilling; run counters.reconcile_counters first
+    """
+    now = datetime.utcnow()
+    totals = {
+        row.creator_id: row
+        for row in await db.execute(
+            select(
+                Invitation.creator_id,
+                func.count().label("invitations"),
+                func.sum(Invitation.total_sent).label("sent"),
+                func.sum(Invitation.total_yes).label("yes"),
+                func.sum(Invitation.total_no).label("no"),
+                func.sum(Invitation.total_pending).label("pending"),
+                func.sum(Invitation.total_messages).label("messages"),
+            ).group_by(Invitation.creator_id)
+        )
+    }
+    unread = dict((await db.execute(
+        select(Invitation.creator_id, func.count())
+        .join(Message, Message.invitation_id == Invitation.id)
+        .where(Message.is_read.is_(False))
+        .group_by(Invitation.creator_id)
+    )).all())
+
+    await db.execute(delete(UserStats))
+    for user_id, row in totals.items():
+        db.add(UserStats(
+            user_id=user_id,
+            total_invitations=row.invitations,
+            total_sent=row.sent,
+            total_yes=row.yes,
+            total_no=row.no,
+            total_pending=row.pending,
+            total_messages=row.messages,
+            unread_messages=unread.get(user_id, 0),
+            updated_at=now,
+        ))
+    await db.commit()
+    return len(totals)
+
+if __name__ == "__main__":
+    import asyncio
+    from database import SessionLocal, engine
+
+    async def main():
+        async with SessionLocal() as db:
+            print(f"Rebuilt dashboard totals for {await rebuild_user_stats(db)} user(s)")
+            print(f"Pruned {await prune_hourly_buckets(db, datetime.utcnow())} expired hourly bucket(s)")
+        await engine.dispose()
+
+    asyncio.run(main())
@@ -6,7 +6,8 @@ from pydantic import BaseModel, EmailStr, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
-import phonenumbers
+
+from phones import normalize_recipients
 
 # ==================== USER SCHEMAS ====================
 
@@ -30,19 +31,9 @@ class UserResponse(BaseModel):
 
 # ==================== INVITATION SCHEMAS ====================
 class RecipientInput(BaseModel):
-    """Schema for invitation recipient"""
+    """Schema for invitation recipient (phones are validated per list, see InvitationCreate)"""
     name: str = Field(..., min_length=1)
     phone: str
-    
-    @field_validator('phone')
-    def validate_phone(cls, v):
-        try:
-            parsed = phonenumbers.parse(v, None)
-            if not phonenumbers.is_valid_number(parsed):
-                raise ValueError("Invalid phone number")
-            return v
-        except phonenumbers.phonenumberutil.NumberParseException:
-            raise ValueError("Invalid phone number format")
 
 
 class InvitationCreate(BaseModel):
@@ -69,7 +60,15 @@ class InvitationCreate(BaseModel):
             raise ValueError('At least one recipient is required')
         if len(v) > 1000:  # Limit for safety
             raise ValueError('Maximum 1000 recipients allowed per invitation')
-        return v
+        
+        # Normalize the whole list to E.164 in one pass, dropping duplicate numbers
+        recipients, errors = normalize_recipients(v)
+        if errors:
+            details = "; ".join(f"recipient {index + 1}: {error}" for index, error in errors[:10])
+            if len(errors) > 10:
+                details += f"; and {len(errors) - 10} more"
+            raise ValueError(f"Invalid phone numbers ({details})")
+        return recipients
     
     @field_validator('expires_at')
     def validate_expiry(cls, v):
@@ -0,0 +1,27 @@
+# File: backend/serialization.py
+# Path: /inviter-app/backend/serialization.py
+# Description: orjson responses and a fast path that skips response_model validation for trusted data
+
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
+from config import env_bool
+
+# Route bodies built by our own serializers (invitation_to_dict and friends) already
+# have the response_model's shape; set to false to validate them again while debugging
+TRUST_RESPONSE_DATA = env_bool("TRUST_RESPONSE_DATA", True)
+
+# App-wide default: validated responses are still rendered with orjson
+DefaultResponse = ORJSONResponse
+
+def trusted(content: Any, response: Response) -> Any:
+    """
+    Return content from a route without FastAPI re-validating it against response_model
+    Headers already set on the injected response are carried over. orjson encodes
+    datetimes, None and nested dicts natively, so the bytes match the validated path.
+    """
+    if not TRUST_RESPONSE_DATA:
+        return content
+    return ORJSONResponse(content, headers=dict(response.headers))
@@ -0,0 +1,306 @@
+# File: backend/sms.py
+# Path: /inviter-app/backend/sms.py
+# Description: Concurrent bulk SMS dispatch engine with pluggable transports
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from config import env_float, env_int, env_str, settings
+from metrics import sms_send_time
+
+logger = logging.getLogger(__name__)
+
+# Dispatch configuration
+SMS_TRANSPORT = env_str("SMS_TRANSPORT")  # twilio, console or fake; auto-detected if unset
+SMS_CONCURRENCY = env_int("SMS_CONCURRENCY", 20)
+SMS_RATE_LIMIT = env_float("SMS_RATE_LIMIT", 10)  # Messages per second per sender
+SMS_MAX_RETRIES = env_int("SMS_MAX_RETRIES", 2)
+SMS_MAX_CONNECTIONS = env_int("SMS_MAX_CONNECTIONS", 20)
+SMS_DRAIN_TIMEOUT = env_float("SMS_DRAIN_TIMEOUT", 30)  # Seconds to finish batches on shutdown
+
+TWILIO_API_URL = "https://api.twilio.com"
+
+@dataclass
+class SMSMessage:
+    """A single outbound SMS"""
+    to: str
+    body: str
+    sender: Optional[str] = None
+
+@dataclass
+class DeliveryResult:
+    """Outcome of sending one SMS to one recipient"""
+    to: str
+    success: bool
+    provider_id: Optional[str] = None
+    error: Optional[str] = None
+    retryable: bool = False
+    attempts: int = 1
+    latency: float = 0.0
+
+class SMSTransport:
+    """Base class for SMS providers. Subclasses implement send()"""
+
+    async def send(self, message: SMSMessage) -> DeliveryResult:
+        raise NotImplementedError
+
+    async def aclose(self) -> None:
+        pass
+
+class ConsoleTransport(SMSTransport):
+    """Development transport that prints messages instead of sending them"""
+
+    async def send(self, message: SMSMessage) -> DeliveryResult:
+        print(f"SMS to {message.to}: {message.body}")  # Development mode
+        return DeliveryResult(to=message.to, success=True)
+
+class FakeTransport(SMSTransport):
+    """
+    Local fake provider for offline throughput measurement
+    Simulates provider latency and an optional failure rate
+    """
+
+    def __init__(self, latency: float = 0.05, jitter: float = 0.0, failure_rate: float = 0.0):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.sent: List[SMSMessage] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def send(self, message: SMSMessage) -> DeliveryResult:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency + random.uniform(0, self.jitter))
+        finally:
+            self.in_flight -= 1
+
+        if self.failure_rate and random.random() < self.failure_rate:
+            return DeliveryResult(to=message.to, success=False, error="Simulated failure", retryable=True)
+
+        self.sent.append(message)
+        return DeliveryResult(to=message.to, success=True, provider_id=f"FAKE{len(self.sent):08d}")
+
+class TwilioTransport(SMSTransport):
+    """
+    Sends through the Twilio REST API over a pooled HTTP client
+    httpx is imported here rather than at module level, so processes using the
+    console or fake transport never load it
+    """
+
+    def __init__(self, account_sid: str, auth_token: str, max_connections: int = SMS_MAX_CONNECTIONS):
+        import httpx
+
+        self.account_sid = account_sid
+        self.http_errors = httpx.HTTPError
+        self.client = httpx.AsyncClient(
+            base_url=TWILIO_API_URL,
+            auth=(account_sid, auth_token),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            ),
+            timeout=httpx.Timeout(10.0)
+        )
+
+    async def send(self, message: SMSMessage) -> DeliveryResult:
+        try:
+            response = await self.client.post(
+                f"/2010-04-01/Accounts/{self.account_sid}/Messages.json",
+                data={"To": message.to, "From": message.sender, "Body": message.body}
+            )
+        except self.http_errors as e:
+            return DeliveryResult(to=message.to, success=False, error=str(e), retryable=True)
+
+        if response.status_code in (200, 201):
+            return DeliveryResult(to=message.to, success=True, provider_id=response.json().get("sid"))
+
+        # 429 and 5xx are transient; anything else (bad number, etc.) is final
+        retryable = response.status_code == 429 or response.status_code >= 500
+        try:
+            error = response.json().get("message", response.text)
+        except ValueError:
+            error = response.text
+        return DeliveryResult(to=message.to, success=False, error=error, retryable=retryable)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+class RateLimiter:
+    """Token bucket limiting how fast a single sender may send"""
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+@dataclass
+class DispatchStats:
+    """Running totals for a dispatcher"""
+    sent: int = 0
+    failed: int = 0
+    retries: int = 0
+    batches: int = 0
+    queued: int = 0
+
+class SMSDispatcher:
+    """
+    Batched SMS dispatch engine
+    Sends with bounded concurrency, a per-sender rate limit and retries,
+    and reports one DeliveryResult per recipient
+    """
+
+    def __init__(
+        self,
+        transport: SMSTransport,
+        concurrency: int = SMS_CONCURRENCY,
+        rate_limit: Optional[float] = SMS_RATE_LIMIT,
+        max_retries: int = SMS_MAX_RETRIES,
+        default_sender: Optional[str] = None
+    ):
+        self.transport = transport
+        self.concurrency = concurrency
+        self.rate_limit = rate_limit
+        self.max_retries = max_retries
+        self.default_sender = default_sender
+        self.stats = DispatchStats()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._limiters: Dict[Optional[str], RateLimiter] = {}
+        self._tasks = set()
+
+    def _limiter(self, sender: Optional[str]) -> Optional[RateLimiter]:
+        if not self.rate_limit:
+            return None
+        if sender not in self._limiters:
+            self._limiters[sender] = RateLimiter(self.rate_limit)
+        return self._limiters[sender]
+
+    async def _send_one(self, message: SMSMessage) -> DeliveryResult:
+        if message.sender is None:
+            message.sender = self.default_sender
+        limiter = self._limiter(message.sender)
+        start = time.perf_counter()
+
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                attempt += 1
+                if limiter:
+                    await limiter.acquire()
+                try:
+                    result = await self.transport.send(message)
+                except Exception as e:  # Transport bugs must not kill the batch
+                    result = DeliveryResult(to=message.to, success=False, error=str(e))
+
+                if result.success or not result.retryable or attempt > self.max_retries:
+                    break
+                self.stats.retries += 1
+                await asyncio.sleep(min(2 ** attempt * 0.1, 2.0))
+
+        result.attempts = attempt
+        result.latency = time.perf_counter() - start
+        sms_send_time.observe(result.latency, "sent" if result.success else "failed")
+        if result.success:
+            self.stats.sent += 1
+        else:
+            self.stats.failed += 1
+            logger.warning("Error sending SMS to %s: %s", message.to, result.error)
+        return result
+
+    async def send_batch(self, messages: Iterable[SMSMessage]) -> List[DeliveryResult]:
+        """Send all messages and wait for the per-recipient results"""
+        messages = list(messages)
+        results: List[Optional[DeliveryResult]] = [None] * len(messages)
+        pending = iter(enumerate(messages))
+
+        async def worker():
+            # Workers pull from a shared iterator, so a large batch holds
+            # `concurrency` coroutines rather than one per recipient
+            for index, message in pending:
+                results[index] = await self._send_one(message)
+                self.stats.queued -= 1
+
+        self.stats.batches += 1
+        self.stats.queued += len(messages)
+        try:
+            await asyncio.gather(*(worker() for _ in range(min(self.concurrency, len(messages)))))
+        finally:
+            self.stats.queued -= sum(result is None for result in results)
+        return results
+
+    def submit(self, messages: Iterable[SMSMessage]) -> asyncio.Task:
+        """Schedule a batch in the background and return immediately"""
+        task = asyncio.create_task(self.send_batch(messages))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def aclose(self, timeout: Optional[float] = SMS_DRAIN_TIMEOUT) -> None:
+        """
+        Wait for background batches to finish, then release the transport
+        Large rate-limited batches can take far longer than a shutdown should,
+        so anything still running after the timeout is cancelled and logged
+        """
+        if self._tasks:
+            _, unfinished = await asyncio.wait(set(self._tasks), timeout=timeout)
+            if unfinished:
+                logger.warning(
+                    "Cancelling %d unfinished SMS batch(es) holding %d message(s)",
+                    len(unfinished), self.stats.queued
+                )
+                for task in unfinished:
+                    task.cancel()
+                await asyncio.gather(*unfinished, return_exceptions=True)
+        await self.transport.aclose()
+
+def create_transport(kind: Optional[str] = None) -> SMSTransport:
+    """Build the transport named by SMS_TRANSPORT, falling back to console without Twilio credentials"""
+    kind = kind or SMS_TRANSPORT
+    if kind is None:
+        kind = "twilio" if settings.twilio_configured else "console"
+
+    if kind == "twilio":
+        return TwilioTransport(settings.twilio_account_sid, settings.twilio_auth_token)
+    if kind == "fake":
+        return FakeTransport()
+    if kind == "console":
+        return ConsoleTransport()
+    raise ValueError(f"Unknown SMS transport: {kind}")
+
+_dispatcher: Optional[SMSDispatcher] = None
+
+def get_dispatcher() -> SMSDispatcher:
+    """Return the process-wide dispatcher, creating it on first use"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = SMSDispatcher(create_transport(), default_sender=settings.twilio_phone_number)
+    return _dispatcher
+
+def dispatcher_stats() -> Optional[DispatchStats]:
+    """Stats of the process-wide dispatcher, without creating one"""
+    return _dispatcher.stats if _dispatcher is not None else None
+
+async def shutdown_dispatcher() -> None:
+    """Drain and close the process-wide dispatcher"""
+    global _dispatcher
+    if _dispatcher is not None:
+        await _dispatcher.aclose()
+        _dispatcher = None
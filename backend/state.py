@@ -0,0 +1,116 @@
+# File: backend/state.py
+# Path: /inviter-app/backend/state.py
+# Description: Pluggable user account store, in-process or shared through the database
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from cache import TTLCache
+from config import env_float, env_int, env_str
+from database import SessionLocal
+from models import User
+
+# database: users table, shared by every worker process; memory: users table read once per process (single worker)
+STATE_BACKEND = env_str("STATE_BACKEND", "database")
+USER_CACHE_TTL = env_float("USER_CACHE_TTL", 30)  # Seconds another worker's change can go unseen
+USER_CACHE_MAX_ENTRIES = env_int("USER_CACHE_MAX_ENTRIES", 10000)
+
+class EmailTaken(Exception):
+    """Raised when signing up with an email that already has an account"""
+
+class UserStore:
+    """
+    Account storage behind signup, login and token lookup
+    Users are plain dicts: id, email, name, hashed_password, created_at
+    """
+
+    async def get(self, email: str, fresh: bool = False) -> Optional[dict]:
+        """Find a user by email; fresh=True skips any cache"""
+        raise NotImplementedError
+
+    async def create(self, email: str, name: str, hashed_password: Optional[str]) -> dict:
+        """Add a user and return it, raising EmailTaken for a duplicate email"""
+        raise NotImplementedError
+
+    async def set_password(self, user: dict, hashed_password: str) -> None:
+        raise NotImplementedError
+
+class DatabaseUserStore(UserStore):
+    """
+    Users table store, consistent across worker processes
+    The database assigns IDs and enforces unique emails, so concurrent signups on
+    different workers cannot collide. Lookups for token checks are cached briefly
+    per process; login reads fresh so a password change is seen immediately.
+    """
+
+    def __init__(self, session_factory=SessionLocal, cache_ttl: float = USER_CACHE_TTL):
+        self.session_factory = session_factory
+        self.cache = TTLCache("users", USER_CACHE_MAX_ENTRIES, USER_CACHE_MAX_ENTRIES * 512, cache_ttl)
+
+    async def get(self, email: str, fresh: bool = False) -> Optional[dict]:
+        if not fresh:
+            user = self.cache.get(email)
+            if user is not None:
+                return user
+
+        async with self.session_factory() as db:
+            row = (await db.execute(
+                select(User.id, User.email, User.name, User.hashed_password, User.created_at)
+                .where(User.email == email, User.is_active.is_(True))
+            )).first()
+        if row is None:
+            return None
+        user = dict(row._mapping)
+        self.cache.set(email, user)
+        return user
+
+    async def create(self, email: str, name: str, hashed_password: Optional[str]) -> dict:
+        now = datetime.utcnow()
+        async with self.session_factory() as db:
+            try:
+                user_id = (await db.execute(
+                    insert(User)
+                    .values(email=email, name=name, hashed_password=hashed_password, created_at=now, updated_at=now)
+                    .returning(User.id)
+                )).scalar_one()
+                await db.commit()
+            except IntegrityError:
+                await db.rollback()
+                raise EmailTaken(email)
+
+        user = {"id": user_id, "email": email, "name": name, "hashed_password": hashed_password, "created_at": now}
+        self.cache.set(email, user)
+        return user
+
+    async def set_password(self, user: dict, hashed_password: str) -> None:
+        async with self.session_factory() as db:
+            await db.execute(update(User).where(User.id == user["id"]).values(hashed_password=hashed_password))
+            await db.commit()
+        self.cache.invalidate(user["email"])
+
+class MemoryUserStore(DatabaseUserStore):
+    """
+    Users table store whose in-process copy never expires; run a single worker
+    Accounts are still written to the users table, since invitations, rollups and
+    the response page reference users.id, but after the first lookup every read is
+    served from memory. Changes made by another worker are never seen.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        super().__init__(session_factory, cache_ttl=float("inf"))
+
+    async def get(self, email: str, fresh: bool = False) -> Optional[dict]:
+        return await super().get(email)
+
+def create_user_store(kind: Optional[str] = None) -> UserStore:
+    kind = kind or STATE_BACKEND
+    if kind == "database":
+        return DatabaseUserStore()
+    if kind == "memory":
+        return MemoryUserStore()
+    raise ValueError(f"Unknown state backend: {kind}")
+
+user_store = create_user_store()
@@ -0,0 +1,58 @@
+# File: backend/tests/conftest.py
+# Path: /inviter-app/backend/tests/conftest.py
+# Description: Shared fixtures: the app, started once against a throwaway SQLite database
+#
+# Usage (from backend/): python -m pytest tests
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+import pytest_asyncio
+
+# Settings are read when the app modules are first imported, so the environment
+# has to be in place before any test module imports them
+_tmpdir = tempfile.TemporaryDirectory()
+os.environ.update({
+    "DATABASE_URL": f"sqlite:///{os.path.join(_tmpdir.name, 'test.db')}",
+    "SQLITE_PRODUCTION": "false", "RSVP_BATCHING": "false", "SMS_TRANSPORT": "fake",
+    "BCRYPT_ROUNDS": "4", "REMINDER_INTERVAL_SECONDS": "0",
+})
+
+@pytest.fixture(scope="session")
+def event_loop():
+    """One loop for the whole run: the engine's connections and the app's background tasks live on it"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+@pytest_asyncio.fixture(scope="session")
+async def app():
+    from main import app
+
+    await app.router.startup()
+    yield app
+    await app.router.shutdown()
+
+@pytest_asyncio.fixture
+async def client(app):
+    import httpx
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+@pytest_asyncio.fixture(scope="session")
+async def owner(app) -> dict:
+    """A signed-up user: its id and the headers that authenticate as it"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post("/auth/signup", json={
+            "email": "owner@example.com", "name": "Owner", "password": "correct horse"
+        })
+    response.raise_for_status()
+    user = response.json()
+    return {"id": user["id"], "headers": {"Authorization": f"Bearer {user['access_token']}"}}
@@ -0,0 +1,33 @@
+# File: backend/tests/test_counters.py
+# Path: /inviter-app/backend/tests/test_counters.py
+# Description: Counter reconciliation repairs drift and invalidates cached invitation lists
+
+import pytest
+from sqlalchemy import update
+
+pytestmark = pytest.mark.asyncio
+
+async def test_reconcile_repairs_drift_and_changes_list_etag(client, owner):
+    from counters import reconcile_counters
+    from database import SessionLocal
+    from models import Invitation
+
+    created = await client.post("/invitations", headers=owner["headers"], json={
+        "title": "Drift", "recipients": [{"name": "Ada", "phone": "+14155550123"}]
+    })
+    assert created.status_code == 200, created.text
+    invitation_id = created.json()["id"]
+
+    async with SessionLocal() as db:
+        await db.execute(update(Invitation).where(Invitation.id == invitation_id).values(total_yes=5))
+        await db.commit()
+    listed = await client.get("/invitations", headers=owner["headers"])
+    etag = listed.headers["ETag"]
+
+    async with SessionLocal() as db:
+        assert await reconcile_counters(db) >= 1
+
+    relisted = await client.get("/invitations", headers={**owner["headers"], "If-None-Match": etag})
+    assert relisted.status_code == 200, "list still served from the ETag taken before the repair"
+    repaired = next(invitation for invitation in relisted.json() if invitation["id"] == invitation_id)
+    assert (repaired["total_yes"], repaired["total_pending"]) == (0, 1)
@@ -0,0 +1,104 @@
+# File: backend/tests/test_query_counts.py
+# Path: /inviter-app/backend/tests/test_query_counts.py
+# Description: SQL statements issued per endpoint, capped so N+1 patterns cannot creep back in
+#
+# Every endpoint is called against a small and a large invitation. A test fails if an
+# endpoint runs more statements than its budget, or if the count grows with the number of rows.
+
+import sqlite3
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event
+
+# Maximum statements per request. Raise a budget only when a new query is intended.
+BUDGETS = {
+    "GET /invitations/{id}": 5,
+    "GET /invitations": 2,
+    "GET /analytics/dashboard": 2,
+    "GET /respond/{link}": 1,
+    "POST /respond/{link}": 7,
+    "PUT /messages/{id}/read": 4,
+    "GET /invitations/{id}/export": 2,
+    "POST /invitations": 4,
+}
+
+class StatementLog:
+    """Records statements run on the engine while active"""
+
+    def __init__(self):
+        self.statements = []
+        self.active = False
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        if self.active:
+            self.statements.append(" ".join(statement.split()))
+
+async def call(client, log: StatementLog, method: str, path: str, **kwargs) -> list:
+    log.statements, log.active = [], True
+    try:
+        response = await client.request(method, path, **kwargs)
+        await response.aread()
+    finally:
+        log.active = False
+    assert response.status_code < 400, f"{method} {path} -> {response.status_code}: {response.text}"
+    return log.statements
+
+async def exercise(client, log: StatementLog, headers: dict, recipients: int) -> dict:
+    """Create an invitation with this many recipients, have everyone answer and message, then read it back"""
+    from database import DATABASE_URL
+
+    body = {"title": f"Count {recipients}", "recipients": [
+        {"name": f"Guest {i}", "phone": f"+1415555{i:04d}"} for i in range(recipients)
+    ]}
+    counts = {"POST /invitations": await call(client, log, "POST", "/invitations", headers=headers, json=body)}
+    invitation_id = (await client.get("/invitations?limit=1", headers=headers)).json()[0]["id"]
+
+    with sqlite3.connect(DATABASE_URL.split("///", 1)[1]) as conn:
+        links = [row[0] for row in conn.execute(
+            "SELECT response_link FROM responses WHERE invitation_id = ? ORDER BY id", (invitation_id,)
+        )]
+    for i, link in enumerate(links):
+        await client.post(f"/respond/{link}", json={"answer": "yes" if i % 2 else "no", "message": f"Note {i}"})
+
+    counts["GET /respond/{link}"] = await call(client, log, "GET", f"/respond/{links[0]}")
+    counts["POST /respond/{link}"] = await call(client, log, "POST", f"/respond/{links[0]}", json={
+        "answer": "yes", "message": "Changed my mind"
+    })
+    counts["GET /invitations/{id}"] = await call(client, log, "GET", f"/invitations/{invitation_id}", headers=headers)
+    counts["GET /invitations"] = await call(client, log, "GET", "/invitations", headers=headers)
+    counts["GET /analytics/dashboard"] = await call(client, log, "GET", "/analytics/dashboard", headers=headers)
+    counts["GET /invitations/{id}/export"] = await call(
+        client, log, "GET", f"/invitations/{invitation_id}/export", headers=headers
+    )
+    message_id = (await client.get(f"/invitations/{invitation_id}", headers=headers)).json()["messages"][0]["id"]
+    counts["PUT /messages/{id}/read"] = await call(client, log, "PUT", f"/messages/{message_id}/read", headers=headers)
+    return counts
+
+@pytest_asyncio.fixture(scope="module")
+async def statements(app, owner) -> dict:
+    """Statements per endpoint, as (small invitation, large invitation)"""
+    import httpx
+
+    from database import engine
+
+    log = StatementLog()
+    event.listen(engine.sync_engine, "before_cursor_execute", log)
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            small = await exercise(client, log, owner["headers"], 2)
+            large = await exercise(client, log, owner["headers"], 40)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", log)
+    return {name: (small[name], large[name]) for name in BUDGETS}
+
+@pytest.mark.parametrize("endpoint", list(BUDGETS))
+def test_statements_within_budget(statements, endpoint):
+    _, many = statements[endpoint]
+    assert len(many) <= BUDGETS[endpoint], "\n".join([f"{endpoint} ran {len(many)} statements:", *many])
+
+@pytest.mark.parametrize("endpoint", list(BUDGETS))
+def test_statements_do_not_grow_with_rows(statements, endpoint):
+    few, many = statements[endpoint]
+    assert len(many) <= len(few), "\n".join([f"{endpoint} ran {len(few)} -> {len(many)} statements, likely N+1:", *many])
@@ -0,0 +1,50 @@
+# File: backend/tests/test_recipient_import.py
+# Path: /inviter-app/backend/tests/test_recipient_import.py
+# Description: Recipient imports are only accepted while the invitation is open
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import func, insert, select
+
+pytestmark = pytest.mark.asyncio
+
+CSV = "name,phone\nAda,+14155550100\nGrace,+14155550101\n"
+
+async def create_invitation(owner: dict, expires_at) -> int:
+    from database import SessionLocal
+    from models import Invitation
+
+    async with SessionLocal() as db:
+        invitation_id = (await db.execute(
+            insert(Invitation)
+            .values(title="Import", creator_id=owner["id"], expires_at=expires_at)
+            .returning(Invitation.id)
+        )).scalar_one()
+        await db.commit()
+    return invitation_id
+
+async def recipients(invitation_id: int) -> int:
+    from database import SessionLocal
+    from models import Response
+
+    async with SessionLocal() as db:
+        return await db.scalar(select(func.count()).select_from(Response).where(Response.invitation_id == invitation_id))
+
+async def test_import_into_open_invitation(client, owner):
+    invitation_id = await create_invitation(owner, datetime.utcnow() + timedelta(days=1))
+    response = await client.post(
+        f"/invitations/{invitation_id}/recipients/import", content=CSV,
+        headers={**owner["headers"], "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200, response.text
+    assert await recipients(invitation_id) == 2
+
+async def test_import_into_expired_invitation_is_rejected(client, owner):
+    invitation_id = await create_invitation(owner, datetime.utcnow() - timedelta(minutes=1))
+    response = await client.post(
+        f"/invitations/{invitation_id}/recipients/import", content=CSV,
+        headers={**owner["headers"], "Content-Type": "text/csv"}
+    )
+    assert response.status_code == 410
+    assert await recipients(invitation_id) == 0
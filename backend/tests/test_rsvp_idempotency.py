@@ -0,0 +1,163 @@
+# File: backend/tests/test_rsvp_idempotency.py
+# Path: /inviter-app/backend/tests/test_rsvp_idempotency.py
+# Description: Repeated RSVPs are decided by the database, not by per-process caches
+#
+# Every test runs with the request writing directly and through the batched writer. It covers
+# a change of answer made by another worker while this one's link cache is out of date, repeats
+# that must neither write nor notify dashboards, double taps with a message, and double taps
+# whose first write fails.
+
+import asyncio
+import json
+from datetime import datetime
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, insert, select, text
+
+pytestmark = pytest.mark.asyncio
+
+@pytest_asyncio.fixture(params=["direct", "batched"])
+async def writer_mode(request, app):
+    from writer import response_writer
+
+    if request.param == "batched":
+        response_writer.start()
+    yield request.param
+    await response_writer.stop()
+
+@pytest_asyncio.fixture
+async def invitation(writer_mode, owner) -> dict:
+    """An invitation with three unanswered recipients: its id and their links"""
+    from database import SessionLocal
+    from models import Invitation, Response
+    from utils import generate_link_tokens
+
+    async with SessionLocal() as db:
+        invitation_id = (await db.execute(
+            insert(Invitation)
+            .values(title="Idempotency", creator_id=owner["id"], total_sent=3, total_pending=3)
+            .returning(Invitation.id)
+        )).scalar_one()
+        links = generate_link_tokens(3)
+        await db.execute(insert(Response), [
+            {"invitation_id": invitation_id, "recipient_name": f"Guest {i}",
+             "recipient_phone": f"+1415555{i:04d}", "response_link": link}
+            for i, link in enumerate(links)
+        ])
+        await db.commit()
+    return {"id": invitation_id, "links": links}
+
+@pytest.fixture
+def events(invitation):
+    """Live events published for the invitation, as (event, data) pairs read so far"""
+    from events import hub, invitation_topic
+
+    subscriber = hub.subscribe([invitation_topic(invitation["id"])])
+    received = []
+
+    def read() -> list:
+        while not subscriber.queue.empty():
+            event, data = subscriber.queue.get_nowait().splitlines()[:2]
+            received.append((event.removeprefix("event: "), json.loads(data.removeprefix("data: "))))
+        return received
+
+    yield read
+    hub.unsubscribe(subscriber)
+
+async def stored(link: str):
+    from database import SessionLocal
+    from models import Response
+
+    async with SessionLocal() as db:
+        return (await db.execute(
+            select(Response.answer, Response.responded_at).where(Response.response_link == link)
+        )).one()
+
+async def messages(link: str) -> int:
+    from database import SessionLocal
+    from models import Message, Response
+
+    async with SessionLocal() as db:
+        return await db.scalar(
+            select(func.count()).select_from(Message).join(Response, Response.id == Message.response_id)
+            .where(Response.response_link == link)
+        )
+
+async def counters_consistent(invitation_id: int) -> bool:
+    from database import SessionLocal
+    from models import Invitation, Message, Response
+
+    async with SessionLocal() as db:
+        counters = (await db.execute(
+            select(Invitation.total_yes, Invitation.total_no, Invitation.total_pending, Invitation.total_messages)
+            .where(Invitation.id == invitation_id)
+        )).one()
+        answers = dict((await db.execute(
+            select(Response.answer, func.count()).where(Response.invitation_id == invitation_id)
+            .group_by(Response.answer)
+        )).all())
+        total_messages = await db.scalar(
+            select(func.count()).select_from(Message).where(Message.invitation_id == invitation_id)
+        )
+    return tuple(counters) == (answers.get("yes", 0), answers.get("no", 0), answers.get(None, 0), total_messages)
+
+async def test_change_of_answer_with_stale_link_cache(client, invitation, events):
+    from crud import apply_response, get_response_link_entry
+    from database import SessionLocal
+    from schemas import ResponseUpdate
+
+    # yes -> no on another worker -> yes here, with this worker's link cache still saying yes
+    link = invitation["links"][0]
+    assert (await client.post(f"/respond/{link}", json={"answer": "yes"})).status_code == 200
+    async with SessionLocal() as db:
+        entry = await get_response_link_entry(db, link)  # Caches answer "yes"
+    async with SessionLocal() as db:
+        await apply_response(db, entry, ResponseUpdate(answer="no"), datetime.utcnow())
+        await db.commit()
+    assert (await stored(link)).answer == "no"
+
+    assert (await client.post(f"/respond/{link}", json={"answer": "yes"})).status_code == 200
+    assert (await stored(link)).answer == "yes", "change of answer acknowledged but not written"
+    assert await counters_consistent(invitation["id"])
+    assert [(event, data["previous_answer"]) for event, data in events()] == [("response", None), ("response", "no")]
+
+async def test_repeated_answer_writes_and_publishes_nothing(client, invitation, events):
+    link = invitation["links"][0]
+    assert (await client.post(f"/respond/{link}", json={"answer": "yes"})).status_code == 200
+    before = await stored(link)
+    statuses = await asyncio.gather(*(client.post(f"/respond/{link}", json={"answer": "yes"}) for _ in range(3)))
+    assert [response.status_code for response in statuses] == [200] * 3
+    assert await stored(link) == before, "repeated answer was written again"
+    assert [event for event, _ in events()] == ["response"], "repeated answer notified dashboards"
+
+async def test_double_tap_with_message_stores_one_message(client, invitation, events):
+    link = invitation["links"][1]
+    body = {"answer": "yes", "message": "See you there"}
+    statuses = await asyncio.gather(client.post(f"/respond/{link}", json=body), client.post(f"/respond/{link}", json=body))
+    assert [response.status_code for response in statuses] == [200, 200]
+    assert await messages(link) == 1
+    assert await counters_consistent(invitation["id"])
+    assert sorted(event for event, _ in events()) == ["message", "response"]
+
+async def test_double_tap_whose_first_write_fails(client, invitation):
+    from database import engine
+
+    link = invitation["links"][2]
+    body = {"answer": "no", "message": "boom"}
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TRIGGER fail_message BEFORE INSERT ON messages WHEN NEW.content = 'boom' "
+            "BEGIN SELECT RAISE(ABORT, 'simulated failure'); END"
+        ))
+    try:
+        statuses = await asyncio.gather(client.post(f"/respond/{link}", json=body), client.post(f"/respond/{link}", json=body))
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text("DROP TRIGGER fail_message"))
+    assert 200 not in [response.status_code for response in statuses], "failed write acknowledged"
+    assert (await stored(link)).answer is None, "answer of a failed write was stored"
+
+    assert (await client.post(f"/respond/{link}", json=body)).status_code == 200
+    assert await messages(link) == 1, "retry after a failed write did not store its message"
+    assert await counters_consistent(invitation["id"])
@@ -0,0 +1,105 @@
+# File: backend/tests/test_startup.py
+# Path: /inviter-app/backend/tests/test_startup.py
+# Description: Cold-start budget for the backend
+#
+# Each run is a fresh interpreter (python -m tests.test_startup) that imports main, runs
+# the startup hooks against a new SQLite database and serves a first GET /health. The
+# best run must fit the budget, and no lazily loaded dependency may be imported on the way.
+# python -m benchmarks.import_report shows where the import time goes.
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from functools import lru_cache
+
+# Imported on first use only; none of them may be loaded by importing and starting the app
+LAZY_MODULES = ("twilio", "phonenumbers", "httpx")
+
+# Import plus startup plus first response, in milliseconds. Raise it only with a reason.
+BUDGET_MS = 2000
+
+RUNS = 3
+
+async def first_response(app, path: str) -> int:
+    """Call the ASGI app directly, so no HTTP client library is loaded; returns the status code"""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"test")], "client": ("127.0.0.1", 0),
+        "server": ("test", 80),
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return next(message["status"] for message in sent if message["type"] == "http.response.start")
+
+def measure() -> dict:
+    """One cold start, in this process; must run in a fresh interpreter"""
+    import asyncio
+
+    start = time.perf_counter()
+    from main import app
+    imported = time.perf_counter()
+
+    async def serve():
+        await app.router.startup()
+        started = time.perf_counter()
+        status = await first_response(app, "/health")
+        served = time.perf_counter()
+        loaded = [name for name in LAZY_MODULES if name in sys.modules]
+        await app.router.shutdown()
+        return started, served, status, loaded
+
+    started, served, status, loaded = asyncio.run(serve())
+    return {
+        "import_ms": (imported - start) * 1000,
+        "startup_ms": (started - imported) * 1000,
+        "total_ms": (served - start) * 1000,
+        "status": status,
+        "lazy_loaded": loaded,
+    }
+
+@lru_cache(maxsize=None)
+def cold_starts() -> tuple:
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for i in range(RUNS):
+            # A new database file per run, so every run creates its tables like a first deploy
+            env = {
+                **os.environ, "DATABASE_URL": f"sqlite:///{os.path.join(tmpdir, f'startup{i}.db')}",
+                "SMS_TRANSPORT": "fake", "REMINDER_INTERVAL_SECONDS": "0",
+            }
+            output = subprocess.run(
+                [sys.executable, "-m", "tests.test_startup"],
+                cwd=backend, env=env, capture_output=True, text=True, check=True
+            ).stdout
+            runs.append(json.loads(output.strip().splitlines()[-1]))
+    return tuple(runs)
+
+def test_cold_start_within_budget():
+    runs = cold_starts()
+    best = min(runs, key=lambda run: run["total_ms"])
+    assert best["total_ms"] <= BUDGET_MS, (
+        f"cold start took {best['total_ms']:.0f} ms (import {best['import_ms']:.0f} ms, "
+        f"startup {best['startup_ms']:.0f} ms), budget is {BUDGET_MS} ms"
+    )
+
+def test_first_request_succeeds():
+    assert [run["status"] for run in cold_starts()] == [200] * RUNS
+
+def test_startup_leaves_lazy_dependencies_unloaded():
+    loaded = sorted({name for run in cold_starts() for name in run["lazy_loaded"]})
+    assert not loaded, f"imported at startup: {', '.join(loaded)}"
+
+if __name__ == "__main__":
+    print(json.dumps(measure()))
@@ -2,45 +2,71 @@
 # Path: /inviter-app/backend/utils.py
 # Description: Utility functions for link generation, SMS sending, etc.
 
+import re
 import secrets
-import hashlib
-from typing import Optional
-import os
-from twilio.rest import Client
-from dotenv import load_dotenv
+from typing import List, Optional
 
-load_dotenv()
+from config import settings
+from phones import normalize_phone
 
-# Twilio configuration (for SMS sending)
-TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
-TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
-TWILIO_PHONE_NUMBER = os.getenv("TWILIO_PHONE_NUMBER")
-BASE_URL = os.getenv("BASE_URL", "https://invite.yourapp.com")
+# Twilio SDK client for send_sms, created on first use; importing twilio.rest
+# costs more than the rest of this module and bulk sending goes through sms.py
+_twilio_client = None
 
-# Initialize Twilio client if credentials available
-twilio_client = None
-if TWILIO_ACCOUNT_SID and TWILIO_AUTH_TOKEN:
-    twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+def get_twilio_client():
+    """Return the Twilio client, or None without credentials"""
+    global _twilio_client
+    if _twilio_client is None and settings.twilio_configured:
+        from twilio.rest import Client
+        _twilio_client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
+    return _twilio_client
 
-def generate_secure_link(invitation_id: int, recipient_phone: str) -> str:
+# Response link tokens: 128 random bits written as 22 base62 characters
+LINK_TOKEN_LENGTH = 22
+LINK_TOKEN_BYTES = 16
+BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+# Tokens issued before the base62 format were 20 hex characters; they still resolve
+LINK_TOKEN_PATTERN = re.compile(r"[0-9A-Za-z]{20,22}")
+
+# Two base62 digits per step halves the divmod loop
+_BASE62_PAIRS = [high + low for high in BASE62_ALPHABET for low in BASE62_ALPHABET]
+
+def _base62(number: int) -> str:
+    pairs = []
+    for _ in range(LINK_TOKEN_LENGTH // 2):
+        number, remainder = divmod(number, 3844)
+        pairs.append(_BASE62_PAIRS[remainder])
+    return "".join(reversed(pairs))
+
+def generate_link_tokens(count: int) -> List[str]:
     """
-    Generate a secure, unique link for each recipient
-    Uses cryptographic randomness for security
+    Generate unguessable response link tokens, one per recipient
+    Randomness for the whole batch is read in one call; each token is a fixed
+    22 characters (62**22 > 2**128), matching the Response.response_link column
     """
-    # Create unique identifier
-    unique_data = f"{invitation_id}-{recipient_phone}-{secrets.token_hex(16)}"
-    
-    # Generate hash for URL (shorter than full token)
-    link_hash = hashlib.sha256(unique_data.encode()).hexdigest()[:20]
-    
-    # Return full URL
-    return f"{BASE_URL}/respond/{link_hash}"
+    raw = secrets.token_bytes(LINK_TOKEN_BYTES * count)
+    return [
+        _base62(int.from_bytes(raw[offset:offset + LINK_TOKEN_BYTES], "big"))
+        for offset in range(0, len(raw), LINK_TOKEN_BYTES)
+    ]
+
+def is_link_token(value: str) -> bool:
+    """Cheap format check so malformed links never reach the cache or database"""
+    return LINK_TOKEN_PATTERN.fullmatch(value) is not None
+
+def build_response_link(token: str) -> str:
+    """
+    Build the full response URL for a link token
+    Only done when rendering an SMS; the database stores the bare token
+    """
+    return f"{settings.base_url}/respond/{token}"
 
 def send_sms(phone_number: str, message: str) -> bool:
     """
     Send SMS using Twilio
     Returns True if successful, False otherwise
     """
+    twilio_client = get_twilio_client()
     if not twilio_client:
         print(f"SMS to {phone_number}: {message}")  # Development mode
         return True
@@ -48,7 +74,7 @@ def send_sms(phone_number: str, message: str) -> bool:
     try:
         message = twilio_client.messages.create(
             body=message,
-            from_=TWILIO_PHONE_NUMBER,
+            from_=settings.twilio_phone_number,
             to=phone_number
         )
         return True
@@ -59,20 +85,10 @@ def send_sms(phone_number: str, message: str) -> bool:
 def format_phone_number(phone: str) -> str:
     """
     Format phone number to E.164 format
-    Assumes US numbers if no country code provided
+    Assumes DEFAULT_PHONE_REGION (US) numbers if no country code provided
+    Raises ValueError for invalid numbers
     """
-    # Remove all non-numeric characters
-    digits = ''.join(filter(str.isdigit, phone))
-    
-    # Add US country code if not present
-    if len(digits) == 10:
-        digits = '1' + digits
-    
-    # Add + prefix
-    if not digits.startswith('+'):
-        digits = '+' + digits
-    
-    return digits
+    return normalize_phone(phone)
 
 def generate_invitation_summary(invitation_data: dict) -> str:
     """
@@ -86,3 +102,19 @@ def generate_invitation_summary(invitation_data: dict) -> str:
         return f"{title} - {date_str}"
     
     return title
+
+def format_invitation_sms(recipient_name: str, sender_name: Optional[str], invitation_data: dict, link: str) -> str:
+    """
+    Render the SMS body sent to a single recipient
+    """
+    summary = generate_invitation_summary(invitation_data)
+    intro = f"{sender_name} invited you" if sender_name else "You're invited"
+    return f"Hi {recipient_name}! {intro}: {summary}.\nRespond here: {link}"
+
+def format_reminder_sms(recipient_name: str, sender_name: Optional[str], invitation_data: dict, link: str) -> str:
+    """
+    Render the reminder SMS for a recipient who has not answered yet
+    """
+    summary = generate_invitation_summary(invitation_data)
+    source = f" from {sender_name}" if sender_name else ""
+    return f"Hi {recipient_name}, a reminder about your invitation{source}: {summary}.\nPlease respond: {link}"
@@ -0,0 +1,162 @@
+# File: backend/views.py
+# Path: /inviter-app/backend/views.py
+# Description: Write-behind buffer that stamps Response.viewed_at in periodic bulk UPDATEs
+
+import asyncio
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import case, update
+
+from config import env_float, env_int
+from database import SessionLocal
+from metrics import registry
+from models import Invitation, Response
+
+logger = logging.getLogger(__name__)
+
+VIEW_FLUSH_SECONDS = env_float("VIEW_FLUSH_SECONDS", 5)
+VIEW_BUFFER_SIZE = env_int("VIEW_BUFFER_SIZE", 10000)  # Distinct unflushed views held at most
+VIEW_FLUSH_CHUNK = 500  # Responses per UPDATE; three bound parameters each
+
+flush_size = registry.histogram(
+    "view_flush_size", "Views written per flush", buckets=(1, 10, 100, 1000, 10000)
+)
+flush_lag = registry.histogram(
+    "view_flush_lag_seconds", "Age of the oldest view in each flush", buckets=(0.1, 0.5, 1, 2.5, 5, 10, 30, 60)
+)
+
+@dataclass
+class ViewStats:
+    recorded: int = 0
+    duplicates: int = 0
+    dropped: int = 0
+    flushed: int = 0
+    stamped: int = 0  # Flushed views that set viewed_at; the rest were already viewed
+    flushes: int = 0
+    failures: int = 0
+
+class ViewBuffer:
+    """
+    Collects first views of response links in memory and writes them in bulk
+    Opening a response page only touches a dict; a background task flushes every
+    flush_seconds, or sooner once the buffer is full, with one executemany UPDATE
+    that never overwrites an existing viewed_at. Views arriving while the buffer is
+    full are dropped and counted. Buffered views are flushed on shutdown. Only
+    invitations with a newly stamped response get their updated_at bumped, so
+    re-opened links leave the details ETag alone.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        flush_seconds: float = VIEW_FLUSH_SECONDS,
+        max_size: int = VIEW_BUFFER_SIZE
+    ):
+        self.session_factory = session_factory
+        self.flush_seconds = flush_seconds
+        self.max_size = max_size
+        self.stats = ViewStats()
+        # Response ID -> (invitation ID, viewed at, monotonic time recorded)
+        self._pending: Dict[int, Tuple[int, datetime, float]] = {}
+        self._wake = asyncio.Event()  # Set when the buffer fills up or on stop
+        self._stopping = False
+        self._task: Optional[asyncio.Task] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def record(self, response_id: int, invitation_id: int) -> bool:
+        """Note a view; only the first one per response is kept. False if it was dropped"""
+        if response_id in self._pending:
+            self.stats.duplicates += 1
+            return True
+        if len(self._pending) >= self.max_size:
+            self.stats.dropped += 1
+            return False
+        self._pending[response_id] = (invitation_id, datetime.utcnow(), time.monotonic())
+        self.stats.recorded += 1
+        if len(self._pending) >= self.max_size:
+            self._wake.set()
+        return True
+
+    async def flush(self) -> int:
+        """Write everything buffered; on failure the views are kept for the next attempt"""
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        oldest = min(queued for _, _, queued in batch.values())
+
+        table = Response.__table__
+        items = list(batch.items())
+        try:
+            async with self.session_factory() as db:
+                try:
+                    stamped = []  # Invitation ID of every response that got its first viewed_at
+                    for start in range(0, len(items), VIEW_FLUSH_CHUNK):
+                        chunk = items[start:start + VIEW_FLUSH_CHUNK]
+                        stamped.extend((await db.execute(
+                            update(table)
+                            .where(table.c.id.in_([response_id for response_id, _ in chunk]), table.c.viewed_at.is_(None))
+                            .values(viewed_at=case(
+                                {response_id: viewed for response_id, (_, viewed, _) in chunk}, value=table.c.id
+                            ))
+                            .returning(table.c.invitation_id)
+                        )).scalars())
+                    # View counts are part of the invitation details, so bump their ETag version
+                    if stamped:
+                        await db.execute(
+                            update(Invitation).where(Invitation.id.in_(set(stamped))).values(updated_at=datetime.utcnow())
+                        )
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
+        except Exception:
+            self.stats.failures += 1
+            logger.exception("Flushing %d view(s) failed; keeping them for the next flush", len(batch))
+            for response_id, item in batch.items():
+                if len(self._pending) < self.max_size:
+                    self._pending.setdefault(response_id, item)
+            return 0
+
+        self.stats.flushes += 1
+        self.stats.flushed += len(batch)
+        self.stats.stamped += len(stamped)
+        flush_size.observe(len(batch))
+        flush_lag.observe(time.monotonic() - oldest)
+        return len(batch)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    def start(self) -> None:
+        if self._task is None:
+            self._stopping = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Let an in-progress flush finish, then write whatever is still buffered"""
+        if self._task is not None:
+            self._stopping = True
+            self._wake.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    def status(self) -> dict:
+        return {"running": self._task is not None, "buffered": len(self), **asdict(self.stats)}
+
+view_buffer = ViewBuffer()
+registry.collect("view_buffer_size", "Views waiting to be flushed", lambda: len(view_buffer))
+registry.collect("view_dropped_total", "Views dropped because the buffer was full",
+                 lambda: view_buffer.stats.dropped, "counter")
@@ -0,0 +1,166 @@
+# File: backend/writer.py
+# Path: /inviter-app/backend/writer.py
+# Description: Single-writer task that coalesces RSVP submissions into micro-batched transactions
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import List, Optional
+
+from cache import invalidate_response_link
+from config import env_bool, env_float, env_int
+from crud import AnswerChange, apply_response, apply_responses
+from database import IS_SQLITE, SQLITE_PRODUCTION, SessionLocal
+from schemas import ResponseUpdate
+
+logger = logging.getLogger(__name__)
+
+WRITER_BATCH_SIZE = env_int("WRITER_BATCH_SIZE", 256)  # Responses per commit at most
+WRITER_QUEUE_SIZE = env_int("WRITER_QUEUE_SIZE", 10000)
+WRITER_LINGER_MS = env_float("WRITER_LINGER_MS", 0)  # Extra wait for a batch to fill
+
+# SQLite allows one writer at a time, so funnelling writes through one task replaces
+# lock contention with queueing and one fsync per batch. On by default in SQLite
+# production mode only; elsewhere it is opt-in, since it has only been measured there.
+WRITE_QUEUE_ENABLED = env_bool("RSVP_BATCHING", IS_SQLITE and SQLITE_PRODUCTION)
+
+class WriterOverloaded(Exception):
+    """Raised when the write queue is full"""
+
+@dataclass
+class WriterStats:
+    submitted: int = 0
+    committed: int = 0
+    failed: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+
+class _Write:
+    __slots__ = ("link", "entry", "data", "future")
+
+    def __init__(self, link: str, entry: dict, data: ResponseUpdate, future: asyncio.Future):
+        self.link = link
+        self.entry = entry
+        self.data = data
+        self.future = future
+
+_STOP = None  # Queue sentinel telling the writer to finish
+
+class ResponseWriter:
+    """
+    Group-commit queue for RSVP writes
+    Request handlers enqueue a response and wait for it to be durable. One
+    background task takes everything queued (up to batch_size), applies it with
+    a handful of set-based statements and commits once. If a batch fails it is
+    retried one response per transaction, so a bad write fails only its own
+    request.
+    """
+
+    def __init__(
+        self,
+        session_factory=SessionLocal,
+        batch_size: int = WRITER_BATCH_SIZE,
+        queue_size: int = WRITER_QUEUE_SIZE,
+        linger_ms: float = WRITER_LINGER_MS
+    ):
+        self.session_factory = session_factory
+        self.batch_size = batch_size
+        self.linger = linger_ms / 1000
+        self.stats = WriterStats()
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def submit(self, link: str, entry: dict, data: ResponseUpdate) -> AnswerChange:
+        """Queue a response and wait until it has been committed; returns what it changed"""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait(_Write(link, entry, data, future))
+        except asyncio.QueueFull:
+            raise WriterOverloaded()
+        self.stats.submitted += 1
+        return await future
+
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            if self.linger:
+                await asyncio.sleep(self.linger)
+
+            batch = [item]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            await self._write(batch)
+
+    async def _apply(self, batch: List[_Write]) -> List[AnswerChange]:
+        now = datetime.utcnow()
+        async with self.session_factory() as db:
+            try:
+                if len(batch) == 1:
+                    changes = [await apply_response(db, batch[0].entry, batch[0].data, now)]
+                else:
+                    changes = await apply_responses(db, [(write.entry, write.data) for write in batch], now)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+        return changes
+
+    async def _write(self, batch: List[_Write]) -> None:
+        self.stats.batches += 1
+        self.stats.largest_batch = max(self.stats.largest_batch, len(batch))
+        # An AnswerChange per committed write, the exception per failed one
+        try:
+            outcomes = await self._apply(batch)
+        except Exception as e:
+            if len(batch) == 1:
+                outcomes = [e]
+            else:
+                logger.warning("Group commit of %d responses failed, retrying individually", len(batch))
+                outcomes = []
+                for write in batch:
+                    try:
+                        outcomes.extend(await self._apply([write]))
+                    except Exception as error:
+                        outcomes.append(error)
+
+        for write, outcome in zip(batch, outcomes):
+            invalidate_response_link(write.link)
+            failed = isinstance(outcome, Exception)
+            if failed:
+                self.stats.failed += 1
+            else:
+                self.stats.committed += 1
+            if write.future.done():  # The client went away
+                continue
+            if failed:
+                write.future.set_exception(outcome)
+            else:
+                write.future.set_result(outcome)
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Commit everything already queued, then stop"""
+        if self._task is not None:
+            await self._queue.put(_STOP)
+            await self._task
+            self._task = None
+
+    def status(self) -> dict:
+        return {"running": self.running, "queued": self._queue.qsize(), **asdict(self.stats)}
+
+response_writer = ResponseWriter()
@@ -22,9 +22,52 @@ function Dashboard() {
     fetchDashboardData();
   }, []);
 
-  const fetchDashboardData = async () => {
+  // Live updates: refetch (debounced) when a response or message arrives.
+  // The stream URL carries a short-lived stream token rather than the access token,
+  // so a new one is fetched for every (re)connect.
+  useEffect(() => {
+    if (!localStorage.getItem('token') || typeof EventSource === 'undefined') return undefined;
+
+    let timer = null;
+    let retry = null;
+    let source = null;
+    let closed = false;
+    const refresh = () => {
+      clearTimeout(timer);
+      timer = setTimeout(() => fetchDashboardData(false), 1000);
+    };
+    const connect = async () => {
+      try {
+        const { data } = await api.post('/events/token');
+        if (closed) return;
+        source = new EventSource(
+          `${api.defaults.baseURL}/events/stream?stream_token=${encodeURIComponent(data.stream_token)}`
+        );
+        source.addEventListener('response', refresh);
+        source.addEventListener('message', refresh);
+        source.addEventListener('invitation', refresh);
+        // The browser would retry with the same, soon expired, token; reconnect with a fresh one instead
+        source.onerror = () => {
+          source.close();
+          retry = setTimeout(connect, 5000);
+        };
+      } catch (error) {
+        if (!closed) retry = setTimeout(connect, 5000);
+      }
+    };
+    connect();
+
+    return () => {
+      closed = true;
+      clearTimeout(timer);
+      clearTimeout(retry);
+      if (source) source.close();
+    };
+  }, []);
+
+  const fetchDashboardData = async (showSpinner = true) => {
     try {
-      setLoading(true);
+      if (showSpinner) setLoading(true);
       // Fetch both analytics and invitations in parallel
       const [analyticsRes, invitationsRes] = await Promise.all([
         api.get('/analytics/dashboard'),